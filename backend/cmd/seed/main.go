@@ -638,7 +638,8 @@ func (s *Seeder) seedVolume(ctx context.Context, count int) error {
 	// condition-breakdown analytics has real cardinality.
 	if _, err := s.pool.Exec(ctx, `
 		UPDATE warehouse.inventory
-		SET condition = (ARRAY['NEW','EXCELLENT','GOOD','FAIR','POOR','DAMAGED','FOR_REPAIR']::warehouse.item_condition_enum[])[1 + floor(random()*7)::int]
+		SET condition = (ARRAY['NEW','EXCELLENT','GOOD','FAIR','POOR','DAMAGED','FOR_REPAIR']::warehouse.item_condition_enum[])[1 + floor(random()*7)::int],
+		    updated_at = now()
 		WHERE workspace_id = $1 AND condition IS NULL`, s.workspaceID); err != nil {
 		return fmt.Errorf("set conditions: %w", err)
 	}
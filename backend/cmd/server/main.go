@@ -38,7 +38,7 @@ func main() {
 	defer pool.Close()
 
 	// Create router
-	router := api.NewRouter(pool, cfg)
+	router, drain := api.NewRouter(pool, cfg)
 
 	// Create server. The listen address comes from config (SERVER_HOST /
 	// SERVER_PORT); the bare PORT env var is kept as an override for
@@ -98,6 +98,9 @@ func main() {
 	if err := srv.Shutdown(ctx); err != nil {
 		log.Fatalf("server forced to shutdown: %v", err)
 	}
+	if err := drain(ctx); err != nil {
+		log.Printf("background work did not finish before shutdown: %v", err)
+	}
 
 	fmt.Println("Server stopped")
 }
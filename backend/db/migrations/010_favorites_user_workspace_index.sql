@@ -0,0 +1,16 @@
+-- migrate:up transaction:false
+
+-- The favorites list (ListFavoritesByUser) filters on (user_id, workspace_id)
+-- and orders by created_at DESC. With only the single-column user_id and
+-- workspace_id indexes the planner picks one, filters the other and sorts.
+-- A composite index serves the whole query in index order; it also covers
+-- user_id-only lookups, so ix_favorites_user is dropped in the next migration.
+-- Built CONCURRENTLY (hence transaction:false) so favorites stay writable.
+-- CONCURRENTLY cannot run inside a transaction block, and dbmate sends a
+-- section as one multi-statement query, so this file holds nothing else.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_favorites_user_workspace_created
+    ON warehouse.favorites (user_id, workspace_id, created_at DESC);
+
+-- migrate:down transaction:false
+
+DROP INDEX CONCURRENTLY IF EXISTS warehouse.ix_favorites_user_workspace_created;
@@ -0,0 +1,9 @@
+-- migrate:up transaction:false
+
+-- ix_favorites_user is a prefix of ix_favorites_user_workspace_created.
+-- Kept in its own migration: CONCURRENTLY must be the only statement.
+DROP INDEX CONCURRENTLY IF EXISTS warehouse.ix_favorites_user;
+
+-- migrate:down transaction:false
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_favorites_user ON warehouse.favorites (user_id);
@@ -0,0 +1,10 @@
+-- migrate:up transaction:false
+
+-- Partial replacement for favorites_unique_container; see 015. Built CONCURRENTLY
+-- (hence transaction:false), which must be the only statement in the section.
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_favorites_user_container
+    ON warehouse.favorites (user_id, container_id) WHERE container_id IS NOT NULL;
+
+-- migrate:down transaction:false
+
+DROP INDEX CONCURRENTLY IF EXISTS warehouse.uq_favorites_user_container;
@@ -0,0 +1,20 @@
+-- migrate:up
+
+-- Each favorite sets exactly one of item_id/location_id/container_id, so the
+-- three full UNIQUE (user_id, <target>) constraints each indexed every row,
+-- two thirds of them with a NULL target. Migrations 012-014 built partial
+-- unique indexes that only hold the rows using that column, shrinking all
+-- three and cutting index writes on every insert/delete. ON CONFLICT DO
+-- NOTHING in CreateFavorite and ToggleFavorite infers any of them, so no
+-- query changes are needed and the old constraints can go.
+ALTER TABLE warehouse.favorites
+    DROP CONSTRAINT IF EXISTS favorites_unique_item,
+    DROP CONSTRAINT IF EXISTS favorites_unique_location,
+    DROP CONSTRAINT IF EXISTS favorites_unique_container;
+
+-- migrate:down
+
+ALTER TABLE ONLY warehouse.favorites
+    ADD CONSTRAINT favorites_unique_item UNIQUE (user_id, item_id),
+    ADD CONSTRAINT favorites_unique_location UNIQUE (user_id, location_id),
+    ADD CONSTRAINT favorites_unique_container UNIQUE (user_id, container_id);
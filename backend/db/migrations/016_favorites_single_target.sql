@@ -0,0 +1,16 @@
+-- migrate:up
+
+-- favorites_has_target ties favorite_type to a non-NULL target column but
+-- does not stop a row from also setting one of the other two. The favorite
+-- queries (IsFavorite, ToggleFavorite, ListFavoritedTargets) match on the
+-- individual target columns and COALESCE them back into one id, which is
+-- only sound if exactly one is set. Added NOT VALID here and validated in
+-- 017, so this migration's exclusive lock is released before the scan of
+-- existing rows, which only needs SHARE UPDATE EXCLUSIVE.
+ALTER TABLE warehouse.favorites
+    ADD CONSTRAINT favorites_single_target
+    CHECK (num_nonnulls(item_id, location_id, container_id) = 1) NOT VALID;
+
+-- migrate:down
+
+ALTER TABLE warehouse.favorites DROP CONSTRAINT IF EXISTS favorites_single_target;
@@ -0,0 +1,9 @@
+-- migrate:up
+
+-- Scans existing favorites under SHARE UPDATE EXCLUSIVE, so reads and writes
+-- continue while favorites_single_target (016) is validated.
+ALTER TABLE warehouse.favorites VALIDATE CONSTRAINT favorites_single_target;
+
+-- migrate:down
+
+-- Nothing to undo: 016's down migration drops the constraint.
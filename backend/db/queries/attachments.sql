@@ -29,5 +29,5 @@ DELETE FROM warehouse.attachments WHERE id = $1 AND workspace_id = $2;
 
 -- name: SetPrimaryAttachment :exec
 UPDATE warehouse.attachments
-SET is_primary = (id = $2)
-WHERE item_id = $1 AND workspace_id = $3;
+SET is_primary = (id = $2), updated_at = now()
+WHERE item_id = $1 AND workspace_id = $3 AND is_primary IS DISTINCT FROM (id = $2);
@@ -46,3 +46,10 @@ SELECT EXISTS(
 
 -- name: DeleteCategory :exec
 DELETE FROM warehouse.categories WHERE id = $1 AND workspace_id = $2;
+
+-- name: ListCategoryRefs :many
+-- ListCategoryRefs returns just the columns the import worker resolves
+-- category references by, for all active categories of a workspace.
+SELECT id, name FROM warehouse.categories
+WHERE workspace_id = $1 AND is_archived = false
+ORDER BY name;
@@ -48,3 +48,10 @@ LIMIT $3;
 
 -- name: DeleteContainer :exec
 DELETE FROM warehouse.containers WHERE id = $1 AND workspace_id = $2;
+
+-- name: ListContainerRefs :many
+-- ListContainerRefs returns just the columns the import worker resolves
+-- container references by, for all active containers of a workspace.
+SELECT id, name, short_code FROM warehouse.containers
+WHERE workspace_id = $1 AND is_archived = false
+ORDER BY name;
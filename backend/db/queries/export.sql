@@ -1,5 +1,11 @@
 -- Export Queries
 -- These queries support bulk export operations for all entity types
+--
+-- Every exported table has a btree index leading with workspace_id (either a
+-- dedicated ix_<table>_workspace index or the uq_<table>_ws_id constraint), so
+-- the workspace filter below is always an index range scan. pgx streams rows
+-- off the wire as they are scanned; the slices are only materialized because
+-- the workspace backup needs all entities before it can write the file.
 
 -- name: ListAllItems :many
 SELECT * FROM warehouse.items
@@ -43,6 +49,50 @@ WHERE workspace_id = $1
   AND (sqlc.arg(include_archived)::boolean OR is_archived = false)
 ORDER BY name;
 
+-- The *ForExport queries resolve foreign keys to display names in SQL so the
+-- per-entity export does not need to build lookup maps in application code.
+
+-- name: ListItemsForExport :many
+SELECT i.id, i.workspace_id, i.sku, i.name, i.description, i.category_id,
+       i.brand, i.model, i.manufacturer, i.barcode, i.short_code,
+       i.min_stock_level, i.is_archived, i.created_at, i.updated_at,
+       c.name AS category_name
+FROM warehouse.items i
+LEFT JOIN warehouse.categories c ON c.id = i.category_id
+WHERE i.workspace_id = $1
+  AND (sqlc.arg(include_archived)::boolean OR i.is_archived = false)
+ORDER BY i.name;
+
+-- name: ListLocationsForExport :many
+SELECT l.id, l.workspace_id, l.name, l.parent_location, l.description,
+       l.short_code, l.is_archived, l.created_at, l.updated_at,
+       p.name AS parent_location_name
+FROM warehouse.locations l
+LEFT JOIN warehouse.locations p ON p.id = l.parent_location
+WHERE l.workspace_id = $1
+  AND (sqlc.arg(include_archived)::boolean OR l.is_archived = false)
+ORDER BY l.name;
+
+-- name: ListCategoriesForExport :many
+SELECT c.id, c.workspace_id, c.name, c.parent_category_id, c.description,
+       c.is_archived, c.created_at, c.updated_at,
+       p.name AS parent_category_name
+FROM warehouse.categories c
+LEFT JOIN warehouse.categories p ON p.id = c.parent_category_id
+WHERE c.workspace_id = $1
+  AND (sqlc.arg(include_archived)::boolean OR c.is_archived = false)
+ORDER BY c.name;
+
+-- name: ListContainersForExport :many
+SELECT c.id, c.workspace_id, c.name, c.location_id, c.description, c.capacity,
+       c.short_code, c.is_archived, c.created_at, c.updated_at,
+       l.name AS location_name
+FROM warehouse.containers c
+JOIN warehouse.locations l ON l.id = c.location_id
+WHERE c.workspace_id = $1
+  AND (sqlc.arg(include_archived)::boolean OR c.is_archived = false)
+ORDER BY c.name;
+
 -- name: GetCategoryByName :one
 SELECT * FROM warehouse.categories
 WHERE workspace_id = $1 AND name = $2 AND is_archived = false
@@ -53,6 +103,37 @@ SELECT * FROM warehouse.locations
 WHERE workspace_id = $1 AND name = $2 AND is_archived = false
 LIMIT 1;
 
+-- name: GetWorkspaceExportVersion :one
+-- Cheap fingerprint of everything a workspace backup contains. Inserts and
+-- deletes change the row count; every UPDATE on these tables must also set
+-- updated_at = now() or the change is invisible here. Deletes never advance
+-- last_updated, so it is only usable as part of the ETag, not as Last-Modified.
+SELECT
+    (
+        (SELECT count(*) FROM warehouse.categories WHERE workspace_id = $1) +
+        (SELECT count(*) FROM warehouse.labels WHERE workspace_id = $1) +
+        (SELECT count(*) FROM warehouse.companies WHERE workspace_id = $1) +
+        (SELECT count(*) FROM warehouse.locations WHERE workspace_id = $1) +
+        (SELECT count(*) FROM warehouse.borrowers WHERE workspace_id = $1) +
+        (SELECT count(*) FROM warehouse.items WHERE workspace_id = $1) +
+        (SELECT count(*) FROM warehouse.containers WHERE workspace_id = $1) +
+        (SELECT count(*) FROM warehouse.inventory WHERE workspace_id = $1) +
+        (SELECT count(*) FROM warehouse.loans WHERE workspace_id = $1) +
+        (SELECT count(*) FROM warehouse.attachments WHERE workspace_id = $1)
+    )::bigint AS record_count,
+    GREATEST(
+        (SELECT max(updated_at) FROM warehouse.categories WHERE workspace_id = $1),
+        (SELECT max(updated_at) FROM warehouse.labels WHERE workspace_id = $1),
+        (SELECT max(updated_at) FROM warehouse.companies WHERE workspace_id = $1),
+        (SELECT max(updated_at) FROM warehouse.locations WHERE workspace_id = $1),
+        (SELECT max(updated_at) FROM warehouse.borrowers WHERE workspace_id = $1),
+        (SELECT max(updated_at) FROM warehouse.items WHERE workspace_id = $1),
+        (SELECT max(updated_at) FROM warehouse.containers WHERE workspace_id = $1),
+        (SELECT max(updated_at) FROM warehouse.inventory WHERE workspace_id = $1),
+        (SELECT max(updated_at) FROM warehouse.loans WHERE workspace_id = $1),
+        (SELECT max(updated_at) FROM warehouse.attachments WHERE workspace_id = $1)
+    )::timestamptz AS last_updated;
+
 -- name: ListAllInventory :many
 SELECT * FROM warehouse.inventory
 WHERE workspace_id = $1
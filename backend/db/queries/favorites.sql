@@ -1,6 +1,20 @@
 -- name: CreateFavorite :one
 INSERT INTO warehouse.favorites (id, user_id, workspace_id, favorite_type, item_id, location_id, container_id)
 VALUES ($1, $2, $3, $4, $5, $6, $7)
+ON CONFLICT DO NOTHING
+RETURNING *;
+
+-- name: CreateFavorites :many
+-- Inserts a batch of favorites for one user in a single statement. Each row's
+-- target_id lands in the column matching its favorite_type; targets the user
+-- has already favorited are skipped and not returned.
+INSERT INTO warehouse.favorites (id, user_id, workspace_id, favorite_type, item_id, location_id, container_id)
+SELECT t.id, @user_id::uuid, @workspace_id::uuid, t.favorite_type::warehouse.favorite_type_enum,
+       CASE WHEN t.favorite_type = 'ITEM' THEN t.target_id END,
+       CASE WHEN t.favorite_type = 'LOCATION' THEN t.target_id END,
+       CASE WHEN t.favorite_type = 'CONTAINER' THEN t.target_id END
+FROM unnest(@ids::uuid[], @favorite_types::text[], @target_ids::uuid[]) AS t(id, favorite_type, target_id)
+ON CONFLICT DO NOTHING
 RETURNING *;
 
 -- name: DeleteFavorite :exec
@@ -8,15 +22,29 @@ DELETE FROM warehouse.favorites WHERE id = $1 AND user_id = $2;
 
 -- name: DeleteFavoriteByTarget :exec
 DELETE FROM warehouse.favorites
-WHERE user_id = $1 AND workspace_id = $2 AND favorite_type = $3
-  AND ((favorite_type = 'ITEM' AND item_id = $4)
-    OR (favorite_type = 'LOCATION' AND location_id = $4)
-    OR (favorite_type = 'CONTAINER' AND container_id = $4));
+WHERE user_id = $1 AND workspace_id = $2
+  AND (item_id = $3 OR location_id = $4 OR container_id = $5);
+
+-- name: ListFavoritedTargets :many
+-- Returns which of the given targets the user has favorited. Only the array
+-- for the requested type is non-empty, so each branch probes that type's
+-- partial unique index on (user_id, <target>).
+SELECT COALESCE(item_id, location_id, container_id)::uuid AS target_id
+FROM warehouse.favorites
+WHERE user_id = @user_id AND workspace_id = @workspace_id
+  AND (item_id = ANY(@item_ids::uuid[])
+    OR location_id = ANY(@location_ids::uuid[])
+    OR container_id = ANY(@container_ids::uuid[]));
 
 -- name: ListFavoritesByUser :many
+-- Keyset-paginated, newest first. Pass the last row's (created_at, id) as
+-- after_created_at/after_id to fetch the next page; NULL starts from the top.
 SELECT * FROM warehouse.favorites
-WHERE user_id = $1 AND workspace_id = $2
-ORDER BY created_at DESC;
+WHERE user_id = @user_id AND workspace_id = @workspace_id
+  AND (sqlc.narg('after_created_at')::timestamptz IS NULL
+       OR (created_at, id) < (sqlc.narg('after_created_at')::timestamptz, sqlc.narg('after_id')::uuid))
+ORDER BY created_at DESC, id DESC
+LIMIT sqlc.arg('limit');
 
 -- name: GetFavoriteItems :many
 SELECT f.id as favorite_id, f.created_at as favorited_at, i.*
@@ -28,8 +56,25 @@ ORDER BY f.created_at DESC;
 -- name: IsFavorite :one
 SELECT EXISTS(
     SELECT 1 FROM warehouse.favorites
-    WHERE user_id = $1 AND workspace_id = $2 AND favorite_type = $3
-      AND ((favorite_type = 'ITEM' AND item_id = $4)
-        OR (favorite_type = 'LOCATION' AND location_id = $4)
-        OR (favorite_type = 'CONTAINER' AND container_id = $4))
+    WHERE user_id = $1 AND workspace_id = $2
+      AND (item_id = $3 OR location_id = $4 OR container_id = $5)
 );
+
+-- name: ToggleFavorite :one
+-- Removes the favorite if it exists, otherwise creates it, in one round trip.
+-- Returns true when the target ended up favorited.
+WITH del AS (
+    DELETE FROM warehouse.favorites
+    WHERE user_id = sqlc.arg('user_id') AND workspace_id = sqlc.arg('workspace_id')
+      AND (item_id = sqlc.narg('item_id') OR location_id = sqlc.narg('location_id') OR container_id = sqlc.narg('container_id'))
+    RETURNING id
+), ins AS (
+    INSERT INTO warehouse.favorites (id, user_id, workspace_id, favorite_type, item_id, location_id, container_id)
+    SELECT sqlc.arg('id')::uuid, sqlc.arg('user_id'), sqlc.arg('workspace_id'),
+           sqlc.arg('favorite_type')::warehouse.favorite_type_enum,
+           sqlc.narg('item_id'), sqlc.narg('location_id'), sqlc.narg('container_id')
+    WHERE NOT EXISTS (SELECT 1 FROM del)
+    ON CONFLICT DO NOTHING
+    RETURNING id
+)
+SELECT EXISTS(SELECT 1 FROM ins) AS favorited;
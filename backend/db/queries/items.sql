@@ -145,3 +145,10 @@ WHERE workspace_id = $1
 
 -- name: DeleteItem :exec
 DELETE FROM warehouse.items WHERE id = $1 AND workspace_id = $2;
+
+-- name: ListItemRefs :many
+-- ListItemRefs returns just the columns the import worker resolves item
+-- references by, for all active items of a workspace.
+SELECT id, sku, name, short_code FROM warehouse.items
+WHERE workspace_id = $1 AND is_archived = false
+ORDER BY name;
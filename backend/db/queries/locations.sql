@@ -53,3 +53,10 @@ LIMIT $3;
 
 -- name: DeleteLocation :exec
 DELETE FROM warehouse.locations WHERE id = $1 AND workspace_id = $2;
+
+-- name: ListLocationRefs :many
+-- ListLocationRefs returns just the columns the import worker resolves location
+-- references by, for all active locations of a workspace.
+SELECT id, name, short_code FROM warehouse.locations
+WHERE workspace_id = $1 AND is_archived = false
+ORDER BY name;
@@ -990,7 +990,8 @@ CREATE TABLE warehouse.favorites (
     location_id uuid,
     container_id uuid,
     created_at timestamp with time zone DEFAULT now(),
-    CONSTRAINT favorites_has_target CHECK ((((favorite_type = 'ITEM'::warehouse.favorite_type_enum) AND (item_id IS NOT NULL)) OR ((favorite_type = 'LOCATION'::warehouse.favorite_type_enum) AND (location_id IS NOT NULL)) OR ((favorite_type = 'CONTAINER'::warehouse.favorite_type_enum) AND (container_id IS NOT NULL))))
+    CONSTRAINT favorites_has_target CHECK ((((favorite_type = 'ITEM'::warehouse.favorite_type_enum) AND (item_id IS NOT NULL)) OR ((favorite_type = 'LOCATION'::warehouse.favorite_type_enum) AND (location_id IS NOT NULL)) OR ((favorite_type = 'CONTAINER'::warehouse.favorite_type_enum) AND (container_id IS NOT NULL)))),
+    CONSTRAINT favorites_single_target CHECK ((num_nonnulls(item_id, location_id, container_id) = 1))
 );
 
 
@@ -1996,30 +1997,6 @@ ALTER TABLE ONLY warehouse.favorites
     ADD CONSTRAINT favorites_pkey PRIMARY KEY (id);
 
 
---
--- Name: favorites favorites_unique_container; Type: CONSTRAINT; Schema: warehouse; Owner: -
---
-
-ALTER TABLE ONLY warehouse.favorites
-    ADD CONSTRAINT favorites_unique_container UNIQUE (user_id, container_id);
-
-
---
--- Name: favorites favorites_unique_item; Type: CONSTRAINT; Schema: warehouse; Owner: -
---
-
-ALTER TABLE ONLY warehouse.favorites
-    ADD CONSTRAINT favorites_unique_item UNIQUE (user_id, item_id);
-
-
---
--- Name: favorites favorites_unique_location; Type: CONSTRAINT; Schema: warehouse; Owner: -
---
-
-ALTER TABLE ONLY warehouse.favorites
-    ADD CONSTRAINT favorites_unique_location UNIQUE (user_id, location_id);
-
-
 --
 -- Name: files files_pkey; Type: CONSTRAINT; Schema: warehouse; Owner: -
 --
@@ -2708,10 +2685,10 @@ CREATE INDEX ix_deleted_records_workspace_since ON warehouse.deleted_records USI
 
 
 --
--- Name: ix_favorites_user; Type: INDEX; Schema: warehouse; Owner: -
+-- Name: ix_favorites_user_workspace_created; Type: INDEX; Schema: warehouse; Owner: -
 --
 
-CREATE INDEX ix_favorites_user ON warehouse.favorites USING btree (user_id);
+CREATE INDEX ix_favorites_user_workspace_created ON warehouse.favorites USING btree (user_id, workspace_id, created_at DESC);
 
 
 --
@@ -2987,6 +2964,27 @@ CREATE INDEX ix_repair_logs_workspace ON warehouse.repair_logs USING btree (work
 CREATE INDEX ix_wishlist_items_ws_status_priority ON warehouse.wishlist_items USING btree (workspace_id, status, priority);
 
 
+--
+-- Name: uq_favorites_user_container; Type: INDEX; Schema: warehouse; Owner: -
+--
+
+CREATE UNIQUE INDEX uq_favorites_user_container ON warehouse.favorites USING btree (user_id, container_id) WHERE (container_id IS NOT NULL);
+
+
+--
+-- Name: uq_favorites_user_item; Type: INDEX; Schema: warehouse; Owner: -
+--
+
+CREATE UNIQUE INDEX uq_favorites_user_item ON warehouse.favorites USING btree (user_id, item_id) WHERE (item_id IS NOT NULL);
+
+
+--
+-- Name: uq_favorites_user_location; Type: INDEX; Schema: warehouse; Owner: -
+--
+
+CREATE UNIQUE INDEX uq_favorites_user_location ON warehouse.favorites USING btree (user_id, location_id) WHERE (location_id IS NOT NULL);
+
+
 --
 -- Name: uq_items_ws_barcode; Type: INDEX; Schema: warehouse; Owner: -
 --
@@ -3726,4 +3724,12 @@ INSERT INTO public.schema_migrations (version) VALUES
     ('006'),
     ('007'),
     ('008'),
-    ('009');
+    ('009'),
+    ('010'),
+    ('011'),
+    ('012'),
+    ('013'),
+    ('014'),
+    ('015'),
+    ('016'),
+    ('017');
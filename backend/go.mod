@@ -23,6 +23,7 @@ require (
 	golang.org/x/crypto v0.50.0
 	golang.org/x/image v0.43.0
 	golang.org/x/oauth2 v0.35.0
+	golang.org/x/text v0.38.0
 )
 
 require (
@@ -50,7 +51,6 @@ require (
 	golang.org/x/net v0.53.0 // indirect
 	golang.org/x/sync v0.21.0 // indirect
 	golang.org/x/sys v0.43.0 // indirect
-	golang.org/x/text v0.38.0 // indirect
 	golang.org/x/time v0.8.0 // indirect
 	google.golang.org/protobuf v1.36.6 // indirect
 	gopkg.in/yaml.v3 v3.0.1 // indirect
@@ -117,8 +117,10 @@ func (f memberUserFinder) FindUserIDByEmail(ctx context.Context, email string) (
 	return u.ID(), nil
 }
 
-// NewRouter creates and configures the main router.
-func NewRouter(pool *pgxpool.Pool, cfg *config.Config) chi.Router {
+// NewRouter creates and configures the main router. The returned drain
+// function waits for background work started by handlers (workspace backup
+// audit writes) and is meant to be called once the HTTP server has shut down.
+func NewRouter(pool *pgxpool.Pool, cfg *config.Config) (chi.Router, func(context.Context) error) {
 	r := chi.NewRouter()
 
 	// Create structured logger
@@ -622,7 +624,7 @@ func NewRouter(pool *pgxpool.Pool, cfg *config.Config) chi.Router {
 		})
 	})
 
-	return r
+	return r, workspaceBackupSvc.WaitForAudits
 }
 
 // getUploadDir returns the configured temporary upload directory for processing files
@@ -0,0 +1,62 @@
+package barcode
+
+import (
+	"errors"
+	"sync"
+	"time"
+)
+
+const (
+	// breakerThreshold is the number of consecutive provider failures that
+	// opens the breaker.
+	breakerThreshold = 5
+	// breakerCooldown is how long an open breaker skips the provider.
+	breakerCooldown = 60 * time.Second
+)
+
+// errProviderUnavailable is returned instead of calling a provider whose
+// breaker is open.
+var errProviderUnavailable = errors.New("barcode provider temporarily unavailable")
+
+// breaker is a consecutive-failure circuit breaker for one provider. After
+// breakerThreshold failures in a row the provider is skipped for
+// breakerCooldown, so an outage costs nothing instead of a timeout per scan.
+// A nil breaker always allows calls.
+type breaker struct {
+	mu        sync.Mutex
+	failures  int
+	openUntil time.Time
+	now       func() time.Time
+}
+
+func newBreaker() *breaker {
+	return &breaker{now: time.Now}
+}
+
+func (b *breaker) allow() bool {
+	if b == nil {
+		return true
+	}
+	b.mu.Lock()
+	defer b.mu.Unlock()
+	return !b.now().Before(b.openUntil)
+}
+
+func (b *breaker) record(ok bool) {
+	if b == nil {
+		return
+	}
+	b.mu.Lock()
+	defer b.mu.Unlock()
+
+	if ok {
+		b.failures = 0
+		b.openUntil = time.Time{}
+		return
+	}
+	b.failures++
+	if b.failures >= breakerThreshold {
+		b.failures = 0
+		b.openUntil = b.now().Add(breakerCooldown)
+	}
+}
@@ -0,0 +1,42 @@
+package barcode
+
+import (
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func TestBreaker_OpensAfterThresholdAndRecovers(t *testing.T) {
+	b := newBreaker()
+	now := time.Now()
+	b.now = func() time.Time { return now }
+
+	for i := 0; i < breakerThreshold-1; i++ {
+		b.record(false)
+		assert.True(t, b.allow())
+	}
+	b.record(false)
+	assert.False(t, b.allow())
+
+	now = now.Add(breakerCooldown)
+	assert.True(t, b.allow())
+}
+
+func TestBreaker_SuccessResetsFailures(t *testing.T) {
+	b := newBreaker()
+
+	for i := 0; i < breakerThreshold-1; i++ {
+		b.record(false)
+	}
+	b.record(true)
+	b.record(false)
+
+	assert.True(t, b.allow())
+}
+
+func TestBreaker_NilAllows(t *testing.T) {
+	var b *breaker
+	b.record(false)
+	assert.True(t, b.allow())
+}
@@ -0,0 +1,97 @@
+package barcode
+
+import (
+	"container/list"
+	"sync"
+	"time"
+)
+
+const (
+	// foundTTL is how long a found product is served from cache. Product data
+	// behind a barcode rarely changes, and re-scans of the same product are
+	// the common case.
+	foundTTL = 24 * time.Hour
+	// notFoundTTL is kept short so a provider outage is not memoized as a
+	// missing product for long.
+	notFoundTTL = 10 * time.Minute
+	// lookupCacheMaxEntries caps memory; the least recently used entry is
+	// evicted first.
+	lookupCacheMaxEntries = 4096
+)
+
+type lookupEntry struct {
+	barcode   string
+	product   Product
+	expiresAt time.Time
+}
+
+// lookupCache is an in-process LRU cache of Lookup results keyed on the
+// barcode, so repeated scans skip the external providers.
+type lookupCache struct {
+	mu         sync.Mutex
+	order      *list.List // front is most recently used
+	entries    map[string]*list.Element
+	maxEntries int
+	now        func() time.Time
+}
+
+func newLookupCache(maxEntries int) *lookupCache {
+	return &lookupCache{
+		order:      list.New(),
+		entries:    make(map[string]*list.Element),
+		maxEntries: maxEntries,
+		now:        time.Now,
+	}
+}
+
+// get returns a copy of the cached product, so callers cannot mutate the
+// shared entry.
+func (c *lookupCache) get(barcode string) (*Product, bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	elem, exists := c.entries[barcode]
+	if !exists {
+		return nil, false
+	}
+	entry := elem.Value.(*lookupEntry)
+	if c.now().After(entry.expiresAt) {
+		c.order.Remove(elem)
+		delete(c.entries, barcode)
+		return nil, false
+	}
+	c.order.MoveToFront(elem)
+	product := entry.product
+	return &product, true
+}
+
+func (c *lookupCache) set(barcode string, product *Product) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	ttl := notFoundTTL
+	if product.Found {
+		ttl = foundTTL
+	}
+	entry := &lookupEntry{barcode: barcode, product: *product, expiresAt: c.now().Add(ttl)}
+
+	if elem, exists := c.entries[barcode]; exists {
+		elem.Value = entry
+		c.order.MoveToFront(elem)
+		return
+	}
+	c.entries[barcode] = c.order.PushFront(entry)
+	for c.order.Len() > c.maxEntries {
+		oldest := c.order.Back()
+		c.order.Remove(oldest)
+		delete(c.entries, oldest.Value.(*lookupEntry).barcode)
+	}
+}
+
+func (c *lookupCache) clear() {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	c.order.Init()
+	c.entries = make(map[string]*list.Element)
+}
@@ -0,0 +1,67 @@
+package barcode
+
+import (
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestLookupCache_FoundAndNotFoundTTLs(t *testing.T) {
+	cache := newLookupCache(10)
+	now := time.Now()
+	cache.now = func() time.Time { return now }
+
+	cache.set("found", &Product{Barcode: "found", Name: "Milk", Found: true})
+	cache.set("missing", &Product{Barcode: "missing", Found: false})
+
+	now = now.Add(notFoundTTL + time.Second)
+	_, ok := cache.get("missing")
+	assert.False(t, ok)
+
+	product, ok := cache.get("found")
+	require.True(t, ok)
+	assert.Equal(t, "Milk", product.Name)
+
+	now = now.Add(foundTTL)
+	_, ok = cache.get("found")
+	assert.False(t, ok)
+}
+
+func TestLookupCache_EvictsLeastRecentlyUsed(t *testing.T) {
+	cache := newLookupCache(2)
+
+	cache.set("a", &Product{Barcode: "a", Found: true})
+	cache.set("b", &Product{Barcode: "b", Found: true})
+	_, _ = cache.get("a")
+	cache.set("c", &Product{Barcode: "c", Found: true})
+
+	_, ok := cache.get("b")
+	assert.False(t, ok)
+	_, ok = cache.get("a")
+	assert.True(t, ok)
+	_, ok = cache.get("c")
+	assert.True(t, ok)
+}
+
+func TestLookupCache_GetReturnsCopy(t *testing.T) {
+	cache := newLookupCache(10)
+	cache.set("a", &Product{Barcode: "a", Name: "Milk", Found: true})
+
+	product, _ := cache.get("a")
+	product.Name = "changed"
+
+	product, _ = cache.get("a")
+	assert.Equal(t, "Milk", product.Name)
+}
+
+func TestLookupCache_Clear(t *testing.T) {
+	cache := newLookupCache(10)
+	cache.set("a", &Product{Barcode: "a", Found: true})
+
+	cache.clear()
+
+	_, ok := cache.get("a")
+	assert.False(t, ok)
+}
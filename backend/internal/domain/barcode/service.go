@@ -4,10 +4,34 @@ import (
 	"context"
 	"encoding/json"
 	"fmt"
+	"io"
+	"net"
 	"net/http"
+	"strings"
 	"time"
 )
 
+const (
+	userAgent = "HomeWarehouse/1.0 (https://github.com/antti/home-warehouse)"
+
+	// lookupTimeout bounds a single provider request.
+	lookupTimeout = 10 * time.Second
+	// connectTimeout bounds dialing and the TLS handshake, so an unreachable
+	// provider fails fast instead of using up lookupTimeout.
+	connectTimeout = 2 * time.Second
+	// responseHeaderTimeout bounds the wait for a provider to start replying.
+	responseHeaderTimeout = 5 * time.Second
+	// maxIdleConnsPerHost keeps enough warm connections to each provider for
+	// concurrent scans; net/http's default of 2 forces new TLS handshakes.
+	maxIdleConnsPerHost = 20
+	// maxDrainBytes is how much of an unused response body is read so the
+	// connection can go back to the idle pool instead of being closed.
+	maxDrainBytes = 64 << 10
+	// preferredProviderGrace is how long an Open Products Database hit waits
+	// for the preferred Open Food Facts lookup to finish.
+	preferredProviderGrace = 200 * time.Millisecond
+)
+
 // Product represents product information from a barcode lookup.
 type Product struct {
 	Barcode  string  `json:"barcode"`
@@ -28,43 +52,157 @@ type Service struct {
 	httpClient        *http.Client
 	openFoodFactsURL  string
 	openProductsDBURL string
+	cache             *lookupCache
+	openFoodFactsCB   *breaker
+	openProductsDBCB  *breaker
+}
+
+// newHTTPClient returns the client shared by all lookups of a Service. Its
+// transport keeps provider connections alive (HTTP/2 where offered), so
+// repeated scans skip the TCP and TLS handshakes.
+func newHTTPClient() *http.Client {
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.DialContext = (&net.Dialer{Timeout: connectTimeout, KeepAlive: 30 * time.Second}).DialContext
+	transport.TLSHandshakeTimeout = connectTimeout
+	transport.ResponseHeaderTimeout = responseHeaderTimeout
+	transport.MaxIdleConnsPerHost = maxIdleConnsPerHost
+	transport.ForceAttemptHTTP2 = true
+	return &http.Client{Timeout: lookupTimeout, Transport: transport}
 }
 
 // NewService creates a new barcode service.
 func NewService() *Service {
 	return &Service{
-		httpClient:        &http.Client{Timeout: 10 * time.Second},
+		httpClient:        newHTTPClient(),
 		openFoodFactsURL:  "https://world.openfoodfacts.org/api/v0/product",
 		openProductsDBURL: "https://api.openproductsdb.org/v1/product",
+		cache:             newLookupCache(lookupCacheMaxEntries),
+		openFoodFactsCB:   newBreaker(),
+		openProductsDBCB:  newBreaker(),
 	}
 }
 
 // NewServiceWithURLs creates a barcode service with custom API URLs (for testing).
 func NewServiceWithURLs(openFoodFactsURL, openProductsDBURL string) *Service {
 	return &Service{
-		httpClient:        &http.Client{Timeout: 10 * time.Second},
+		httpClient:        newHTTPClient(),
 		openFoodFactsURL:  openFoodFactsURL,
 		openProductsDBURL: openProductsDBURL,
+		cache:             newLookupCache(lookupCacheMaxEntries),
+		openFoodFactsCB:   newBreaker(),
+		openProductsDBCB:  newBreaker(),
 	}
 }
 
-// Lookup looks up a barcode in external databases.
-// It tries Open Food Facts first, then falls back to Open Products Database.
+// Lookup looks up a barcode, serving repeated scans from an in-process
+// cache. Found products are cached for a day, misses only briefly.
 func (s *Service) Lookup(ctx context.Context, barcode string) (*Product, error) {
-	// Try Open Food Facts first (for food items)
-	if product, err := s.lookupOpenFoodFacts(ctx, barcode); err == nil && product.Found {
+	barcode = strings.TrimSpace(barcode)
+	if s.cache == nil {
+		return s.lookup(ctx, barcode)
+	}
+	if product, ok := s.cache.get(barcode); ok {
 		return product, nil
 	}
 
-	// Try Open Products Database as fallback (for non-food items)
-	if product, err := s.lookupOpenProductsDB(ctx, barcode); err == nil && product.Found {
-		return product, nil
+	product, err := s.lookup(ctx, barcode)
+	if err != nil {
+		return nil, err
+	}
+	// A cancelled request reports not found without asking the providers.
+	if ctx.Err() == nil {
+		s.cache.set(barcode, product)
+	}
+	return product, nil
+}
+
+// ClearCache drops all cached lookup results.
+func (s *Service) ClearCache() {
+	if s.cache != nil {
+		s.cache.clear()
+	}
+}
+
+// lookup queries the external databases.
+// Open Food Facts and Open Products Database are queried concurrently, so a
+// barcode missing from one costs max(latencies) rather than their sum. Open
+// Food Facts is still preferred: an Open Products Database hit is held for
+// up to preferredProviderGrace in case Open Food Facts also answers.
+func (s *Service) lookup(ctx context.Context, barcode string) (*Product, error) {
+	ctx, cancel := context.WithCancel(ctx)
+	defer cancel() // stops whichever lookup is still in flight
+
+	foodCh := make(chan *Product, 1)
+	productsCh := make(chan *Product, 1)
+	go func() {
+		foodCh <- foundOrNil(guarded(ctx, s.openFoodFactsCB, barcode, s.lookupOpenFoodFacts))
+	}()
+	go func() {
+		productsCh <- foundOrNil(guarded(ctx, s.openProductsDBCB, barcode, s.lookupOpenProductsDB))
+	}()
+
+	var fallback *Product
+	var grace <-chan time.Time
+	for pending := 2; pending > 0; {
+		select {
+		case product := <-foodCh:
+			pending--
+			foodCh = nil
+			if product != nil {
+				return product, nil
+			}
+			if fallback != nil {
+				return fallback, nil
+			}
+		case product := <-productsCh:
+			pending--
+			productsCh = nil
+			if product != nil {
+				if foodCh == nil {
+					return product, nil
+				}
+				fallback = product
+				timer := time.NewTimer(preferredProviderGrace)
+				defer timer.Stop()
+				grace = timer.C
+			}
+		case <-grace:
+			return fallback, nil
+		}
 	}
 
 	// Return not found
 	return &Product{Barcode: barcode, Found: false}, nil
 }
 
+// guarded runs a provider lookup through its circuit breaker. Lookups
+// cancelled by the caller (including the losing side of the provider race)
+// are not counted either way.
+func guarded(ctx context.Context, cb *breaker, barcode string, lookup func(context.Context, string) (*Product, error)) (*Product, error) {
+	if !cb.allow() {
+		return nil, errProviderUnavailable
+	}
+	product, err := lookup(ctx, barcode)
+	if ctx.Err() == nil {
+		cb.record(err == nil)
+	}
+	return product, err
+}
+
+// foundOrNil collapses a provider result to the product when it was found,
+// or nil for misses and errors (which fall through to the other provider).
+func foundOrNil(product *Product, err error) *Product {
+	if err != nil || product == nil || !product.Found {
+		return nil
+	}
+	return product
+}
+
+// openFoodFactsFields limits the Open Food Facts response to the product
+// fields decoded below; full product documents run to ~100KB of nutrition
+// and ingredient data that is never read.
+const openFoodFactsFields = "product_name,brands,categories,image_url"
+
 // openFoodFactsResponse represents the response from Open Food Facts API.
 type openFoodFactsResponse struct {
 	Status  int `json:"status"`
@@ -78,20 +216,23 @@ type openFoodFactsResponse struct {
 
 // lookupOpenFoodFacts looks up a barcode in Open Food Facts database.
 func (s *Service) lookupOpenFoodFacts(ctx context.Context, barcode string) (*Product, error) {
-	url := fmt.Sprintf("%s/%s.json", s.openFoodFactsURL, barcode)
+	url := fmt.Sprintf("%s/%s.json?fields=%s", s.openFoodFactsURL, barcode, openFoodFactsFields)
 
 	req, err := http.NewRequestWithContext(ctx, "GET", url, nil)
 	if err != nil {
 		return nil, err
 	}
-	req.Header.Set("User-Agent", "HomeWarehouse/1.0 (https://github.com/antti/home-warehouse)")
+	req.Header.Set("User-Agent", userAgent)
 
 	resp, err := s.httpClient.Do(req)
 	if err != nil {
 		return nil, err
 	}
-	defer resp.Body.Close()
+	defer drainAndClose(resp.Body)
 
+	if resp.StatusCode >= http.StatusInternalServerError {
+		return nil, fmt.Errorf("open food facts: unexpected status %d", resp.StatusCode)
+	}
 	if resp.StatusCode != http.StatusOK {
 		return &Product{Barcode: barcode, Found: false}, nil
 	}
@@ -137,14 +278,17 @@ func (s *Service) lookupOpenProductsDB(ctx context.Context, barcode string) (*Pr
 	if err != nil {
 		return nil, err
 	}
-	req.Header.Set("User-Agent", "HomeWarehouse/1.0 (https://github.com/antti/home-warehouse)")
+	req.Header.Set("User-Agent", userAgent)
 
 	resp, err := s.httpClient.Do(req)
 	if err != nil {
 		return nil, err
 	}
-	defer resp.Body.Close()
+	defer drainAndClose(resp.Body)
 
+	if resp.StatusCode >= http.StatusInternalServerError {
+		return nil, fmt.Errorf("open products database: unexpected status %d", resp.StatusCode)
+	}
 	if resp.StatusCode != http.StatusOK {
 		return &Product{Barcode: barcode, Found: false}, nil
 	}
@@ -168,6 +312,13 @@ func (s *Service) lookupOpenProductsDB(ctx context.Context, barcode string) (*Pr
 	}, nil
 }
 
+// drainAndClose reads a bounded remainder of body before closing it, so the
+// underlying keep-alive connection is reused rather than torn down.
+func drainAndClose(body io.ReadCloser) {
+	_, _ = io.Copy(io.Discard, io.LimitReader(body, maxDrainBytes))
+	_ = body.Close()
+}
+
 // stringPtrIfNotEmpty returns a pointer to the string if it's not empty, nil otherwise.
 func stringPtrIfNotEmpty(s string) *string {
 	if s == "" {
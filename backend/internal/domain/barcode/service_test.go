@@ -3,8 +3,11 @@ package barcode
 import (
 	"context"
 	"encoding/json"
+	"fmt"
+	"net"
 	"net/http"
 	"net/http/httptest"
+	"sync/atomic"
 	"testing"
 	"time"
 
@@ -12,6 +15,44 @@ import (
 	"github.com/stretchr/testify/require"
 )
 
+func openFoodFactsFound(name string) openFoodFactsResponse {
+	resp := openFoodFactsResponse{Status: 1}
+	resp.Product.ProductName = name
+	return resp
+}
+
+func openProductsDBFound(name string) openProductsDBResponse {
+	var resp openProductsDBResponse
+	resp.Status.Code = 200
+	resp.Product.Name = name
+	return resp
+}
+
+// newJSONServer starts a provider stub that answers every request with body
+// encoded as JSON. It is closed when the test ends.
+func newJSONServer(t *testing.T, body any) *httptest.Server {
+	t.Helper()
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Header().Set("Content-Type", "application/json")
+		json.NewEncoder(w).Encode(body)
+	}))
+	t.Cleanup(server.Close)
+	return server
+}
+
+// newRawServer starts a provider stub that answers every request with the
+// given status code and raw body. It is closed when the test ends.
+func newRawServer(t *testing.T, status int, body string) *httptest.Server {
+	t.Helper()
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Header().Set("Content-Type", "application/json")
+		w.WriteHeader(status)
+		w.Write([]byte(body))
+	}))
+	t.Cleanup(server.Close)
+	return server
+}
+
 func TestStringPtrIfNotEmpty(t *testing.T) {
 	tests := []struct {
 		name      string
@@ -47,6 +88,42 @@ func TestNewService(t *testing.T) {
 	svc := NewService()
 	assert.NotNil(t, svc)
 	assert.NotNil(t, svc.httpClient)
+
+	transport, ok := svc.httpClient.Transport.(*http.Transport)
+	require.True(t, ok)
+	assert.Equal(t, maxIdleConnsPerHost, transport.MaxIdleConnsPerHost)
+	assert.True(t, transport.ForceAttemptHTTP2)
+	assert.Equal(t, connectTimeout, transport.TLSHandshakeTimeout)
+	assert.Equal(t, responseHeaderTimeout, transport.ResponseHeaderTimeout)
+	assert.Equal(t, lookupTimeout, svc.httpClient.Timeout)
+}
+
+func TestLookup_ReusesConnections(t *testing.T) {
+	var newConns atomic.Int32
+	server := httptest.NewUnstartedServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		// Non-OK with a body: the client must drain it to keep the connection.
+		w.WriteHeader(http.StatusNotFound)
+		_, _ = w.Write([]byte(`{"status":0}`))
+	}))
+	server.Config.ConnState = func(_ net.Conn, state http.ConnState) {
+		if state == http.StateNew {
+			newConns.Add(1)
+		}
+	}
+	server.Start()
+	defer server.Close()
+
+	svc := NewServiceWithURLs(server.URL, server.URL)
+	for i := 0; i < 5; i++ {
+		// Distinct barcodes so every iteration misses the lookup cache.
+		product, err := svc.Lookup(context.Background(), fmt.Sprintf("12345678901%02d", i))
+		require.NoError(t, err)
+		assert.False(t, product.Found)
+	}
+
+	// Both providers are queried concurrently, so at most one connection
+	// each; later lookups reuse them.
+	assert.LessOrEqual(t, newConns.Load(), int32(2))
 }
 
 func TestProduct_Structure(t *testing.T) {
@@ -199,24 +276,17 @@ func TestNewServiceWithURLs(t *testing.T) {
 }
 
 func TestLookup_OpenFoodFactsSuccess(t *testing.T) {
-	// Create mock server for Open Food Facts
+	food := openFoodFactsFound("Test Food Product")
+	food.Product.Brands = "Test Brand"
+	food.Product.Categories = "Test Category"
+	food.Product.ImageURL = "https://example.com/image.jpg"
+
+	// Mock Open Food Facts, checking the request it receives
 	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
 		assert.Contains(t, r.URL.Path, "/1234567890123.json")
+		assert.Equal(t, openFoodFactsFields, r.URL.Query().Get("fields"))
 		w.Header().Set("Content-Type", "application/json")
-		json.NewEncoder(w).Encode(openFoodFactsResponse{
-			Status: 1,
-			Product: struct {
-				ProductName string `json:"product_name"`
-				Brands      string `json:"brands"`
-				Categories  string `json:"categories"`
-				ImageURL    string `json:"image_url"`
-			}{
-				ProductName: "Test Food Product",
-				Brands:      "Test Brand",
-				Categories:  "Test Category",
-				ImageURL:    "https://example.com/image.jpg",
-			},
-		})
+		json.NewEncoder(w).Encode(food)
 	}))
 	defer server.Close()
 
@@ -233,35 +303,13 @@ func TestLookup_OpenFoodFactsSuccess(t *testing.T) {
 }
 
 func TestLookup_OpenFoodFactsNotFound_FallbackToOpenProductsDB(t *testing.T) {
-	// Mock Open Food Facts returning not found
-	foodServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
-		w.Header().Set("Content-Type", "application/json")
-		json.NewEncoder(w).Encode(openFoodFactsResponse{Status: 0})
-	}))
-	defer foodServer.Close()
-
-	// Mock Open Products DB returning success
-	productsServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
-		w.Header().Set("Content-Type", "application/json")
-		json.NewEncoder(w).Encode(openProductsDBResponse{
-			Status: struct {
-				Code    int    `json:"code"`
-				Message string `json:"message"`
-			}{Code: 200, Message: "OK"},
-			Product: struct {
-				Name     string `json:"name"`
-				Brand    string `json:"brand"`
-				Category string `json:"category"`
-				Image    string `json:"image"`
-			}{
-				Name:     "Electronics Product",
-				Brand:    "Sony",
-				Category: "Electronics",
-				Image:    "https://example.com/sony.jpg",
-			},
-		})
-	}))
-	defer productsServer.Close()
+	// Open Food Facts returns not found, Open Products DB a full product
+	foodServer := newJSONServer(t, openFoodFactsResponse{Status: 0})
+	products := openProductsDBFound("Electronics Product")
+	products.Product.Brand = "Sony"
+	products.Product.Category = "Electronics"
+	products.Product.Image = "https://example.com/sony.jpg"
+	productsServer := newJSONServer(t, products)
 
 	svc := NewServiceWithURLs(foodServer.URL, productsServer.URL)
 	product, err := svc.Lookup(context.Background(), "9876543210123")
@@ -275,22 +323,11 @@ func TestLookup_OpenFoodFactsNotFound_FallbackToOpenProductsDB(t *testing.T) {
 
 func TestLookup_BothAPIsFail_ReturnsNotFound(t *testing.T) {
 	// Both servers return not found
-	foodServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
-		w.Header().Set("Content-Type", "application/json")
-		json.NewEncoder(w).Encode(openFoodFactsResponse{Status: 0})
-	}))
-	defer foodServer.Close()
-
-	productsServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
-		w.Header().Set("Content-Type", "application/json")
-		json.NewEncoder(w).Encode(openProductsDBResponse{
-			Status: struct {
-				Code    int    `json:"code"`
-				Message string `json:"message"`
-			}{Code: 404, Message: "Not Found"},
-		})
-	}))
-	defer productsServer.Close()
+	foodServer := newJSONServer(t, openFoodFactsResponse{Status: 0})
+	notFound := openProductsDBResponse{}
+	notFound.Status.Code = 404
+	notFound.Status.Message = "Not Found"
+	productsServer := newJSONServer(t, notFound)
 
 	svc := NewServiceWithURLs(foodServer.URL, productsServer.URL)
 	product, err := svc.Lookup(context.Background(), "0000000000000")
@@ -302,27 +339,8 @@ func TestLookup_BothAPIsFail_ReturnsNotFound(t *testing.T) {
 
 func TestLookup_OpenFoodFactsNon200Status(t *testing.T) {
 	// Open Food Facts returns 500, should fallback
-	foodServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
-		w.WriteHeader(http.StatusInternalServerError)
-	}))
-	defer foodServer.Close()
-
-	productsServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
-		w.Header().Set("Content-Type", "application/json")
-		json.NewEncoder(w).Encode(openProductsDBResponse{
-			Status: struct {
-				Code    int    `json:"code"`
-				Message string `json:"message"`
-			}{Code: 200, Message: "OK"},
-			Product: struct {
-				Name     string `json:"name"`
-				Brand    string `json:"brand"`
-				Category string `json:"category"`
-				Image    string `json:"image"`
-			}{Name: "Fallback Product"},
-		})
-	}))
-	defer productsServer.Close()
+	foodServer := newRawServer(t, http.StatusInternalServerError, "")
+	productsServer := newJSONServer(t, openProductsDBFound("Fallback Product"))
 
 	svc := NewServiceWithURLs(foodServer.URL, productsServer.URL)
 	product, err := svc.Lookup(context.Background(), "1234567890123")
@@ -334,28 +352,8 @@ func TestLookup_OpenFoodFactsNon200Status(t *testing.T) {
 
 func TestLookup_OpenFoodFactsInvalidJSON(t *testing.T) {
 	// Open Food Facts returns invalid JSON
-	foodServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
-		w.Header().Set("Content-Type", "application/json")
-		w.Write([]byte("not valid json"))
-	}))
-	defer foodServer.Close()
-
-	productsServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
-		w.Header().Set("Content-Type", "application/json")
-		json.NewEncoder(w).Encode(openProductsDBResponse{
-			Status: struct {
-				Code    int    `json:"code"`
-				Message string `json:"message"`
-			}{Code: 200, Message: "OK"},
-			Product: struct {
-				Name     string `json:"name"`
-				Brand    string `json:"brand"`
-				Category string `json:"category"`
-				Image    string `json:"image"`
-			}{Name: "Valid Product"},
-		})
-	}))
-	defer productsServer.Close()
+	foodServer := newRawServer(t, http.StatusOK, "not valid json")
+	productsServer := newJSONServer(t, openProductsDBFound("Valid Product"))
 
 	svc := NewServiceWithURLs(foodServer.URL, productsServer.URL)
 	product, err := svc.Lookup(context.Background(), "1234567890123")
@@ -367,15 +365,8 @@ func TestLookup_OpenFoodFactsInvalidJSON(t *testing.T) {
 
 func TestLookup_OpenProductsDBNon200Status(t *testing.T) {
 	// Both APIs return non-200
-	foodServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
-		w.WriteHeader(http.StatusServiceUnavailable)
-	}))
-	defer foodServer.Close()
-
-	productsServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
-		w.WriteHeader(http.StatusNotFound)
-	}))
-	defer productsServer.Close()
+	foodServer := newRawServer(t, http.StatusServiceUnavailable, "")
+	productsServer := newRawServer(t, http.StatusNotFound, "")
 
 	svc := NewServiceWithURLs(foodServer.URL, productsServer.URL)
 	product, err := svc.Lookup(context.Background(), "1234567890123")
@@ -386,17 +377,8 @@ func TestLookup_OpenProductsDBNon200Status(t *testing.T) {
 
 func TestLookup_OpenProductsDBInvalidJSON(t *testing.T) {
 	// Food fails, Products returns invalid JSON
-	foodServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
-		w.Header().Set("Content-Type", "application/json")
-		json.NewEncoder(w).Encode(openFoodFactsResponse{Status: 0})
-	}))
-	defer foodServer.Close()
-
-	productsServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
-		w.Header().Set("Content-Type", "application/json")
-		w.Write([]byte("{invalid"))
-	}))
-	defer productsServer.Close()
+	foodServer := newJSONServer(t, openFoodFactsResponse{Status: 0})
+	productsServer := newRawServer(t, http.StatusOK, "{invalid")
 
 	svc := NewServiceWithURLs(foodServer.URL, productsServer.URL)
 	product, err := svc.Lookup(context.Background(), "1234567890123")
@@ -407,67 +389,94 @@ func TestLookup_OpenProductsDBInvalidJSON(t *testing.T) {
 
 func TestLookup_OpenFoodFactsEmptyProductName(t *testing.T) {
 	// Open Food Facts returns status 1 but empty product name
-	foodServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+	foodServer := newJSONServer(t, openFoodFactsFound(""))
+	productsServer := newJSONServer(t, openProductsDBFound("Fallback Product"))
+
+	svc := NewServiceWithURLs(foodServer.URL, productsServer.URL)
+	product, err := svc.Lookup(context.Background(), "1234567890123")
+
+	require.NoError(t, err)
+	assert.True(t, product.Found)
+	assert.Equal(t, "Fallback Product", product.Name) // Should fallback
+}
+
+func TestLookup_OpenProductsDBEmptyProductName(t *testing.T) {
+	// Both return empty product names
+	foodServer := newJSONServer(t, openFoodFactsResponse{Status: 0})
+	productsServer := newJSONServer(t, openProductsDBFound(""))
+
+	svc := NewServiceWithURLs(foodServer.URL, productsServer.URL)
+	product, err := svc.Lookup(context.Background(), "1234567890123")
+
+	require.NoError(t, err)
+	assert.False(t, product.Found)
+}
+
+func TestLookup_ProductWithPartialFields(t *testing.T) {
+	// Brand, categories and image are left empty
+	foodServer := newJSONServer(t, openFoodFactsFound("Product Without Extras"))
+
+	svc := NewServiceWithURLs(foodServer.URL, "http://unused.test")
+	product, err := svc.Lookup(context.Background(), "1234567890123")
+
+	require.NoError(t, err)
+	assert.True(t, product.Found)
+	assert.Equal(t, "Product Without Extras", product.Name)
+	assert.Nil(t, product.Brand)    // Should be nil for empty string
+	assert.Nil(t, product.Category) // Should be nil for empty string
+	assert.Nil(t, product.ImageURL) // Should be nil for empty string
+}
+
+func TestLookup_UserAgentHeader(t *testing.T) {
+	var capturedUserAgent string
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		capturedUserAgent = r.Header.Get("User-Agent")
 		w.Header().Set("Content-Type", "application/json")
-		json.NewEncoder(w).Encode(openFoodFactsResponse{
-			Status: 1,
-			Product: struct {
-				ProductName string `json:"product_name"`
-				Brands      string `json:"brands"`
-				Categories  string `json:"categories"`
-				ImageURL    string `json:"image_url"`
-			}{ProductName: ""}, // Empty name
-		})
+		json.NewEncoder(w).Encode(openFoodFactsFound("Test"))
+	}))
+	defer server.Close()
+
+	svc := NewServiceWithURLs(server.URL, "http://unused.test")
+	_, err := svc.Lookup(context.Background(), "1234567890123")
+
+	require.NoError(t, err)
+	assert.Contains(t, capturedUserAgent, "HomeWarehouse")
+}
+
+func TestLookup_QueriesProvidersConcurrently(t *testing.T) {
+	const delay = 300 * time.Millisecond
+	foodServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		time.Sleep(delay)
+		json.NewEncoder(w).Encode(openFoodFactsResponse{Status: 0})
 	}))
 	defer foodServer.Close()
 
 	productsServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
-		w.Header().Set("Content-Type", "application/json")
-		json.NewEncoder(w).Encode(openProductsDBResponse{
-			Status: struct {
-				Code    int    `json:"code"`
-				Message string `json:"message"`
-			}{Code: 200, Message: "OK"},
-			Product: struct {
-				Name     string `json:"name"`
-				Brand    string `json:"brand"`
-				Category string `json:"category"`
-				Image    string `json:"image"`
-			}{Name: "Fallback Product"},
-		})
+		time.Sleep(delay)
+		json.NewEncoder(w).Encode(openProductsDBFound("Slow Product"))
 	}))
 	defer productsServer.Close()
 
 	svc := NewServiceWithURLs(foodServer.URL, productsServer.URL)
+	start := time.Now()
 	product, err := svc.Lookup(context.Background(), "1234567890123")
+	elapsed := time.Since(start)
 
 	require.NoError(t, err)
 	assert.True(t, product.Found)
-	assert.Equal(t, "Fallback Product", product.Name) // Should fallback
+	assert.Equal(t, "Slow Product", product.Name)
+	assert.Less(t, elapsed, 2*delay, "providers should be queried in parallel")
 }
 
-func TestLookup_OpenProductsDBEmptyProductName(t *testing.T) {
-	// Both return empty product names
+func TestLookup_PrefersOpenFoodFactsWithinGrace(t *testing.T) {
 	foodServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
-		w.Header().Set("Content-Type", "application/json")
-		json.NewEncoder(w).Encode(openFoodFactsResponse{Status: 0})
+		time.Sleep(preferredProviderGrace / 4)
+		json.NewEncoder(w).Encode(openFoodFactsFound("Food Product"))
 	}))
 	defer foodServer.Close()
 
 	productsServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
-		w.Header().Set("Content-Type", "application/json")
-		json.NewEncoder(w).Encode(openProductsDBResponse{
-			Status: struct {
-				Code    int    `json:"code"`
-				Message string `json:"message"`
-			}{Code: 200, Message: "OK"},
-			Product: struct {
-				Name     string `json:"name"`
-				Brand    string `json:"brand"`
-				Category string `json:"category"`
-				Image    string `json:"image"`
-			}{Name: ""}, // Empty name
-		})
+		json.NewEncoder(w).Encode(openProductsDBFound("Other Product"))
 	}))
 	defer productsServer.Close()
 
@@ -475,61 +484,112 @@ func TestLookup_OpenProductsDBEmptyProductName(t *testing.T) {
 	product, err := svc.Lookup(context.Background(), "1234567890123")
 
 	require.NoError(t, err)
-	assert.False(t, product.Found)
+	assert.Equal(t, "Food Product", product.Name)
 }
 
-func TestLookup_ProductWithPartialFields(t *testing.T) {
-	// Test product with some optional fields empty
+func TestLookup_FallsBackAfterGraceWhenOpenFoodFactsIsSlow(t *testing.T) {
+	release := make(chan struct{})
 	foodServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
-		w.Header().Set("Content-Type", "application/json")
-		json.NewEncoder(w).Encode(openFoodFactsResponse{
-			Status: 1,
-			Product: struct {
-				ProductName string `json:"product_name"`
-				Brands      string `json:"brands"`
-				Categories  string `json:"categories"`
-				ImageURL    string `json:"image_url"`
-			}{
-				ProductName: "Product Without Extras",
-				Brands:      "", // Empty
-				Categories:  "", // Empty
-				ImageURL:    "", // Empty
-			},
-		})
+		select {
+		case <-release:
+		case <-r.Context().Done():
+		}
 	}))
 	defer foodServer.Close()
+	defer close(release)
 
-	svc := NewServiceWithURLs(foodServer.URL, "http://unused.test")
+	productsServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		json.NewEncoder(w).Encode(openProductsDBFound("Other Product"))
+	}))
+	defer productsServer.Close()
+
+	svc := NewServiceWithURLs(foodServer.URL, productsServer.URL)
+	start := time.Now()
 	product, err := svc.Lookup(context.Background(), "1234567890123")
 
 	require.NoError(t, err)
-	assert.True(t, product.Found)
-	assert.Equal(t, "Product Without Extras", product.Name)
-	assert.Nil(t, product.Brand)    // Should be nil for empty string
-	assert.Nil(t, product.Category) // Should be nil for empty string
-	assert.Nil(t, product.ImageURL) // Should be nil for empty string
+	assert.Equal(t, "Other Product", product.Name)
+	assert.Less(t, time.Since(start), lookupTimeout)
 }
 
-func TestLookup_UserAgentHeader(t *testing.T) {
-	var capturedUserAgent string
+func TestLookup_CachesResults(t *testing.T) {
+	var requests atomic.Int32
 	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
-		capturedUserAgent = r.Header.Get("User-Agent")
-		w.Header().Set("Content-Type", "application/json")
-		json.NewEncoder(w).Encode(openFoodFactsResponse{
-			Status: 1,
-			Product: struct {
-				ProductName string `json:"product_name"`
-				Brands      string `json:"brands"`
-				Categories  string `json:"categories"`
-				ImageURL    string `json:"image_url"`
-			}{ProductName: "Test"},
-		})
+		requests.Add(1)
+		json.NewEncoder(w).Encode(openFoodFactsFound("Cached Product"))
 	}))
 	defer server.Close()
 
 	svc := NewServiceWithURLs(server.URL, "http://unused.test")
+	for i := 0; i < 3; i++ {
+		product, err := svc.Lookup(context.Background(), " 1234567890123 ")
+		require.NoError(t, err)
+		assert.Equal(t, "Cached Product", product.Name)
+		assert.Equal(t, "1234567890123", product.Barcode)
+	}
+	assert.Equal(t, int32(1), requests.Load())
+
+	svc.ClearCache()
 	_, err := svc.Lookup(context.Background(), "1234567890123")
+	require.NoError(t, err)
+	assert.Equal(t, int32(2), requests.Load())
+}
 
+func TestLookup_DoesNotCacheCancelledLookups(t *testing.T) {
+	svc := NewServiceWithURLs("http://unused.test", "http://unused.test")
+	ctx, cancel := context.WithCancel(context.Background())
+	cancel()
+
+	product, err := svc.Lookup(ctx, "1234567890123")
 	require.NoError(t, err)
-	assert.Contains(t, capturedUserAgent, "HomeWarehouse")
+	assert.False(t, product.Found)
+
+	_, ok := svc.cache.get("1234567890123")
+	assert.False(t, ok)
+}
+
+func TestLookup_BreakerSkipsFailingProvider(t *testing.T) {
+	var foodRequests atomic.Int32
+	foodServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		foodRequests.Add(1)
+		w.WriteHeader(http.StatusServiceUnavailable)
+	}))
+	defer foodServer.Close()
+
+	productsServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		json.NewEncoder(w).Encode(openProductsDBFound("Other Product"))
+	}))
+	defer productsServer.Close()
+
+	svc := NewServiceWithURLs(foodServer.URL, productsServer.URL)
+	for i := 0; i < breakerThreshold+3; i++ {
+		product, err := svc.Lookup(context.Background(), fmt.Sprintf("12345678901%02d", i))
+		require.NoError(t, err)
+		assert.Equal(t, "Other Product", product.Name)
+	}
+
+	assert.Equal(t, int32(breakerThreshold), foodRequests.Load())
+}
+
+func TestLookup_BreakerSkipsFailingOpenProductsDB(t *testing.T) {
+	foodServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		json.NewEncoder(w).Encode(openFoodFactsResponse{Status: 0})
+	}))
+	defer foodServer.Close()
+
+	var productsRequests atomic.Int32
+	productsServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		productsRequests.Add(1)
+		w.WriteHeader(http.StatusServiceUnavailable)
+	}))
+	defer productsServer.Close()
+
+	svc := NewServiceWithURLs(foodServer.URL, productsServer.URL)
+	for i := 0; i < breakerThreshold+3; i++ {
+		product, err := svc.Lookup(context.Background(), fmt.Sprintf("12345678901%02d", i))
+		require.NoError(t, err)
+		assert.False(t, product.Found)
+	}
+
+	assert.Equal(t, int32(breakerThreshold), productsRequests.Load())
 }
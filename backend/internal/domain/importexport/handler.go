@@ -5,8 +5,10 @@ import (
 	"encoding/base64"
 	"fmt"
 	"net/http"
+	"time"
 
 	"github.com/danielgtaylor/huma/v2"
+	"github.com/danielgtaylor/huma/v2/conditional"
 
 	appMiddleware "github.com/antti/home-warehouse/go-backend/internal/api/middleware"
 )
@@ -56,6 +58,7 @@ type ExportRequest struct {
 type ExportResponse struct {
 	ContentType        string `header:"Content-Type"`
 	ContentDisposition string `header:"Content-Disposition"`
+	ETag               string `header:"ETag"`
 	Body               []byte
 }
 
@@ -212,6 +215,7 @@ func (h *Handler) Import(ctx context.Context, input *ImportRequest) (*ImportResp
 
 // WorkspaceExportRequest is the input for full workspace export
 type WorkspaceExportRequest struct {
+	conditional.Params
 	Format          string `query:"format" default:"xlsx" doc:"Export format (xlsx, json)"`
 	IncludeArchived bool   `query:"include_archived" default:"false" doc:"Include archived records"`
 }
@@ -239,15 +243,33 @@ func (h *Handler) ExportWorkspaceFull(ctx context.Context, input *WorkspaceExpor
 		return nil, huma.Error400BadRequest(fmt.Sprintf("invalid format: %s. Supported formats: xlsx, json", input.Format))
 	}
 
+	// Re-downloads of an unchanged workspace are answered from a single
+	// fingerprint query instead of rebuilding the whole backup.
+	etag, _, err := h.backupSvc.ExportETag(ctx, workspaceID, format, input.IncludeArchived)
+	if err != nil {
+		return nil, huma.Error500InternalServerError("failed to export workspace", err)
+	}
+	if input.HasConditionalParams() {
+		// Only If-None-Match is honoured: a hard delete lowers the row count
+		// but never advances max(updated_at), so If-Modified-Since would
+		// answer 304 for a backup that still contains the deleted row.
+		if err := input.PreconditionFailed(etag, time.Time{}); err != nil {
+			return nil, err
+		}
+	}
+
 	// Perform export
 	result, err := h.backupSvc.ExportWorkspace(ctx, workspaceID, format, input.IncludeArchived, userID)
 	if err != nil {
 		return nil, huma.Error500InternalServerError("failed to export workspace", err)
 	}
 
+	// Weak validator: the payload is equivalent, not byte-identical, since
+	// generated files embed their creation time.
 	return &ExportResponse{
 		ContentType:        result.ContentType,
 		ContentDisposition: fmt.Sprintf("attachment; filename=%s", result.Filename),
+		ETag:               fmt.Sprintf(`W/"%s"`, etag),
 		Body:               result.Data,
 	}, nil
 }
@@ -8,6 +8,7 @@ import (
 	"errors"
 	"fmt"
 	"io"
+	"strconv"
 	"strings"
 	"time"
 
@@ -15,6 +16,7 @@ import (
 	"github.com/jackc/pgx/v5/pgtype"
 
 	"github.com/antti/home-warehouse/go-backend/internal/infra/queries"
+	"github.com/antti/home-warehouse/go-backend/internal/utils/csvparser"
 )
 
 const msgNameIsRequired = "name is required"
@@ -28,21 +30,21 @@ type ServiceInterface interface {
 // Repository defines the interface for import/export data access
 type Repository interface {
 	// Items
-	ListAllItems(ctx context.Context, workspaceID uuid.UUID, includeArchived bool) ([]queries.WarehouseItem, error)
+	ListAllItems(ctx context.Context, workspaceID uuid.UUID, includeArchived bool) ([]queries.ListItemsForExportRow, error)
 	CreateItem(ctx context.Context, params queries.CreateItemParams) (queries.WarehouseItem, error)
 	GetCategoryByName(ctx context.Context, workspaceID uuid.UUID, name string) (*queries.WarehouseCategory, error)
 
 	// Locations
-	ListAllLocations(ctx context.Context, workspaceID uuid.UUID, includeArchived bool) ([]queries.WarehouseLocation, error)
+	ListAllLocations(ctx context.Context, workspaceID uuid.UUID, includeArchived bool) ([]queries.ListLocationsForExportRow, error)
 	CreateLocation(ctx context.Context, params queries.CreateLocationParams) (queries.WarehouseLocation, error)
 	GetLocationByName(ctx context.Context, workspaceID uuid.UUID, name string) (*queries.WarehouseLocation, error)
 
 	// Categories
-	ListAllCategories(ctx context.Context, workspaceID uuid.UUID, includeArchived bool) ([]queries.WarehouseCategory, error)
+	ListAllCategories(ctx context.Context, workspaceID uuid.UUID, includeArchived bool) ([]queries.ListCategoriesForExportRow, error)
 	CreateCategory(ctx context.Context, params queries.CreateCategoryParams) (queries.WarehouseCategory, error)
 
 	// Containers
-	ListAllContainers(ctx context.Context, workspaceID uuid.UUID, includeArchived bool) ([]queries.WarehouseContainer, error)
+	ListAllContainers(ctx context.Context, workspaceID uuid.UUID, includeArchived bool) ([]queries.ListContainersForExportRow, error)
 	CreateContainer(ctx context.Context, params queries.CreateContainerParams) (queries.WarehouseContainer, error)
 
 	// Labels
@@ -100,7 +102,7 @@ func (s *Service) Export(ctx context.Context, opts ExportOptions) ([]byte, *Expo
 	var content []byte
 	switch opts.Format {
 	case FormatJSON:
-		content, err = json.MarshalIndent(data, "", "  ")
+		content, err = marshalJSON(data)
 	case FormatCSV:
 		content, err = s.toCSV(data, opts.EntityType)
 	default:
@@ -128,27 +130,11 @@ func (s *Service) Import(ctx context.Context, workspaceID uuid.UUID, entityType
 		Errors: make([]ImportError, 0),
 	}
 
-	var rows []map[string]string
-	var err error
-
-	switch format {
-	case FormatJSON:
-		rows, err = s.parseJSON(data)
-	case FormatCSV:
-		rows, err = s.parseCSV(data)
-	default:
-		return nil, fmt.Errorf("unsupported format: %s", format)
-	}
-
-	if err != nil {
-		return nil, fmt.Errorf("failed to parse data: %w", err)
-	}
-
-	result.TotalRows = len(rows)
-
-	for i, row := range rows {
-		rowNum := i + 1 // 1-based row numbers
-		if err := s.importRow(ctx, workspaceID, entityType, row, rowNum); err != nil {
+	lookups := newNameLookups(s.repo, workspaceID)
+	importOne := func(row map[string]string) {
+		result.TotalRows++
+		rowNum := result.TotalRows // 1-based row numbers
+		if err := s.importRow(ctx, lookups, workspaceID, entityType, row, rowNum); err != nil {
 			result.Failed++
 			result.Errors = append(result.Errors, ImportError{
 				Row:     rowNum,
@@ -160,6 +146,49 @@ func (s *Service) Import(ctx context.Context, workspaceID uuid.UUID, entityType
 		}
 	}
 
+	switch format {
+	case FormatJSON:
+		rows, err := s.parseJSON(data)
+		if err != nil {
+			return nil, fmt.Errorf("failed to parse data: %w", err)
+		}
+		for _, row := range rows {
+			importOne(row)
+		}
+	case FormatCSV:
+		// CSV rows are imported as they are read rather than collected first.
+		// A malformed row is reported like a failed row and skipped; the reader
+		// resumes at the next record. Any other read error ends the import
+		// there, since the rows before it are already written.
+		reader, header, err := s.newCSVReader(data)
+		if err != nil {
+			return nil, fmt.Errorf("failed to parse data: %w", err)
+		}
+		for {
+			record, err := reader.Read()
+			if err == io.EOF {
+				break
+			}
+			if err != nil {
+				result.TotalRows++
+				result.Failed++
+				result.Errors = append(result.Errors, ImportError{
+					Row:     result.TotalRows,
+					Message: fmt.Sprintf("failed to read CSV row: %v", err),
+					Code:    "PARSE_ERROR",
+				})
+				var parseErr *csv.ParseError
+				if errors.As(err, &parseErr) {
+					continue
+				}
+				break
+			}
+			importOne(csvparser.RecordToMap(header, record))
+		}
+	default:
+		return nil, fmt.Errorf("unsupported format: %s", format)
+	}
+
 	return result, nil
 }
 
@@ -178,6 +207,7 @@ func (s *Service) exportItems(ctx context.Context, workspaceID uuid.UUID, includ
 			SKU:           item.Sku,
 			Name:          item.Name,
 			Description:   ptrToString(item.Description),
+			CategoryName:  ptrToString(item.CategoryName),
 			Brand:         ptrToString(item.Brand),
 			Model:         ptrToString(item.Model),
 			Manufacturer:  ptrToString(item.Manufacturer),
@@ -201,13 +231,14 @@ func (s *Service) exportLocations(ctx context.Context, workspaceID uuid.UUID, in
 	result := make([]LocationExport, len(locations))
 	for i, loc := range locations {
 		result[i] = LocationExport{
-			ID:          loc.ID.String(),
-			Name:        loc.Name,
-			Description: ptrToString(loc.Description),
-			ShortCode:   loc.ShortCode,
-			IsArchived:  loc.IsArchived,
-			CreatedAt:   pgtimeToString(loc.CreatedAt),
-			UpdatedAt:   pgtimeToString(loc.UpdatedAt),
+			ID:             loc.ID.String(),
+			Name:           loc.Name,
+			ParentLocation: ptrToString(loc.ParentLocationName),
+			Description:    ptrToString(loc.Description),
+			ShortCode:      loc.ShortCode,
+			IsArchived:     loc.IsArchived,
+			CreatedAt:      pgtimeToString(loc.CreatedAt),
+			UpdatedAt:      pgtimeToString(loc.UpdatedAt),
 		}
 	}
 	return result, len(locations), nil
@@ -222,12 +253,13 @@ func (s *Service) exportCategories(ctx context.Context, workspaceID uuid.UUID, i
 	result := make([]CategoryExport, len(categories))
 	for i, cat := range categories {
 		result[i] = CategoryExport{
-			ID:          cat.ID.String(),
-			Name:        cat.Name,
-			Description: ptrToString(cat.Description),
-			IsArchived:  cat.IsArchived,
-			CreatedAt:   pgtimeToString(cat.CreatedAt),
-			UpdatedAt:   pgtimeToString(cat.UpdatedAt),
+			ID:             cat.ID.String(),
+			Name:           cat.Name,
+			ParentCategory: ptrToString(cat.ParentCategoryName),
+			Description:    ptrToString(cat.Description),
+			IsArchived:     cat.IsArchived,
+			CreatedAt:      pgtimeToString(cat.CreatedAt),
+			UpdatedAt:      pgtimeToString(cat.UpdatedAt),
 		}
 	}
 	return result, len(categories), nil
@@ -242,14 +274,15 @@ func (s *Service) exportContainers(ctx context.Context, workspaceID uuid.UUID, i
 	result := make([]ContainerExport, len(containers))
 	for i, c := range containers {
 		result[i] = ContainerExport{
-			ID:          c.ID.String(),
-			Name:        c.Name,
-			Description: ptrToString(c.Description),
-			Capacity:    ptrToString(c.Capacity),
-			ShortCode:   c.ShortCode,
-			IsArchived:  c.IsArchived,
-			CreatedAt:   pgtimeToString(c.CreatedAt),
-			UpdatedAt:   pgtimeToString(c.UpdatedAt),
+			ID:           c.ID.String(),
+			Name:         c.Name,
+			LocationName: c.LocationName,
+			Description:  ptrToString(c.Description),
+			Capacity:     ptrToString(c.Capacity),
+			ShortCode:    c.ShortCode,
+			IsArchived:   c.IsArchived,
+			CreatedAt:    pgtimeToString(c.CreatedAt),
+			UpdatedAt:    pgtimeToString(c.UpdatedAt),
 		}
 	}
 	return result, len(containers), nil
@@ -321,40 +354,19 @@ func (s *Service) exportBorrowers(ctx context.Context, workspaceID uuid.UUID, in
 
 // CSV/JSON parsing methods
 
-func (s *Service) parseCSV(data []byte) ([]map[string]string, error) {
-	reader := csv.NewReader(bytes.NewReader(data))
+// newCSVReader reads and normalizes the header row, returning a reader
+// positioned at the first data row.
+func (s *Service) newCSVReader(data []byte) (*csv.Reader, []string, error) {
+	reader := csvparser.NewReader(bytes.NewReader(data))
 
 	// Read header
 	header, err := reader.Read()
 	if err != nil {
-		return nil, fmt.Errorf("failed to read CSV header: %w", err)
-	}
-
-	// Normalize header names
-	for i, h := range header {
-		header[i] = strings.ToLower(strings.TrimSpace(h))
+		return nil, nil, fmt.Errorf("failed to read CSV header: %w", err)
 	}
 
-	var rows []map[string]string
-	for {
-		record, err := reader.Read()
-		if err == io.EOF {
-			break
-		}
-		if err != nil {
-			return nil, fmt.Errorf("failed to read CSV row: %w", err)
-		}
-
-		row := make(map[string]string)
-		for i, value := range record {
-			if i < len(header) {
-				row[header[i]] = strings.TrimSpace(value)
-			}
-		}
-		rows = append(rows, row)
-	}
-
-	return rows, nil
+	reader.ReuseRecord = true
+	return reader, csvparser.NormalizeHeaders(header), nil
 }
 
 func (s *Service) parseJSON(data []byte) ([]map[string]string, error) {
@@ -429,7 +441,7 @@ func (s *Service) toCSV(data interface{}, entityType EntityType) ([]byte, error)
 				return []string{
 					item.ID, item.SKU, item.Name, item.Description, item.CategoryName,
 					item.Brand, item.Model, item.Manufacturer, item.Barcode, item.ShortCode,
-					fmt.Sprintf("%d", item.MinStockLevel), fmt.Sprintf("%t", item.IsArchived),
+					strconv.FormatInt(int64(item.MinStockLevel), 10), strconv.FormatBool(item.IsArchived),
 					item.CreatedAt, item.UpdatedAt,
 				}
 			})
@@ -441,7 +453,7 @@ func (s *Service) toCSV(data interface{}, entityType EntityType) ([]byte, error)
 			func(loc LocationExport) []string {
 				return []string{
 					loc.ID, loc.Name, loc.ParentLocation,
-					loc.Description, loc.ShortCode, fmt.Sprintf("%t", loc.IsArchived),
+					loc.Description, loc.ShortCode, strconv.FormatBool(loc.IsArchived),
 					loc.CreatedAt, loc.UpdatedAt,
 				}
 			})
@@ -453,7 +465,7 @@ func (s *Service) toCSV(data interface{}, entityType EntityType) ([]byte, error)
 			func(cat CategoryExport) []string {
 				return []string{
 					cat.ID, cat.Name, cat.ParentCategory, cat.Description,
-					fmt.Sprintf("%t", cat.IsArchived), cat.CreatedAt, cat.UpdatedAt,
+					strconv.FormatBool(cat.IsArchived), cat.CreatedAt, cat.UpdatedAt,
 				}
 			})
 
@@ -464,7 +476,7 @@ func (s *Service) toCSV(data interface{}, entityType EntityType) ([]byte, error)
 			func(c ContainerExport) []string {
 				return []string{
 					c.ID, c.Name, c.LocationName, c.Description, c.Capacity, c.ShortCode,
-					fmt.Sprintf("%t", c.IsArchived), c.CreatedAt, c.UpdatedAt,
+					strconv.FormatBool(c.IsArchived), c.CreatedAt, c.UpdatedAt,
 				}
 			})
 
@@ -475,7 +487,7 @@ func (s *Service) toCSV(data interface{}, entityType EntityType) ([]byte, error)
 			func(l LabelExport) []string {
 				return []string{
 					l.ID, l.Name, l.Color, l.Description,
-					fmt.Sprintf("%t", l.IsArchived), l.CreatedAt, l.UpdatedAt,
+					strconv.FormatBool(l.IsArchived), l.CreatedAt, l.UpdatedAt,
 				}
 			})
 
@@ -486,7 +498,7 @@ func (s *Service) toCSV(data interface{}, entityType EntityType) ([]byte, error)
 			func(c CompanyExport) []string {
 				return []string{
 					c.ID, c.Name, c.Website, c.Notes,
-					fmt.Sprintf("%t", c.IsArchived), c.CreatedAt, c.UpdatedAt,
+					strconv.FormatBool(c.IsArchived), c.CreatedAt, c.UpdatedAt,
 				}
 			})
 
@@ -497,7 +509,7 @@ func (s *Service) toCSV(data interface{}, entityType EntityType) ([]byte, error)
 			func(b BorrowerExport) []string {
 				return []string{
 					b.ID, b.Name, b.Email, b.Phone, b.Notes,
-					fmt.Sprintf("%t", b.IsArchived), b.CreatedAt, b.UpdatedAt,
+					strconv.FormatBool(b.IsArchived), b.CreatedAt, b.UpdatedAt,
 				}
 			})
 
@@ -532,11 +544,25 @@ func writeCSV[T any](w *csv.Writer, header []string, rows []T, toRow func(T) []s
 	return nil
 }
 
+// marshalJSON encodes an export payload as indented JSON. It writes through a
+// json.Encoder with HTML escaping disabled: export files are never embedded in
+// HTML, and escaping every <, > and & only costs time and obscures the data.
+func marshalJSON(v interface{}) ([]byte, error) {
+	var buf bytes.Buffer
+	enc := json.NewEncoder(&buf)
+	enc.SetEscapeHTML(false)
+	enc.SetIndent("", "  ")
+	if err := enc.Encode(v); err != nil {
+		return nil, err
+	}
+	return buf.Bytes(), nil
+}
+
 // Import row handler
-func (s *Service) importRow(ctx context.Context, workspaceID uuid.UUID, entityType EntityType, row map[string]string, rowNum int) error {
+func (s *Service) importRow(ctx context.Context, lookups *nameLookups, workspaceID uuid.UUID, entityType EntityType, row map[string]string, rowNum int) error {
 	switch entityType {
 	case EntityTypeCategory:
-		return s.importCategory(ctx, workspaceID, row)
+		return s.importCategory(ctx, lookups, workspaceID, row)
 	case EntityTypeLabel:
 		return s.importLabel(ctx, workspaceID, row)
 	case EntityTypeCompany:
@@ -544,17 +570,17 @@ func (s *Service) importRow(ctx context.Context, workspaceID uuid.UUID, entityTy
 	case EntityTypeBorrower:
 		return s.importBorrower(ctx, workspaceID, row)
 	case EntityTypeLocation:
-		return s.importLocation(ctx, workspaceID, row)
+		return s.importLocation(ctx, lookups, workspaceID, row)
 	case EntityTypeItem:
-		return s.importItem(ctx, workspaceID, row)
+		return s.importItem(ctx, lookups, workspaceID, row)
 	case EntityTypeContainer:
-		return s.importContainer(ctx, workspaceID, row)
+		return s.importContainer(ctx, lookups, workspaceID, row)
 	default:
 		return fmt.Errorf("unsupported entity type for import: %s", entityType)
 	}
 }
 
-func (s *Service) importCategory(ctx context.Context, workspaceID uuid.UUID, row map[string]string) error {
+func (s *Service) importCategory(ctx context.Context, lookups *nameLookups, workspaceID uuid.UUID, row map[string]string) error {
 	name := row["name"]
 	if name == "" {
 		return errors.New(msgNameIsRequired)
@@ -562,13 +588,11 @@ func (s *Service) importCategory(ctx context.Context, workspaceID uuid.UUID, row
 
 	var parentID pgtype.UUID
 	if parentName := row["parent_category"]; parentName != "" {
-		parent, err := s.repo.GetCategoryByName(ctx, workspaceID, parentName)
+		parent, err := lookups.category(ctx, parentName)
 		if err != nil {
 			return fmt.Errorf("failed to find parent category '%s': %w", parentName, err)
 		}
-		if parent != nil {
-			parentID = pgtype.UUID{Bytes: parent.ID, Valid: true}
-		}
+		parentID = parent
 	}
 
 	_, err := s.repo.CreateCategory(ctx, queries.CreateCategoryParams{
@@ -635,7 +659,7 @@ func (s *Service) importBorrower(ctx context.Context, workspaceID uuid.UUID, row
 	return err
 }
 
-func (s *Service) importLocation(ctx context.Context, workspaceID uuid.UUID, row map[string]string) error {
+func (s *Service) importLocation(ctx context.Context, lookups *nameLookups, workspaceID uuid.UUID, row map[string]string) error {
 	name := row["name"]
 	if name == "" {
 		return errors.New(msgNameIsRequired)
@@ -643,13 +667,11 @@ func (s *Service) importLocation(ctx context.Context, workspaceID uuid.UUID, row
 
 	var parentID pgtype.UUID
 	if parentName := row["parent_location"]; parentName != "" {
-		parent, err := s.repo.GetLocationByName(ctx, workspaceID, parentName)
+		parent, err := lookups.location(ctx, parentName)
 		if err != nil {
 			return fmt.Errorf("failed to find parent location '%s': %w", parentName, err)
 		}
-		if parent != nil {
-			parentID = pgtype.UUID{Bytes: parent.ID, Valid: true}
-		}
+		parentID = parent
 	}
 
 	_, err := s.repo.CreateLocation(ctx, queries.CreateLocationParams{
@@ -663,7 +685,7 @@ func (s *Service) importLocation(ctx context.Context, workspaceID uuid.UUID, row
 	return err
 }
 
-func (s *Service) importItem(ctx context.Context, workspaceID uuid.UUID, row map[string]string) error {
+func (s *Service) importItem(ctx context.Context, lookups *nameLookups, workspaceID uuid.UUID, row map[string]string) error {
 	name := row["name"]
 	if name == "" {
 		return errors.New(msgNameIsRequired)
@@ -671,13 +693,11 @@ func (s *Service) importItem(ctx context.Context, workspaceID uuid.UUID, row map
 
 	var categoryID pgtype.UUID
 	if catName := row["category_name"]; catName != "" {
-		cat, err := s.repo.GetCategoryByName(ctx, workspaceID, catName)
+		cat, err := lookups.category(ctx, catName)
 		if err != nil {
 			return fmt.Errorf("failed to find category '%s': %w", catName, err)
 		}
-		if cat != nil {
-			categoryID = pgtype.UUID{Bytes: cat.ID, Valid: true}
-		}
+		categoryID = cat
 	}
 
 	sku := row["sku"]
@@ -701,7 +721,7 @@ func (s *Service) importItem(ctx context.Context, workspaceID uuid.UUID, row map
 	return err
 }
 
-func (s *Service) importContainer(ctx context.Context, workspaceID uuid.UUID, row map[string]string) error {
+func (s *Service) importContainer(ctx context.Context, lookups *nameLookups, workspaceID uuid.UUID, row map[string]string) error {
 	name := row["name"]
 	if name == "" {
 		return errors.New(msgNameIsRequired)
@@ -712,11 +732,11 @@ func (s *Service) importContainer(ctx context.Context, workspaceID uuid.UUID, ro
 		return fmt.Errorf("location_name is required")
 	}
 
-	location, err := s.repo.GetLocationByName(ctx, workspaceID, locationName)
+	location, err := lookups.location(ctx, locationName)
 	if err != nil {
 		return fmt.Errorf("failed to find location '%s': %w", locationName, err)
 	}
-	if location == nil {
+	if !location.Valid {
 		return fmt.Errorf("location '%s' not found", locationName)
 	}
 
@@ -724,7 +744,7 @@ func (s *Service) importContainer(ctx context.Context, workspaceID uuid.UUID, ro
 		ID:          uuid.New(),
 		WorkspaceID: workspaceID,
 		Name:        name,
-		LocationID:  location.ID,
+		LocationID:  location.Bytes,
 		Description: stringToPtr(row["description"]),
 		Capacity:    stringToPtr(row["capacity"]),
 		ShortCode:   row["short_code"],
@@ -732,6 +752,56 @@ func (s *Service) importContainer(ctx context.Context, workspaceID uuid.UUID, ro
 	return err
 }
 
+// nameLookups memoizes the category and location name lookups of a single
+// import, so rows referencing the same parent cost one query, not one each.
+// Only found names are cached: a name missing now may be created by a later
+// row of the same file.
+type nameLookups struct {
+	repo        Repository
+	workspaceID uuid.UUID
+	categories  map[string]pgtype.UUID
+	locations   map[string]pgtype.UUID
+}
+
+func newNameLookups(repo Repository, workspaceID uuid.UUID) *nameLookups {
+	return &nameLookups{
+		repo:        repo,
+		workspaceID: workspaceID,
+		categories:  make(map[string]pgtype.UUID),
+		locations:   make(map[string]pgtype.UUID),
+	}
+}
+
+// category returns the ID of the named category, or an invalid UUID when
+// there is none.
+func (l *nameLookups) category(ctx context.Context, name string) (pgtype.UUID, error) {
+	if id, ok := l.categories[name]; ok {
+		return id, nil
+	}
+	cat, err := l.repo.GetCategoryByName(ctx, l.workspaceID, name)
+	if err != nil || cat == nil {
+		return pgtype.UUID{}, err
+	}
+	id := pgtype.UUID{Bytes: cat.ID, Valid: true}
+	l.categories[name] = id
+	return id, nil
+}
+
+// location returns the ID of the named location, or an invalid UUID when
+// there is none.
+func (l *nameLookups) location(ctx context.Context, name string) (pgtype.UUID, error) {
+	if id, ok := l.locations[name]; ok {
+		return id, nil
+	}
+	loc, err := l.repo.GetLocationByName(ctx, l.workspaceID, name)
+	if err != nil || loc == nil {
+		return pgtype.UUID{}, err
+	}
+	id := pgtype.UUID{Bytes: loc.ID, Valid: true}
+	l.locations[name] = id
+	return id, nil
+}
+
 // Helper functions
 
 func ptrToString(s *string) string {
@@ -21,12 +21,12 @@ type MockRepository struct {
 	mock.Mock
 }
 
-func (m *MockRepository) ListAllItems(ctx context.Context, workspaceID uuid.UUID, includeArchived bool) ([]queries.WarehouseItem, error) {
+func (m *MockRepository) ListAllItems(ctx context.Context, workspaceID uuid.UUID, includeArchived bool) ([]queries.ListItemsForExportRow, error) {
 	args := m.Called(ctx, workspaceID, includeArchived)
 	if args.Get(0) == nil {
 		return nil, args.Error(1)
 	}
-	return args.Get(0).([]queries.WarehouseItem), args.Error(1)
+	return args.Get(0).([]queries.ListItemsForExportRow), args.Error(1)
 }
 
 func (m *MockRepository) CreateItem(ctx context.Context, params queries.CreateItemParams) (queries.WarehouseItem, error) {
@@ -42,12 +42,12 @@ func (m *MockRepository) GetCategoryByName(ctx context.Context, workspaceID uuid
 	return args.Get(0).(*queries.WarehouseCategory), args.Error(1)
 }
 
-func (m *MockRepository) ListAllLocations(ctx context.Context, workspaceID uuid.UUID, includeArchived bool) ([]queries.WarehouseLocation, error) {
+func (m *MockRepository) ListAllLocations(ctx context.Context, workspaceID uuid.UUID, includeArchived bool) ([]queries.ListLocationsForExportRow, error) {
 	args := m.Called(ctx, workspaceID, includeArchived)
 	if args.Get(0) == nil {
 		return nil, args.Error(1)
 	}
-	return args.Get(0).([]queries.WarehouseLocation), args.Error(1)
+	return args.Get(0).([]queries.ListLocationsForExportRow), args.Error(1)
 }
 
 func (m *MockRepository) CreateLocation(ctx context.Context, params queries.CreateLocationParams) (queries.WarehouseLocation, error) {
@@ -63,12 +63,12 @@ func (m *MockRepository) GetLocationByName(ctx context.Context, workspaceID uuid
 	return args.Get(0).(*queries.WarehouseLocation), args.Error(1)
 }
 
-func (m *MockRepository) ListAllCategories(ctx context.Context, workspaceID uuid.UUID, includeArchived bool) ([]queries.WarehouseCategory, error) {
+func (m *MockRepository) ListAllCategories(ctx context.Context, workspaceID uuid.UUID, includeArchived bool) ([]queries.ListCategoriesForExportRow, error) {
 	args := m.Called(ctx, workspaceID, includeArchived)
 	if args.Get(0) == nil {
 		return nil, args.Error(1)
 	}
-	return args.Get(0).([]queries.WarehouseCategory), args.Error(1)
+	return args.Get(0).([]queries.ListCategoriesForExportRow), args.Error(1)
 }
 
 func (m *MockRepository) CreateCategory(ctx context.Context, params queries.CreateCategoryParams) (queries.WarehouseCategory, error) {
@@ -76,12 +76,12 @@ func (m *MockRepository) CreateCategory(ctx context.Context, params queries.Crea
 	return args.Get(0).(queries.WarehouseCategory), args.Error(1)
 }
 
-func (m *MockRepository) ListAllContainers(ctx context.Context, workspaceID uuid.UUID, includeArchived bool) ([]queries.WarehouseContainer, error) {
+func (m *MockRepository) ListAllContainers(ctx context.Context, workspaceID uuid.UUID, includeArchived bool) ([]queries.ListContainersForExportRow, error) {
 	args := m.Called(ctx, workspaceID, includeArchived)
 	if args.Get(0) == nil {
 		return nil, args.Error(1)
 	}
-	return args.Get(0).([]queries.WarehouseContainer), args.Error(1)
+	return args.Get(0).([]queries.ListContainersForExportRow), args.Error(1)
 }
 
 func (m *MockRepository) CreateContainer(ctx context.Context, params queries.CreateContainerParams) (queries.WarehouseContainer, error) {
@@ -213,7 +213,7 @@ func TestService_Export_Items_JSON(t *testing.T) {
 	mockRepo := new(MockRepository)
 	svc := NewService(mockRepo)
 
-	mockRepo.On("ListAllItems", ctx, workspaceID, false).Return([]queries.WarehouseItem{
+	mockRepo.On("ListAllItems", ctx, workspaceID, false).Return([]queries.ListItemsForExportRow{
 		{
 			ID:          itemID,
 			WorkspaceID: workspaceID,
@@ -260,7 +260,7 @@ func TestService_Export_Items_CSV(t *testing.T) {
 	mockRepo := new(MockRepository)
 	svc := NewService(mockRepo)
 
-	mockRepo.On("ListAllItems", ctx, workspaceID, false).Return([]queries.WarehouseItem{
+	mockRepo.On("ListAllItems", ctx, workspaceID, false).Return([]queries.ListItemsForExportRow{
 		{
 			ID:          itemID,
 			WorkspaceID: workspaceID,
@@ -300,7 +300,7 @@ func TestService_Export_Categories(t *testing.T) {
 	mockRepo := new(MockRepository)
 	svc := NewService(mockRepo)
 
-	mockRepo.On("ListAllCategories", ctx, workspaceID, true).Return([]queries.WarehouseCategory{
+	mockRepo.On("ListAllCategories", ctx, workspaceID, true).Return([]queries.ListCategoriesForExportRow{
 		{
 			ID:          catID,
 			WorkspaceID: workspaceID,
@@ -341,7 +341,7 @@ func TestService_Export_Categories_CSV(t *testing.T) {
 	mockRepo := new(MockRepository)
 	svc := NewService(mockRepo)
 
-	mockRepo.On("ListAllCategories", ctx, workspaceID, true).Return([]queries.WarehouseCategory{
+	mockRepo.On("ListAllCategories", ctx, workspaceID, true).Return([]queries.ListCategoriesForExportRow{
 		{
 			ID:          catID,
 			WorkspaceID: workspaceID,
@@ -380,7 +380,7 @@ func TestService_Export_Locations(t *testing.T) {
 	mockRepo := new(MockRepository)
 	svc := NewService(mockRepo)
 
-	mockRepo.On("ListAllLocations", ctx, workspaceID, false).Return([]queries.WarehouseLocation{
+	mockRepo.On("ListAllLocations", ctx, workspaceID, false).Return([]queries.ListLocationsForExportRow{
 		{
 			ID:          locID,
 			WorkspaceID: workspaceID,
@@ -545,7 +545,7 @@ func TestService_Export_Containers(t *testing.T) {
 	mockRepo := new(MockRepository)
 	svc := NewService(mockRepo)
 
-	mockRepo.On("ListAllContainers", ctx, workspaceID, false).Return([]queries.WarehouseContainer{
+	mockRepo.On("ListAllContainers", ctx, workspaceID, false).Return([]queries.ListContainersForExportRow{
 		{
 			ID:          containerID,
 			WorkspaceID: workspaceID,
@@ -585,7 +585,7 @@ func TestService_Export_Locations_CSV(t *testing.T) {
 	mockRepo := new(MockRepository)
 	svc := NewService(mockRepo)
 
-	mockRepo.On("ListAllLocations", ctx, workspaceID, false).Return([]queries.WarehouseLocation{
+	mockRepo.On("ListAllLocations", ctx, workspaceID, false).Return([]queries.ListLocationsForExportRow{
 		{
 			ID:          locID,
 			WorkspaceID: workspaceID,
@@ -737,7 +737,7 @@ func TestService_Export_Containers_CSV(t *testing.T) {
 	mockRepo := new(MockRepository)
 	svc := NewService(mockRepo)
 
-	mockRepo.On("ListAllContainers", ctx, workspaceID, false).Return([]queries.WarehouseContainer{
+	mockRepo.On("ListAllContainers", ctx, workspaceID, false).Return([]queries.ListContainersForExportRow{
 		{
 			ID:          containerID,
 			WorkspaceID: workspaceID,
@@ -808,7 +808,7 @@ func TestService_Export_UnsupportedFormat(t *testing.T) {
 	mockRepo := new(MockRepository)
 	svc := NewService(mockRepo)
 
-	mockRepo.On("ListAllCategories", ctx, workspaceID, false).Return([]queries.WarehouseCategory{
+	mockRepo.On("ListAllCategories", ctx, workspaceID, false).Return([]queries.ListCategoriesForExportRow{
 		{
 			ID:          uuid.New(),
 			WorkspaceID: workspaceID,
@@ -1095,6 +1095,35 @@ func TestService_Import_Items(t *testing.T) {
 	mockRepo.AssertExpectations(t)
 }
 
+func TestService_Import_Items_CategoryLookupMemoized(t *testing.T) {
+	ctx := context.Background()
+	workspaceID := uuid.New()
+	catID := uuid.New()
+
+	mockRepo := new(MockRepository)
+	svc := NewService(mockRepo)
+
+	csvData := []byte("name,category_name\nWidget,Electronics\nGadget,Electronics\nThing,Missing\nOther,Missing")
+
+	mockRepo.On("GetCategoryByName", ctx, workspaceID, "Electronics").Return(&queries.WarehouseCategory{
+		ID:          catID,
+		WorkspaceID: workspaceID,
+		Name:        "Electronics",
+	}, nil).Once()
+	// Misses are not cached: a later row may create the name
+	mockRepo.On("GetCategoryByName", ctx, workspaceID, "Missing").Return(nil, nil).Twice()
+
+	mockRepo.On("CreateItem", ctx, mock.Anything).Return(queries.WarehouseItem{}, nil).Times(4)
+
+	result, err := svc.Import(ctx, workspaceID, EntityTypeItem, FormatCSV, csvData)
+
+	assert.NoError(t, err)
+	assert.Equal(t, 4, result.Succeeded)
+
+	mockRepo.AssertExpectations(t)
+	mockRepo.AssertNumberOfCalls(t, "GetCategoryByName", 3)
+}
+
 func TestService_Import_Items_AutoGenerateSKU(t *testing.T) {
 	ctx := context.Background()
 	workspaceID := uuid.New()
@@ -1167,39 +1196,40 @@ func TestService_Import_Container_MissingLocation(t *testing.T) {
 	mockRepo.AssertExpectations(t)
 }
 
-func TestService_Import_Container_MissingLocationName(t *testing.T) {
-	ctx := context.Background()
-	workspaceID := uuid.New()
-
-	mockRepo := new(MockRepository)
-	svc := NewService(mockRepo)
-
-	csvData := []byte("name,description\nBox A1,A box without location")
-
-	result, err := svc.Import(ctx, workspaceID, EntityTypeContainer, FormatCSV, csvData)
-
-	assert.NoError(t, err)
-	assert.Equal(t, 0, result.Succeeded)
-	assert.Equal(t, 1, result.Failed)
-	assert.Contains(t, result.Errors[0].Message, "location_name is required")
-}
-
 func TestService_Import_MissingRequiredField(t *testing.T) {
-	ctx := context.Background()
-	workspaceID := uuid.New()
-
-	mockRepo := new(MockRepository)
-	svc := NewService(mockRepo)
+	tests := []struct {
+		name       string
+		entityType EntityType
+		csvData    string
+		wantErr    string
+	}{
+		{"category without name", EntityTypeCategory, "description\nA category without name", "name is required"},
+		{"label without name", EntityTypeLabel, "color\n#ff0000", "name is required"},
+		{"company without name", EntityTypeCompany, "website\nhttps://example.com", "name is required"},
+		{"borrower without name", EntityTypeBorrower, "email\njohn@example.com", "name is required"},
+		{"location without name", EntityTypeLocation, "description\nA location without name", "name is required"},
+		{"item without name", EntityTypeItem, "sku\nSKU-001", "name is required"},
+		{"container without name", EntityTypeContainer, "location_name\nGarage", "name is required"},
+		{"container without location", EntityTypeContainer, "name,description\nBox A1,A box without location", "location_name is required"},
+	}
 
-	csvData := []byte("description\nA category without name")
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			ctx := context.Background()
+			mockRepo := new(MockRepository)
+			svc := NewService(mockRepo)
 
-	result, err := svc.Import(ctx, workspaceID, EntityTypeCategory, FormatCSV, csvData)
+			result, err := svc.Import(ctx, uuid.New(), tt.entityType, FormatCSV, []byte(tt.csvData))
 
-	assert.NoError(t, err)
-	assert.Equal(t, 0, result.Succeeded)
-	assert.Equal(t, 1, result.Failed)
-	assert.Len(t, result.Errors, 1)
-	assert.Contains(t, result.Errors[0].Message, "name is required")
+			assert.NoError(t, err)
+			assert.Equal(t, 0, result.Succeeded)
+			assert.Equal(t, 1, result.Failed)
+			if assert.Len(t, result.Errors, 1) {
+				assert.Contains(t, result.Errors[0].Message, tt.wantErr)
+			}
+			mockRepo.AssertExpectations(t)
+		})
+	}
 }
 
 func TestService_Import_PartialSuccess(t *testing.T) {
@@ -1270,6 +1300,34 @@ func TestService_Import_InvalidCSV(t *testing.T) {
 	assert.Contains(t, err.Error(), "failed to parse")
 }
 
+func TestService_Import_MalformedCSVRowIsSkipped(t *testing.T) {
+	ctx := context.Background()
+	workspaceID := uuid.New()
+
+	mockRepo := new(MockRepository)
+	svc := NewService(mockRepo)
+
+	// Second data row has the wrong number of fields; the rows around it still import
+	csvData := []byte("name,description\nFirst,One\nSecond\nThird,Three")
+
+	mockRepo.On("CreateCategory", ctx, mock.MatchedBy(func(p queries.CreateCategoryParams) bool {
+		return p.Name == "First" || p.Name == "Third"
+	})).Return(queries.WarehouseCategory{}, nil).Twice()
+
+	result, err := svc.Import(ctx, workspaceID, EntityTypeCategory, FormatCSV, csvData)
+
+	assert.NoError(t, err)
+	assert.Equal(t, 3, result.TotalRows)
+	assert.Equal(t, 2, result.Succeeded)
+	assert.Equal(t, 1, result.Failed)
+	if assert.Len(t, result.Errors, 1) {
+		assert.Equal(t, 2, result.Errors[0].Row)
+		assert.Equal(t, "PARSE_ERROR", result.Errors[0].Code)
+	}
+
+	mockRepo.AssertExpectations(t)
+}
+
 func TestService_Import_InvalidJSON(t *testing.T) {
 	ctx := context.Background()
 	workspaceID := uuid.New()
@@ -1435,7 +1493,7 @@ func TestService_Export_CSV_SpecialCharacters(t *testing.T) {
 			mockRepo := new(MockRepository)
 			svc := NewService(mockRepo)
 
-			mockRepo.On("ListAllCategories", ctx, workspaceID, false).Return([]queries.WarehouseCategory{
+			mockRepo.On("ListAllCategories", ctx, workspaceID, false).Return([]queries.ListCategoriesForExportRow{
 				{
 					ID:          catID,
 					WorkspaceID: workspaceID,
@@ -1523,7 +1581,7 @@ func TestService_Export_EmptyValues(t *testing.T) {
 	svc := NewService(mockRepo)
 
 	// Item with many nil fields
-	mockRepo.On("ListAllItems", ctx, workspaceID, false).Return([]queries.WarehouseItem{
+	mockRepo.On("ListAllItems", ctx, workspaceID, false).Return([]queries.ListItemsForExportRow{
 		{
 			ID:           uuid.New(),
 			WorkspaceID:  workspaceID,
@@ -1769,7 +1827,7 @@ func TestService_Export_EmptyWorkspace(t *testing.T) {
 	mockRepo := new(MockRepository)
 	svc := NewService(mockRepo)
 
-	mockRepo.On("ListAllItems", ctx, workspaceID, false).Return([]queries.WarehouseItem{}, nil)
+	mockRepo.On("ListAllItems", ctx, workspaceID, false).Return([]queries.ListItemsForExportRow{}, nil)
 
 	data, metadata, err := svc.Export(ctx, ExportOptions{
 		WorkspaceID: workspaceID,
@@ -1794,7 +1852,7 @@ func TestService_Export_EmptyWorkspace_CSV(t *testing.T) {
 	mockRepo := new(MockRepository)
 	svc := NewService(mockRepo)
 
-	mockRepo.On("ListAllCategories", ctx, workspaceID, false).Return([]queries.WarehouseCategory{}, nil)
+	mockRepo.On("ListAllCategories", ctx, workspaceID, false).Return([]queries.ListCategoriesForExportRow{}, nil)
 
 	data, metadata, err := svc.Export(ctx, ExportOptions{
 		WorkspaceID: workspaceID,
@@ -1822,9 +1880,9 @@ func TestService_Export_MultipleItems(t *testing.T) {
 	mockRepo := new(MockRepository)
 	svc := NewService(mockRepo)
 
-	items := make([]queries.WarehouseItem, 100)
+	items := make([]queries.ListItemsForExportRow, 100)
 	for i := 0; i < 100; i++ {
-		items[i] = queries.WarehouseItem{
+		items[i] = queries.ListItemsForExportRow{
 			ID:          uuid.New(),
 			WorkspaceID: workspaceID,
 			Sku:         fmt.Sprintf("SKU-%03d", i),
@@ -2294,6 +2352,28 @@ func TestService_parseCSV_CaseInsensitiveHeaders(t *testing.T) {
 	mockRepo.AssertExpectations(t)
 }
 
+func TestService_parseCSV_UTF8BOM(t *testing.T) {
+	ctx := context.Background()
+	workspaceID := uuid.New()
+
+	mockRepo := new(MockRepository)
+	svc := NewService(mockRepo)
+
+	// Excel's "CSV UTF-8" export prefixes the file with a byte order mark
+	csvData := []byte("\xEF\xBB\xBFname,description\nTest,Desc")
+
+	mockRepo.On("CreateCategory", ctx, mock.MatchedBy(func(p queries.CreateCategoryParams) bool {
+		return p.Name == "Test" && *p.Description == "Desc"
+	})).Return(queries.WarehouseCategory{}, nil)
+
+	result, err := svc.Import(ctx, workspaceID, EntityTypeCategory, FormatCSV, csvData)
+
+	assert.NoError(t, err)
+	assert.Equal(t, 1, result.Succeeded)
+
+	mockRepo.AssertExpectations(t)
+}
+
 // =============================================================================
 // Helper Function Tests
 // =============================================================================
@@ -2350,6 +2430,16 @@ func TestStringToPtr_Value(t *testing.T) {
 	assert.Equal(t, "test", *result)
 }
 
+func TestMarshalJSON_DoesNotEscapeHTML(t *testing.T) {
+	data, err := marshalJSON([]LabelExport{{Name: "Nuts & Bolts <M6>"}})
+	assert.NoError(t, err)
+	assert.Contains(t, string(data), `"name": "Nuts & Bolts <M6>"`)
+
+	var labels []LabelExport
+	assert.NoError(t, json.Unmarshal(data, &labels))
+	assert.Equal(t, "Nuts & Bolts <M6>", labels[0].Name)
+}
+
 // =============================================================================
 // Format Validation Tests
 // =============================================================================
@@ -2372,7 +2462,7 @@ func TestService_Export_Locations_WithParent(t *testing.T) {
 	mockRepo := new(MockRepository)
 	svc := NewService(mockRepo)
 
-	mockRepo.On("ListAllLocations", ctx, workspaceID, false).Return([]queries.WarehouseLocation{
+	mockRepo.On("ListAllLocations", ctx, workspaceID, false).Return([]queries.ListLocationsForExportRow{
 		{
 			ID:             parentID,
 			WorkspaceID:    workspaceID,
@@ -2384,14 +2474,15 @@ func TestService_Export_Locations_WithParent(t *testing.T) {
 			UpdatedAt:      pgTimestamp(now),
 		},
 		{
-			ID:             childID,
-			WorkspaceID:    workspaceID,
-			Name:           "Room A",
-			ParentLocation: pgtype.UUID{Bytes: parentID, Valid: true},
-			Description:    ptrString("Room in Building 1"),
-			IsArchived:     false,
-			CreatedAt:      pgTimestamp(now),
-			UpdatedAt:      pgTimestamp(now),
+			ID:                 childID,
+			WorkspaceID:        workspaceID,
+			Name:               "Room A",
+			ParentLocation:     pgtype.UUID{Bytes: parentID, Valid: true},
+			ParentLocationName: ptrString("Building 1"),
+			Description:        ptrString("Room in Building 1"),
+			IsArchived:         false,
+			CreatedAt:          pgTimestamp(now),
+			UpdatedAt:          pgTimestamp(now),
 		},
 	}, nil)
 
@@ -2408,6 +2499,8 @@ func TestService_Export_Locations_WithParent(t *testing.T) {
 	err = json.Unmarshal(data, &locations)
 	assert.NoError(t, err)
 	assert.Len(t, locations, 2)
+	assert.Empty(t, locations[0].ParentLocation)
+	assert.Equal(t, "Building 1", locations[1].ParentLocation)
 
 	mockRepo.AssertExpectations(t)
 }
@@ -2422,7 +2515,7 @@ func TestService_Export_Categories_WithParent(t *testing.T) {
 	mockRepo := new(MockRepository)
 	svc := NewService(mockRepo)
 
-	mockRepo.On("ListAllCategories", ctx, workspaceID, false).Return([]queries.WarehouseCategory{
+	mockRepo.On("ListAllCategories", ctx, workspaceID, false).Return([]queries.ListCategoriesForExportRow{
 		{
 			ID:               parentID,
 			WorkspaceID:      workspaceID,
@@ -2434,14 +2527,15 @@ func TestService_Export_Categories_WithParent(t *testing.T) {
 			UpdatedAt:        pgTimestamp(now),
 		},
 		{
-			ID:               childID,
-			WorkspaceID:      workspaceID,
-			Name:             "Computers",
-			ParentCategoryID: pgtype.UUID{Bytes: parentID, Valid: true},
-			Description:      ptrString("Computer items"),
-			IsArchived:       false,
-			CreatedAt:        pgTimestamp(now),
-			UpdatedAt:        pgTimestamp(now),
+			ID:                 childID,
+			WorkspaceID:        workspaceID,
+			Name:               "Computers",
+			ParentCategoryID:   pgtype.UUID{Bytes: parentID, Valid: true},
+			ParentCategoryName: ptrString("Electronics"),
+			Description:        ptrString("Computer items"),
+			IsArchived:         false,
+			CreatedAt:          pgTimestamp(now),
+			UpdatedAt:          pgTimestamp(now),
 		},
 	}, nil)
 
@@ -2458,6 +2552,8 @@ func TestService_Export_Categories_WithParent(t *testing.T) {
 	err = json.Unmarshal(data, &categories)
 	assert.NoError(t, err)
 	assert.Len(t, categories, 2)
+	assert.Empty(t, categories[0].ParentCategory)
+	assert.Equal(t, "Electronics", categories[1].ParentCategory)
 
 	mockRepo.AssertExpectations(t)
 }
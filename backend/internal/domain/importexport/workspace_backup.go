@@ -2,8 +2,13 @@ package importexport
 
 import (
 	"context"
+	"crypto/sha256"
+	"encoding/hex"
 	"encoding/json"
 	"fmt"
+	"log/slog"
+	"strconv"
+	"sync"
 	"time"
 
 	"github.com/google/uuid"
@@ -32,6 +37,7 @@ type WorkspaceBackupQueries interface {
 	ListAllInventory(ctx context.Context, workspaceID uuid.UUID) ([]queries.WarehouseInventory, error)
 	ListAllLoans(ctx context.Context, workspaceID uuid.UUID) ([]queries.WarehouseLoan, error)
 	ListAllAttachments(ctx context.Context, workspaceID uuid.UUID) ([]queries.WarehouseAttachment, error)
+	GetWorkspaceExportVersion(ctx context.Context, workspaceID uuid.UUID) (queries.GetWorkspaceExportVersionRow, error)
 	CreateWorkspaceExport(ctx context.Context, arg queries.CreateWorkspaceExportParams) error
 
 	// Import operations
@@ -47,9 +53,13 @@ type WorkspaceBackupQueries interface {
 	CreateAttachment(ctx context.Context, arg queries.CreateAttachmentParams) (queries.WarehouseAttachment, error)
 }
 
+// auditWriteTimeout bounds the background write of an export audit record.
+const auditWriteTimeout = 10 * time.Second
+
 // WorkspaceBackupService handles full workspace backup and restore operations
 type WorkspaceBackupService struct {
 	queries WorkspaceBackupQueries
+	audits  sync.WaitGroup // in-flight background audit writes; see WaitForAudits
 }
 
 // NewWorkspaceBackupService creates a new workspace backup service
@@ -57,6 +67,23 @@ func NewWorkspaceBackupService(q WorkspaceBackupQueries) *WorkspaceBackupService
 	return &WorkspaceBackupService{queries: q}
 }
 
+// WaitForAudits blocks until the background audit writes started by exports
+// have finished, or ctx is done. Call it during shutdown so in-flight audit
+// rows are not lost.
+func (s *WorkspaceBackupService) WaitForAudits(ctx context.Context) error {
+	done := make(chan struct{})
+	go func() {
+		s.audits.Wait()
+		close(done)
+	}()
+	select {
+	case <-done:
+		return nil
+	case <-ctx.Done():
+		return ctx.Err()
+	}
+}
+
 // WorkspaceData contains all exportable workspace data
 type WorkspaceData struct {
 	Categories  []queries.WarehouseCategory   `json:"categories"`
@@ -71,6 +98,30 @@ type WorkspaceData struct {
 	Attachments []queries.WarehouseAttachment `json:"attachments"`
 }
 
+// recordCounts returns the number of records per entity type and their total.
+// It is shared by every export format so the audit record and the result
+// always agree.
+func (d *WorkspaceData) recordCounts() (map[string]int, int) {
+	counts := map[string]int{
+		"categories":  len(d.Categories),
+		"labels":      len(d.Labels),
+		"companies":   len(d.Companies),
+		"locations":   len(d.Locations),
+		"borrowers":   len(d.Borrowers),
+		"items":       len(d.Items),
+		"containers":  len(d.Containers),
+		"inventory":   len(d.Inventory),
+		"loans":       len(d.Loans),
+		"attachments": len(d.Attachments),
+	}
+
+	total := 0
+	for _, count := range counts {
+		total += count
+	}
+	return counts, total
+}
+
 // ExportWorkspace exports the entire workspace to Excel or JSON
 func (s *WorkspaceBackupService) ExportWorkspace(ctx context.Context, workspaceID uuid.UUID, format Format, includeArchived bool, exportedBy uuid.UUID) (*WorkspaceBackupResult, error) {
 	// Fetch all data
@@ -79,6 +130,10 @@ func (s *WorkspaceBackupService) ExportWorkspace(ctx context.Context, workspaceI
 		return nil, fmt.Errorf("failed to fetch workspace data: %w", err)
 	}
 
+	// Counts come straight from the fetched slices; a separate COUNT query
+	// per table would only repeat work the fetch has already done.
+	recordCounts, totalRecords := data.recordCounts()
+
 	// Generate file
 	var fileData []byte
 	var contentType string
@@ -88,7 +143,7 @@ func (s *WorkspaceBackupService) ExportWorkspace(ctx context.Context, workspaceI
 
 	switch format {
 	case FormatExcel:
-		fileData, err = s.generateExcel(data)
+		fileData, err = s.generateExcel(ctx, data)
 		if err != nil {
 			return nil, fmt.Errorf("failed to generate Excel: %w", err)
 		}
@@ -96,7 +151,7 @@ func (s *WorkspaceBackupService) ExportWorkspace(ctx context.Context, workspaceI
 		filename = fmt.Sprintf("workspace_backup_%s.xlsx", timestamp)
 
 	case FormatJSON:
-		fileData, err = json.MarshalIndent(data, "", "  ")
+		fileData, err = marshalJSON(data)
 		if err != nil {
 			return nil, fmt.Errorf("failed to generate JSON: %w", err)
 		}
@@ -107,42 +162,38 @@ func (s *WorkspaceBackupService) ExportWorkspace(ctx context.Context, workspaceI
 		return nil, fmt.Errorf("unsupported format: %s", format)
 	}
 
-	// Calculate record counts
-	recordCounts := map[string]int{
-		"categories":  len(data.Categories),
-		"labels":      len(data.Labels),
-		"companies":   len(data.Companies),
-		"locations":   len(data.Locations),
-		"borrowers":   len(data.Borrowers),
-		"items":       len(data.Items),
-		"containers":  len(data.Containers),
-		"inventory":   len(data.Inventory),
-		"loans":       len(data.Loans),
-		"attachments": len(data.Attachments),
-	}
-
-	totalRecords := 0
-	for _, count := range recordCounts {
-		totalRecords += count
-	}
-
 	// Create audit record
 	exportID := uuid.New()
-	recordCountsJSON, _ := json.Marshal(recordCounts)
-
 	fileSizeBytes := int64(len(fileData))
-	err = s.queries.CreateWorkspaceExport(ctx, queries.CreateWorkspaceExportParams{
-		ID:            exportID,
-		WorkspaceID:   workspaceID,
-		ExportedBy:    pgtype.UUID{Bytes: exportedBy, Valid: true},
-		Format:        string(format),
-		RecordCounts:  recordCountsJSON,
-		FileSizeBytes: &fileSizeBytes,
-	})
-	if err != nil {
-		// Log but don't fail
-		fmt.Printf("Warning: failed to create audit record: %v\n", err)
-	}
+
+	// The audit row is written in the background so the caller does not wait
+	// on another round trip before receiving the file. It must outlive the
+	// request context, and a failure is logged rather than failing the export.
+	// The counts are encoded there too; recordCounts is only read from here on.
+	s.audits.Add(1)
+	go func() {
+		defer s.audits.Done()
+
+		recordCountsJSON, err := json.Marshal(recordCounts)
+		if err != nil {
+			slog.Warn("encoding workspace export audit counts failed", "workspace_id", workspaceID, "error", err)
+			return
+		}
+
+		auditCtx, cancel := context.WithTimeout(context.WithoutCancel(ctx), auditWriteTimeout)
+		defer cancel()
+
+		if err := s.queries.CreateWorkspaceExport(auditCtx, queries.CreateWorkspaceExportParams{
+			ID:            exportID,
+			WorkspaceID:   workspaceID,
+			ExportedBy:    pgtype.UUID{Bytes: exportedBy, Valid: true},
+			Format:        string(format),
+			RecordCounts:  recordCountsJSON,
+			FileSizeBytes: &fileSizeBytes,
+		}); err != nil {
+			slog.Warn("writing workspace export audit record failed", "workspace_id", workspaceID, "error", err)
+		}
+	}()
 
 	return &WorkspaceBackupResult{
 		Data:         fileData,
@@ -154,6 +205,25 @@ func (s *WorkspaceBackupService) ExportWorkspace(ctx context.Context, workspaceI
 	}, nil
 }
 
+// ExportETag returns a validator for the backup ExportWorkspace would produce
+// right now, together with the time the workspace data last changed. It costs
+// a single query, so conditional requests can be answered without fetching
+// every entity and rebuilding the file.
+func (s *WorkspaceBackupService) ExportETag(ctx context.Context, workspaceID uuid.UUID, format Format, includeArchived bool) (string, time.Time, error) {
+	version, err := s.queries.GetWorkspaceExportVersion(ctx, workspaceID)
+	if err != nil {
+		return "", time.Time{}, fmt.Errorf("failed to fetch workspace export version: %w", err)
+	}
+
+	var lastUpdated time.Time
+	if version.LastUpdated.Valid {
+		lastUpdated = version.LastUpdated.Time
+	}
+
+	sum := sha256.Sum256([]byte(fmt.Sprintf("%s|%s|%t|%d|%d", workspaceID, format, includeArchived, version.RecordCount, lastUpdated.UnixNano())))
+	return hex.EncodeToString(sum[:16]), lastUpdated, nil
+}
+
 // fetchAllData retrieves all entities from the workspace
 func (s *WorkspaceBackupService) fetchAllData(ctx context.Context, workspaceID uuid.UUID, includeArchived bool) (*WorkspaceData, error) {
 	data := &WorkspaceData{}
@@ -234,8 +304,10 @@ func (s *WorkspaceBackupService) fetchAllData(ctx context.Context, workspaceID u
 	return data, nil
 }
 
-// generateExcel creates an Excel file with multiple sheets
-func (s *WorkspaceBackupService) generateExcel(data *WorkspaceData) ([]byte, error) {
+// generateExcel creates an Excel file with multiple sheets. Building the
+// workbook is CPU-bound, so the context is checked between sheets to stop
+// work as soon as the caller has gone away.
+func (s *WorkspaceBackupService) generateExcel(ctx context.Context, data *WorkspaceData) ([]byte, error) {
 	f := excelize.NewFile()
 	defer f.Close()
 
@@ -262,35 +334,25 @@ func (s *WorkspaceBackupService) generateExcel(data *WorkspaceData) ([]byte, err
 	}
 
 	// Create sheets for each entity type
-	if err := s.createCategoriesSheet(f, data.Categories, headerStyle); err != nil {
-		return nil, err
-	}
-	if err := s.createLabelsSheet(f, data.Labels, headerStyle); err != nil {
-		return nil, err
-	}
-	if err := s.createCompaniesSheet(f, data.Companies, headerStyle); err != nil {
-		return nil, err
-	}
-	if err := s.createLocationsSheet(f, data.Locations, headerStyle); err != nil {
-		return nil, err
-	}
-	if err := s.createBorrowersSheet(f, data.Borrowers, headerStyle); err != nil {
-		return nil, err
-	}
-	if err := s.createItemsSheet(f, data.Items, headerStyle); err != nil {
-		return nil, err
-	}
-	if err := s.createContainersSheet(f, data.Containers, headerStyle); err != nil {
-		return nil, err
-	}
-	if err := s.createInventorySheet(f, data.Inventory, headerStyle); err != nil {
-		return nil, err
-	}
-	if err := s.createLoansSheet(f, data.Loans, headerStyle); err != nil {
-		return nil, err
-	}
-	if err := s.createAttachmentsSheet(f, data.Attachments, headerStyle); err != nil {
-		return nil, err
+	sheets := []func() error{
+		func() error { return s.createCategoriesSheet(f, data.Categories, headerStyle) },
+		func() error { return s.createLabelsSheet(f, data.Labels, headerStyle) },
+		func() error { return s.createCompaniesSheet(f, data.Companies, headerStyle) },
+		func() error { return s.createLocationsSheet(f, data.Locations, headerStyle) },
+		func() error { return s.createBorrowersSheet(f, data.Borrowers, headerStyle) },
+		func() error { return s.createItemsSheet(f, data.Items, headerStyle) },
+		func() error { return s.createContainersSheet(f, data.Containers, headerStyle) },
+		func() error { return s.createInventorySheet(f, data.Inventory, headerStyle) },
+		func() error { return s.createLoansSheet(f, data.Loans, headerStyle) },
+		func() error { return s.createAttachmentsSheet(f, data.Attachments, headerStyle) },
+	}
+	for _, createSheet := range sheets {
+		if err := ctx.Err(); err != nil {
+			return nil, err
+		}
+		if err := createSheet(); err != nil {
+			return nil, err
+		}
 	}
 
 	// Set first sheet as active
@@ -321,411 +383,248 @@ func formatDate(d pgtype.Date) string {
 	return ""
 }
 
-// createCategoriesSheet creates the Categories sheet
-func (s *WorkspaceBackupService) createCategoriesSheet(f *excelize.File, categories []queries.WarehouseCategory, headerStyle int) error {
-	sheetName := "Categories"
-	index, err := f.NewSheet(sheetName)
-	if err != nil {
+// writeSheet streams a sheet with a styled, frozen header row followed by one
+// row per record. The stream writer flushes rows to a temporary file instead
+// of keeping every cell in memory, so large workspaces export in roughly
+// constant memory. Nil values leave the cell empty.
+//
+// toRow appends the record's cells to the row buffer it is given; the buffer
+// is reused for every record since SetRow serializes the values immediately.
+func writeSheet[T any](f *excelize.File, sheetName string, headers []string, records []T, headerStyle int, toRow func(row []interface{}, record T) []interface{}) error {
+	if _, err := f.NewSheet(sheetName); err != nil {
 		return err
 	}
-	if index == 0 {
-		f.SetActiveSheet(index)
-	}
 
-	// Headers
-	headers := []string{"ID", "Name", "Parent Category ID", "Description", "Archived", headerCreatedAt, headerUpdatedAt}
-	for i, header := range headers {
-		cell, _ := excelize.CoordinatesToCellName(i+1, 1)
-		f.SetCellValue(sheetName, cell, header)
-		f.SetCellStyle(sheetName, cell, cell, headerStyle)
-	}
-
-	// Data
-	for i, cat := range categories {
-		row := i + 2
-		f.SetCellValue(sheetName, fmt.Sprintf("A%d", row), cat.ID.String())
-		f.SetCellValue(sheetName, fmt.Sprintf("B%d", row), sanitizeCSVCell(cat.Name))
-		if cat.ParentCategoryID.Valid {
-			f.SetCellValue(sheetName, fmt.Sprintf("C%d", row), uuid.UUID(cat.ParentCategoryID.Bytes).String())
-		}
-		f.SetCellValue(sheetName, fmt.Sprintf("D%d", row), sanitizeCSVCell(ptrToString(cat.Description)))
-		f.SetCellValue(sheetName, fmt.Sprintf("E%d", row), cat.IsArchived)
-		f.SetCellValue(sheetName, fmt.Sprintf("F%d", row), formatTimestamp(cat.CreatedAt))
-		f.SetCellValue(sheetName, fmt.Sprintf("G%d", row), formatTimestamp(cat.UpdatedAt))
+	sw, err := f.NewStreamWriter(sheetName)
+	if err != nil {
+		return fmt.Errorf("failed to create %s stream writer: %w", sheetName, err)
 	}
 
-	// Freeze first row
-	f.SetPanes(sheetName, &excelize.Panes{
+	// Panes and column widths must be configured before any row is written.
+	if err := sw.SetPanes(&excelize.Panes{
 		Freeze:      true,
 		XSplit:      0,
 		YSplit:      1,
 		TopLeftCell: "A2",
 		ActivePane:  "bottomLeft",
-	})
-
-	return nil
-}
-
-// createLabelsSheet creates the Labels sheet
-func (s *WorkspaceBackupService) createLabelsSheet(f *excelize.File, labels []queries.WarehouseLabel, headerStyle int) error {
-	sheetName := "Labels"
-	_, err := f.NewSheet(sheetName)
-	if err != nil {
+	}); err != nil {
+		return err
+	}
+	if err := sw.SetColWidth(1, len(headers), 20); err != nil {
 		return err
 	}
 
-	headers := []string{"ID", "Name", "Color", "Description", "Archived", headerCreatedAt, headerUpdatedAt}
+	headerRow := make([]interface{}, len(headers))
 	for i, header := range headers {
-		cell, _ := excelize.CoordinatesToCellName(i+1, 1)
-		f.SetCellValue(sheetName, cell, header)
-		f.SetCellStyle(sheetName, cell, cell, headerStyle)
+		headerRow[i] = excelize.Cell{StyleID: headerStyle, Value: header}
+	}
+	if err := sw.SetRow("A1", headerRow); err != nil {
+		return fmt.Errorf("failed to write %s header: %w", sheetName, err)
 	}
 
-	for i, label := range labels {
-		row := i + 2
-		f.SetCellValue(sheetName, fmt.Sprintf("A%d", row), label.ID.String())
-		f.SetCellValue(sheetName, fmt.Sprintf("B%d", row), sanitizeCSVCell(label.Name))
-		f.SetCellValue(sheetName, fmt.Sprintf("C%d", row), sanitizeCSVCell(ptrToString(label.Color)))
-		f.SetCellValue(sheetName, fmt.Sprintf("D%d", row), sanitizeCSVCell(ptrToString(label.Description)))
-		f.SetCellValue(sheetName, fmt.Sprintf("E%d", row), label.IsArchived)
-		f.SetCellValue(sheetName, fmt.Sprintf("F%d", row), formatTimestamp(label.CreatedAt))
-		f.SetCellValue(sheetName, fmt.Sprintf("G%d", row), formatTimestamp(label.UpdatedAt))
+	// Every row starts in column A, so the anchor cell is built directly
+	// instead of going through the generic coordinate conversion.
+	row := make([]interface{}, 0, len(headers))
+	for i, record := range records {
+		row = toRow(row[:0], record)
+		if err := sw.SetRow("A"+strconv.Itoa(i+2), row); err != nil {
+			return fmt.Errorf("failed to write %s row %d: %w", sheetName, i+2, err)
+		}
 	}
 
-	f.SetPanes(sheetName, &excelize.Panes{
-		Freeze:      true,
-		XSplit:      0,
-		YSplit:      1,
-		TopLeftCell: "A2",
-		ActivePane:  "bottomLeft",
-	})
+	return sw.Flush()
+}
 
+// nullUUIDCell returns the UUID as a string, or nil so the cell stays empty
+func nullUUIDCell(id pgtype.UUID) interface{} {
+	if id.Valid {
+		return uuid.UUID(id.Bytes).String()
+	}
 	return nil
 }
 
+// createCategoriesSheet creates the Categories sheet
+func (s *WorkspaceBackupService) createCategoriesSheet(f *excelize.File, categories []queries.WarehouseCategory, headerStyle int) error {
+	headers := []string{"ID", "Name", "Parent Category ID", "Description", "Archived", headerCreatedAt, headerUpdatedAt}
+	return writeSheet(f, "Categories", headers, categories, headerStyle, func(row []interface{}, cat queries.WarehouseCategory) []interface{} {
+		return append(row,
+			cat.ID.String(),
+			sanitizeCSVCell(cat.Name),
+			nullUUIDCell(cat.ParentCategoryID),
+			sanitizeCSVCell(ptrToString(cat.Description)),
+			cat.IsArchived,
+			formatTimestamp(cat.CreatedAt),
+			formatTimestamp(cat.UpdatedAt),
+		)
+	})
+}
+
+// createLabelsSheet creates the Labels sheet
+func (s *WorkspaceBackupService) createLabelsSheet(f *excelize.File, labels []queries.WarehouseLabel, headerStyle int) error {
+	headers := []string{"ID", "Name", "Color", "Description", "Archived", headerCreatedAt, headerUpdatedAt}
+	return writeSheet(f, "Labels", headers, labels, headerStyle, func(row []interface{}, label queries.WarehouseLabel) []interface{} {
+		return append(row,
+			label.ID.String(),
+			sanitizeCSVCell(label.Name),
+			sanitizeCSVCell(ptrToString(label.Color)),
+			sanitizeCSVCell(ptrToString(label.Description)),
+			label.IsArchived,
+			formatTimestamp(label.CreatedAt),
+			formatTimestamp(label.UpdatedAt),
+		)
+	})
+}
+
 // createCompaniesSheet creates the Companies sheet
 func (s *WorkspaceBackupService) createCompaniesSheet(f *excelize.File, companies []queries.WarehouseCompany, headerStyle int) error {
-	sheetName := "Companies"
-	_, err := f.NewSheet(sheetName)
-	if err != nil {
-		return err
-	}
-
 	headers := []string{"ID", "Name", "Website", "Notes", "Archived", headerCreatedAt, headerUpdatedAt}
-	for i, header := range headers {
-		cell, _ := excelize.CoordinatesToCellName(i+1, 1)
-		f.SetCellValue(sheetName, cell, header)
-		f.SetCellStyle(sheetName, cell, cell, headerStyle)
-	}
-
-	for i, company := range companies {
-		row := i + 2
-		f.SetCellValue(sheetName, fmt.Sprintf("A%d", row), company.ID.String())
-		f.SetCellValue(sheetName, fmt.Sprintf("B%d", row), sanitizeCSVCell(company.Name))
-		f.SetCellValue(sheetName, fmt.Sprintf("C%d", row), sanitizeCSVCell(ptrToString(company.Website)))
-		f.SetCellValue(sheetName, fmt.Sprintf("D%d", row), sanitizeCSVCell(ptrToString(company.Notes)))
-		f.SetCellValue(sheetName, fmt.Sprintf("E%d", row), company.IsArchived)
-		f.SetCellValue(sheetName, fmt.Sprintf("F%d", row), formatTimestamp(company.CreatedAt))
-		f.SetCellValue(sheetName, fmt.Sprintf("G%d", row), formatTimestamp(company.UpdatedAt))
-	}
-
-	f.SetPanes(sheetName, &excelize.Panes{
-		Freeze:      true,
-		XSplit:      0,
-		YSplit:      1,
-		TopLeftCell: "A2",
-		ActivePane:  "bottomLeft",
+	return writeSheet(f, "Companies", headers, companies, headerStyle, func(row []interface{}, company queries.WarehouseCompany) []interface{} {
+		return append(row,
+			company.ID.String(),
+			sanitizeCSVCell(company.Name),
+			sanitizeCSVCell(ptrToString(company.Website)),
+			sanitizeCSVCell(ptrToString(company.Notes)),
+			company.IsArchived,
+			formatTimestamp(company.CreatedAt),
+			formatTimestamp(company.UpdatedAt),
+		)
 	})
-
-	return nil
 }
 
 // createLocationsSheet creates the Locations sheet
 func (s *WorkspaceBackupService) createLocationsSheet(f *excelize.File, locations []queries.WarehouseLocation, headerStyle int) error {
-	sheetName := "Locations"
-	_, err := f.NewSheet(sheetName)
-	if err != nil {
-		return err
-	}
-
 	headers := []string{"ID", "Name", "Parent Location ID", "Description", headerShortCode, "Archived", headerCreatedAt, headerUpdatedAt}
-	for i, header := range headers {
-		cell, _ := excelize.CoordinatesToCellName(i+1, 1)
-		f.SetCellValue(sheetName, cell, header)
-		f.SetCellStyle(sheetName, cell, cell, headerStyle)
-	}
-
-	for i, loc := range locations {
-		row := i + 2
-		f.SetCellValue(sheetName, fmt.Sprintf("A%d", row), loc.ID.String())
-		f.SetCellValue(sheetName, fmt.Sprintf("B%d", row), sanitizeCSVCell(loc.Name))
-		if loc.ParentLocation.Valid {
-			f.SetCellValue(sheetName, fmt.Sprintf("C%d", row), uuid.UUID(loc.ParentLocation.Bytes).String())
-		}
-		f.SetCellValue(sheetName, fmt.Sprintf("D%d", row), sanitizeCSVCell(ptrToString(loc.Description)))
-		f.SetCellValue(sheetName, fmt.Sprintf("E%d", row), sanitizeCSVCell(loc.ShortCode))
-		f.SetCellValue(sheetName, fmt.Sprintf("F%d", row), loc.IsArchived)
-		f.SetCellValue(sheetName, fmt.Sprintf("G%d", row), formatTimestamp(loc.CreatedAt))
-		f.SetCellValue(sheetName, fmt.Sprintf("H%d", row), formatTimestamp(loc.UpdatedAt))
-	}
-
-	f.SetPanes(sheetName, &excelize.Panes{
-		Freeze:      true,
-		XSplit:      0,
-		YSplit:      1,
-		TopLeftCell: "A2",
-		ActivePane:  "bottomLeft",
+	return writeSheet(f, "Locations", headers, locations, headerStyle, func(row []interface{}, loc queries.WarehouseLocation) []interface{} {
+		return append(row,
+			loc.ID.String(),
+			sanitizeCSVCell(loc.Name),
+			nullUUIDCell(loc.ParentLocation),
+			sanitizeCSVCell(ptrToString(loc.Description)),
+			sanitizeCSVCell(loc.ShortCode),
+			loc.IsArchived,
+			formatTimestamp(loc.CreatedAt),
+			formatTimestamp(loc.UpdatedAt),
+		)
 	})
-
-	return nil
 }
 
 // createBorrowersSheet creates the Borrowers sheet
 func (s *WorkspaceBackupService) createBorrowersSheet(f *excelize.File, borrowers []queries.WarehouseBorrower, headerStyle int) error {
-	sheetName := "Borrowers"
-	_, err := f.NewSheet(sheetName)
-	if err != nil {
-		return err
-	}
-
 	headers := []string{"ID", "Name", "Email", "Phone", "Notes", "Archived", headerCreatedAt, headerUpdatedAt}
-	for i, header := range headers {
-		cell, _ := excelize.CoordinatesToCellName(i+1, 1)
-		f.SetCellValue(sheetName, cell, header)
-		f.SetCellStyle(sheetName, cell, cell, headerStyle)
-	}
-
-	for i, borrower := range borrowers {
-		row := i + 2
-		f.SetCellValue(sheetName, fmt.Sprintf("A%d", row), borrower.ID.String())
-		f.SetCellValue(sheetName, fmt.Sprintf("B%d", row), sanitizeCSVCell(borrower.Name))
-		f.SetCellValue(sheetName, fmt.Sprintf("C%d", row), sanitizeCSVCell(ptrToString(borrower.Email)))
-		f.SetCellValue(sheetName, fmt.Sprintf("D%d", row), sanitizeCSVCell(ptrToString(borrower.Phone)))
-		f.SetCellValue(sheetName, fmt.Sprintf("E%d", row), sanitizeCSVCell(ptrToString(borrower.Notes)))
-		f.SetCellValue(sheetName, fmt.Sprintf("F%d", row), borrower.IsArchived)
-		f.SetCellValue(sheetName, fmt.Sprintf("G%d", row), formatTimestamp(borrower.CreatedAt))
-		f.SetCellValue(sheetName, fmt.Sprintf("H%d", row), formatTimestamp(borrower.UpdatedAt))
-	}
-
-	f.SetPanes(sheetName, &excelize.Panes{
-		Freeze:      true,
-		XSplit:      0,
-		YSplit:      1,
-		TopLeftCell: "A2",
-		ActivePane:  "bottomLeft",
+	return writeSheet(f, "Borrowers", headers, borrowers, headerStyle, func(row []interface{}, borrower queries.WarehouseBorrower) []interface{} {
+		return append(row,
+			borrower.ID.String(),
+			sanitizeCSVCell(borrower.Name),
+			sanitizeCSVCell(ptrToString(borrower.Email)),
+			sanitizeCSVCell(ptrToString(borrower.Phone)),
+			sanitizeCSVCell(ptrToString(borrower.Notes)),
+			borrower.IsArchived,
+			formatTimestamp(borrower.CreatedAt),
+			formatTimestamp(borrower.UpdatedAt),
+		)
 	})
-
-	return nil
 }
 
 // createItemsSheet creates the Items sheet
 func (s *WorkspaceBackupService) createItemsSheet(f *excelize.File, items []queries.WarehouseItem, headerStyle int) error {
-	sheetName := "Items"
-	_, err := f.NewSheet(sheetName)
-	if err != nil {
-		return err
-	}
-
 	headers := []string{"ID", "SKU", "Name", "Description", "Category ID", "Brand", "Model", "Manufacturer", "Barcode", headerShortCode, "Min Stock", "Archived", headerCreatedAt, headerUpdatedAt}
-	for i, header := range headers {
-		cell, _ := excelize.CoordinatesToCellName(i+1, 1)
-		f.SetCellValue(sheetName, cell, header)
-		f.SetCellStyle(sheetName, cell, cell, headerStyle)
-	}
-
-	for i, item := range items {
-		row := i + 2
-		f.SetCellValue(sheetName, fmt.Sprintf("A%d", row), item.ID.String())
-		f.SetCellValue(sheetName, fmt.Sprintf("B%d", row), sanitizeCSVCell(item.Sku))
-		f.SetCellValue(sheetName, fmt.Sprintf("C%d", row), sanitizeCSVCell(item.Name))
-		f.SetCellValue(sheetName, fmt.Sprintf("D%d", row), sanitizeCSVCell(ptrToString(item.Description)))
-		if item.CategoryID.Valid {
-			f.SetCellValue(sheetName, fmt.Sprintf("E%d", row), uuid.UUID(item.CategoryID.Bytes).String())
-		}
-		f.SetCellValue(sheetName, fmt.Sprintf("F%d", row), sanitizeCSVCell(ptrToString(item.Brand)))
-		f.SetCellValue(sheetName, fmt.Sprintf("G%d", row), sanitizeCSVCell(ptrToString(item.Model)))
-		f.SetCellValue(sheetName, fmt.Sprintf("H%d", row), sanitizeCSVCell(ptrToString(item.Manufacturer)))
-		f.SetCellValue(sheetName, fmt.Sprintf("I%d", row), sanitizeCSVCell(ptrToString(item.Barcode)))
-		f.SetCellValue(sheetName, fmt.Sprintf("J%d", row), sanitizeCSVCell(item.ShortCode))
-		f.SetCellValue(sheetName, fmt.Sprintf("K%d", row), item.MinStockLevel)
-		f.SetCellValue(sheetName, fmt.Sprintf("L%d", row), item.IsArchived)
-		f.SetCellValue(sheetName, fmt.Sprintf("M%d", row), formatTimestamp(item.CreatedAt))
-		f.SetCellValue(sheetName, fmt.Sprintf("N%d", row), formatTimestamp(item.UpdatedAt))
-	}
-
-	f.SetPanes(sheetName, &excelize.Panes{
-		Freeze:      true,
-		XSplit:      0,
-		YSplit:      1,
-		TopLeftCell: "A2",
-		ActivePane:  "bottomLeft",
+	return writeSheet(f, "Items", headers, items, headerStyle, func(row []interface{}, item queries.WarehouseItem) []interface{} {
+		return append(row,
+			item.ID.String(),
+			sanitizeCSVCell(item.Sku),
+			sanitizeCSVCell(item.Name),
+			sanitizeCSVCell(ptrToString(item.Description)),
+			nullUUIDCell(item.CategoryID),
+			sanitizeCSVCell(ptrToString(item.Brand)),
+			sanitizeCSVCell(ptrToString(item.Model)),
+			sanitizeCSVCell(ptrToString(item.Manufacturer)),
+			sanitizeCSVCell(ptrToString(item.Barcode)),
+			sanitizeCSVCell(item.ShortCode),
+			item.MinStockLevel,
+			item.IsArchived,
+			formatTimestamp(item.CreatedAt),
+			formatTimestamp(item.UpdatedAt),
+		)
 	})
-
-	return nil
 }
 
 // createContainersSheet creates the Containers sheet
 func (s *WorkspaceBackupService) createContainersSheet(f *excelize.File, containers []queries.WarehouseContainer, headerStyle int) error {
-	sheetName := "Containers"
-	_, err := f.NewSheet(sheetName)
-	if err != nil {
-		return err
-	}
-
 	headers := []string{"ID", "Name", "Location ID", "Description", "Capacity", headerShortCode, "Archived", headerCreatedAt, headerUpdatedAt}
-	for i, header := range headers {
-		cell, _ := excelize.CoordinatesToCellName(i+1, 1)
-		f.SetCellValue(sheetName, cell, header)
-		f.SetCellStyle(sheetName, cell, cell, headerStyle)
-	}
-
-	for i, container := range containers {
-		row := i + 2
-		f.SetCellValue(sheetName, fmt.Sprintf("A%d", row), container.ID.String())
-		f.SetCellValue(sheetName, fmt.Sprintf("B%d", row), sanitizeCSVCell(container.Name))
-		f.SetCellValue(sheetName, fmt.Sprintf("C%d", row), container.LocationID.String())
-		f.SetCellValue(sheetName, fmt.Sprintf("D%d", row), sanitizeCSVCell(ptrToString(container.Description)))
-		f.SetCellValue(sheetName, fmt.Sprintf("E%d", row), sanitizeCSVCell(ptrToString(container.Capacity)))
-		f.SetCellValue(sheetName, fmt.Sprintf("F%d", row), sanitizeCSVCell(container.ShortCode))
-		f.SetCellValue(sheetName, fmt.Sprintf("G%d", row), container.IsArchived)
-		f.SetCellValue(sheetName, fmt.Sprintf("H%d", row), formatTimestamp(container.CreatedAt))
-		f.SetCellValue(sheetName, fmt.Sprintf("I%d", row), formatTimestamp(container.UpdatedAt))
-	}
-
-	f.SetPanes(sheetName, &excelize.Panes{
-		Freeze:      true,
-		XSplit:      0,
-		YSplit:      1,
-		TopLeftCell: "A2",
-		ActivePane:  "bottomLeft",
+	return writeSheet(f, "Containers", headers, containers, headerStyle, func(row []interface{}, container queries.WarehouseContainer) []interface{} {
+		return append(row,
+			container.ID.String(),
+			sanitizeCSVCell(container.Name),
+			container.LocationID.String(),
+			sanitizeCSVCell(ptrToString(container.Description)),
+			sanitizeCSVCell(ptrToString(container.Capacity)),
+			sanitizeCSVCell(container.ShortCode),
+			container.IsArchived,
+			formatTimestamp(container.CreatedAt),
+			formatTimestamp(container.UpdatedAt),
+		)
 	})
-
-	return nil
 }
 
 // createInventorySheet creates the Inventory sheet
 func (s *WorkspaceBackupService) createInventorySheet(f *excelize.File, inventory []queries.WarehouseInventory, headerStyle int) error {
-	sheetName := "Inventory"
-	_, err := f.NewSheet(sheetName)
-	if err != nil {
-		return err
-	}
-
 	headers := []string{"ID", "Item ID", "Location ID", "Container ID", "Quantity", "Condition", "Status", "Notes", headerCreatedAt, headerUpdatedAt}
-	for i, header := range headers {
-		cell, _ := excelize.CoordinatesToCellName(i+1, 1)
-		f.SetCellValue(sheetName, cell, header)
-		f.SetCellStyle(sheetName, cell, cell, headerStyle)
-	}
-
-	for i, inv := range inventory {
-		row := i + 2
-		f.SetCellValue(sheetName, fmt.Sprintf("A%d", row), inv.ID.String())
-		f.SetCellValue(sheetName, fmt.Sprintf("B%d", row), inv.ItemID.String())
-		f.SetCellValue(sheetName, fmt.Sprintf("C%d", row), inv.LocationID.String())
-		if inv.ContainerID.Valid {
-			f.SetCellValue(sheetName, fmt.Sprintf("D%d", row), uuid.UUID(inv.ContainerID.Bytes).String())
-		}
-		f.SetCellValue(sheetName, fmt.Sprintf("E%d", row), inv.Quantity)
+	return writeSheet(f, "Inventory", headers, inventory, headerStyle, func(row []interface{}, inv queries.WarehouseInventory) []interface{} {
+		var condition, status interface{}
 		if inv.Condition.Valid {
-			f.SetCellValue(sheetName, fmt.Sprintf("F%d", row), string(inv.Condition.WarehouseItemConditionEnum))
+			condition = string(inv.Condition.WarehouseItemConditionEnum)
 		}
 		if inv.Status.Valid {
-			f.SetCellValue(sheetName, fmt.Sprintf("G%d", row), string(inv.Status.WarehouseItemStatusEnum))
+			status = string(inv.Status.WarehouseItemStatusEnum)
 		}
-		f.SetCellValue(sheetName, fmt.Sprintf("H%d", row), sanitizeCSVCell(ptrToString(inv.Notes)))
-		f.SetCellValue(sheetName, fmt.Sprintf("I%d", row), formatTimestamp(inv.CreatedAt))
-		f.SetCellValue(sheetName, fmt.Sprintf("J%d", row), formatTimestamp(inv.UpdatedAt))
-	}
-
-	f.SetPanes(sheetName, &excelize.Panes{
-		Freeze:      true,
-		XSplit:      0,
-		YSplit:      1,
-		TopLeftCell: "A2",
-		ActivePane:  "bottomLeft",
+		return append(row,
+			inv.ID.String(),
+			inv.ItemID.String(),
+			inv.LocationID.String(),
+			nullUUIDCell(inv.ContainerID),
+			inv.Quantity,
+			condition,
+			status,
+			sanitizeCSVCell(ptrToString(inv.Notes)),
+			formatTimestamp(inv.CreatedAt),
+			formatTimestamp(inv.UpdatedAt),
+		)
 	})
-
-	return nil
 }
 
 // createLoansSheet creates the Loans sheet
 func (s *WorkspaceBackupService) createLoansSheet(f *excelize.File, loans []queries.WarehouseLoan, headerStyle int) error {
-	sheetName := "Loans"
-	_, err := f.NewSheet(sheetName)
-	if err != nil {
-		return err
-	}
-
 	headers := []string{"ID", "Borrower ID", "Inventory ID", "Quantity", "Loaned At", "Due Date", "Returned At", "Notes", headerCreatedAt, headerUpdatedAt}
-	for i, header := range headers {
-		cell, _ := excelize.CoordinatesToCellName(i+1, 1)
-		f.SetCellValue(sheetName, cell, header)
-		f.SetCellStyle(sheetName, cell, cell, headerStyle)
-	}
-
-	for i, loan := range loans {
-		row := i + 2
-		f.SetCellValue(sheetName, fmt.Sprintf("A%d", row), loan.ID.String())
-		f.SetCellValue(sheetName, fmt.Sprintf("B%d", row), loan.BorrowerID.String())
-		f.SetCellValue(sheetName, fmt.Sprintf("C%d", row), loan.InventoryID.String())
-		f.SetCellValue(sheetName, fmt.Sprintf("D%d", row), loan.Quantity)
-		f.SetCellValue(sheetName, fmt.Sprintf("E%d", row), formatTimestamp(loan.LoanedAt))
-		f.SetCellValue(sheetName, fmt.Sprintf("F%d", row), formatDate(loan.DueDate))
-		f.SetCellValue(sheetName, fmt.Sprintf("G%d", row), formatTimestamp(loan.ReturnedAt))
-		f.SetCellValue(sheetName, fmt.Sprintf("H%d", row), sanitizeCSVCell(ptrToString(loan.Notes)))
-		f.SetCellValue(sheetName, fmt.Sprintf("I%d", row), formatTimestamp(loan.CreatedAt))
-		f.SetCellValue(sheetName, fmt.Sprintf("J%d", row), formatTimestamp(loan.UpdatedAt))
-	}
-
-	f.SetPanes(sheetName, &excelize.Panes{
-		Freeze:      true,
-		XSplit:      0,
-		YSplit:      1,
-		TopLeftCell: "A2",
-		ActivePane:  "bottomLeft",
+	return writeSheet(f, "Loans", headers, loans, headerStyle, func(row []interface{}, loan queries.WarehouseLoan) []interface{} {
+		return append(row,
+			loan.ID.String(),
+			loan.BorrowerID.String(),
+			loan.InventoryID.String(),
+			loan.Quantity,
+			formatTimestamp(loan.LoanedAt),
+			formatDate(loan.DueDate),
+			formatTimestamp(loan.ReturnedAt),
+			sanitizeCSVCell(ptrToString(loan.Notes)),
+			formatTimestamp(loan.CreatedAt),
+			formatTimestamp(loan.UpdatedAt),
+		)
 	})
-
-	return nil
 }
 
 // createAttachmentsSheet creates the Attachments sheet
 func (s *WorkspaceBackupService) createAttachmentsSheet(f *excelize.File, attachments []queries.WarehouseAttachment, headerStyle int) error {
-	sheetName := "Attachments"
-	_, err := f.NewSheet(sheetName)
-	if err != nil {
-		return err
-	}
-
 	headers := []string{"ID", "Item ID", "File ID", "Type", "Title", "Is Primary", "External Doc ID", headerCreatedAt, headerUpdatedAt}
-	for i, header := range headers {
-		cell, _ := excelize.CoordinatesToCellName(i+1, 1)
-		f.SetCellValue(sheetName, cell, header)
-		f.SetCellStyle(sheetName, cell, cell, headerStyle)
-	}
-
-	for i, att := range attachments {
-		row := i + 2
-		f.SetCellValue(sheetName, fmt.Sprintf("A%d", row), att.ID.String())
-		f.SetCellValue(sheetName, fmt.Sprintf("B%d", row), att.ItemID.String())
-		if att.FileID.Valid {
-			f.SetCellValue(sheetName, fmt.Sprintf("C%d", row), uuid.UUID(att.FileID.Bytes).String())
-		}
-		f.SetCellValue(sheetName, fmt.Sprintf("D%d", row), string(att.AttachmentType))
-		f.SetCellValue(sheetName, fmt.Sprintf("E%d", row), sanitizeCSVCell(ptrToString(att.Title)))
-		f.SetCellValue(sheetName, fmt.Sprintf("F%d", row), att.IsPrimary)
-		f.SetCellValue(sheetName, fmt.Sprintf("G%d", row), sanitizeCSVCell(ptrToString(att.ExternalDocID)))
-		f.SetCellValue(sheetName, fmt.Sprintf("H%d", row), formatTimestamp(att.CreatedAt))
-		f.SetCellValue(sheetName, fmt.Sprintf("I%d", row), formatTimestamp(att.UpdatedAt))
-	}
-
-	f.SetPanes(sheetName, &excelize.Panes{
-		Freeze:      true,
-		XSplit:      0,
-		YSplit:      1,
-		TopLeftCell: "A2",
-		ActivePane:  "bottomLeft",
+	return writeSheet(f, "Attachments", headers, attachments, headerStyle, func(row []interface{}, att queries.WarehouseAttachment) []interface{} {
+		return append(row,
+			att.ID.String(),
+			att.ItemID.String(),
+			nullUUIDCell(att.FileID),
+			string(att.AttachmentType),
+			sanitizeCSVCell(ptrToString(att.Title)),
+			att.IsPrimary,
+			sanitizeCSVCell(ptrToString(att.ExternalDocID)),
+			formatTimestamp(att.CreatedAt),
+			formatTimestamp(att.UpdatedAt),
+		)
 	})
-
-	return nil
 }
@@ -4,6 +4,7 @@ import (
 	"bytes"
 	"context"
 	"encoding/json"
+	"fmt"
 	"testing"
 	"time"
 
@@ -105,6 +106,11 @@ func (m *MockWorkspaceBackupQueries) ListAllAttachments(ctx context.Context, wor
 	return args.Get(0).([]queries.WarehouseAttachment), args.Error(1)
 }
 
+func (m *MockWorkspaceBackupQueries) GetWorkspaceExportVersion(ctx context.Context, workspaceID uuid.UUID) (queries.GetWorkspaceExportVersionRow, error) {
+	args := m.Called(ctx, workspaceID)
+	return args.Get(0).(queries.GetWorkspaceExportVersionRow), args.Error(1)
+}
+
 func (m *MockWorkspaceBackupQueries) CreateWorkspaceExport(ctx context.Context, arg queries.CreateWorkspaceExportParams) error {
 	args := m.Called(ctx, arg)
 	return args.Error(0)
@@ -384,13 +390,14 @@ func TestExportWorkspace_Success_Excel(t *testing.T) {
 	mockQueries.On("ListAllInventory", ctx, workspaceID).Return(inventory, nil)
 	mockQueries.On("ListAllLoans", ctx, workspaceID).Return(loans, nil)
 	mockQueries.On("ListAllAttachments", ctx, workspaceID).Return(attachments, nil)
-	mockQueries.On("CreateWorkspaceExport", ctx, mock.AnythingOfType("queries.CreateWorkspaceExportParams")).Return(nil)
+	mockQueries.On("CreateWorkspaceExport", mock.Anything, mock.AnythingOfType("queries.CreateWorkspaceExportParams")).Return(nil)
 
 	// Create service with mock
 	svc := &WorkspaceBackupService{queries: mockQueries}
 
 	// Execute
 	result, err := svc.ExportWorkspace(ctx, workspaceID, FormatExcel, false, exportedBy)
+	svc.audits.Wait()
 
 	// Verify
 	assert.NoError(t, err)
@@ -453,11 +460,12 @@ func TestExportWorkspace_Success_JSON(t *testing.T) {
 	mockQueries.On("ListAllInventory", ctx, workspaceID).Return([]queries.WarehouseInventory{}, nil)
 	mockQueries.On("ListAllLoans", ctx, workspaceID).Return([]queries.WarehouseLoan{}, nil)
 	mockQueries.On("ListAllAttachments", ctx, workspaceID).Return([]queries.WarehouseAttachment{}, nil)
-	mockQueries.On("CreateWorkspaceExport", ctx, mock.AnythingOfType("queries.CreateWorkspaceExportParams")).Return(nil)
+	mockQueries.On("CreateWorkspaceExport", mock.Anything, mock.AnythingOfType("queries.CreateWorkspaceExportParams")).Return(nil)
 
 	svc := &WorkspaceBackupService{queries: mockQueries}
 
 	result, err := svc.ExportWorkspace(ctx, workspaceID, FormatJSON, false, exportedBy)
+	svc.audits.Wait()
 
 	assert.NoError(t, err)
 	assert.NotNil(t, result)
@@ -494,11 +502,12 @@ func TestExportWorkspace_EmptyWorkspace(t *testing.T) {
 	mockQueries.On("ListAllInventory", ctx, workspaceID).Return([]queries.WarehouseInventory{}, nil)
 	mockQueries.On("ListAllLoans", ctx, workspaceID).Return([]queries.WarehouseLoan{}, nil)
 	mockQueries.On("ListAllAttachments", ctx, workspaceID).Return([]queries.WarehouseAttachment{}, nil)
-	mockQueries.On("CreateWorkspaceExport", ctx, mock.AnythingOfType("queries.CreateWorkspaceExportParams")).Return(nil)
+	mockQueries.On("CreateWorkspaceExport", mock.Anything, mock.AnythingOfType("queries.CreateWorkspaceExportParams")).Return(nil)
 
 	svc := &WorkspaceBackupService{queries: mockQueries}
 
 	result, err := svc.ExportWorkspace(ctx, workspaceID, FormatExcel, false, exportedBy)
+	svc.audits.Wait()
 
 	assert.NoError(t, err)
 	assert.NotNil(t, result)
@@ -509,6 +518,34 @@ func TestExportWorkspace_EmptyWorkspace(t *testing.T) {
 	mockQueries.AssertExpectations(t)
 }
 
+func TestExportWorkspace_Excel_ContextCanceled(t *testing.T) {
+	ctx, cancel := context.WithCancel(context.Background())
+	cancel()
+	workspaceID := uuid.New()
+	exportedBy := uuid.New()
+
+	mockQueries := new(MockWorkspaceBackupQueries)
+
+	mockQueries.On("ListAllCategories", ctx, mock.Anything).Return([]queries.WarehouseCategory{}, nil)
+	mockQueries.On("ListAllLabels", ctx, mock.Anything).Return([]queries.WarehouseLabel{}, nil)
+	mockQueries.On("ListAllCompanies", ctx, mock.Anything).Return([]queries.WarehouseCompany{}, nil)
+	mockQueries.On("ListAllLocations", ctx, mock.Anything).Return([]queries.WarehouseLocation{}, nil)
+	mockQueries.On("ListAllBorrowers", ctx, mock.Anything).Return([]queries.WarehouseBorrower{}, nil)
+	mockQueries.On("ListAllItems", ctx, mock.Anything).Return([]queries.WarehouseItem{}, nil)
+	mockQueries.On("ListAllContainers", ctx, mock.Anything).Return([]queries.WarehouseContainer{}, nil)
+	mockQueries.On("ListAllInventory", ctx, workspaceID).Return([]queries.WarehouseInventory{}, nil)
+	mockQueries.On("ListAllLoans", ctx, workspaceID).Return([]queries.WarehouseLoan{}, nil)
+	mockQueries.On("ListAllAttachments", ctx, workspaceID).Return([]queries.WarehouseAttachment{}, nil)
+
+	svc := &WorkspaceBackupService{queries: mockQueries}
+
+	result, err := svc.ExportWorkspace(ctx, workspaceID, FormatExcel, false, exportedBy)
+
+	assert.ErrorIs(t, err, context.Canceled)
+	assert.Nil(t, result)
+	mockQueries.AssertNotCalled(t, "CreateWorkspaceExport", mock.Anything, mock.Anything)
+}
+
 func TestExportWorkspace_UnsupportedFormat(t *testing.T) {
 	ctx := context.Background()
 	workspaceID := uuid.New()
@@ -792,11 +829,12 @@ func TestExportWorkspace_AuditRecordError_ContinuesSuccessfully(t *testing.T) {
 	mockQueries.On("ListAllLoans", ctx, workspaceID).Return([]queries.WarehouseLoan{}, nil)
 	mockQueries.On("ListAllAttachments", ctx, workspaceID).Return([]queries.WarehouseAttachment{}, nil)
 	// Audit record fails - should NOT cause export to fail
-	mockQueries.On("CreateWorkspaceExport", ctx, mock.AnythingOfType("queries.CreateWorkspaceExportParams")).Return(assert.AnError)
+	mockQueries.On("CreateWorkspaceExport", mock.Anything, mock.AnythingOfType("queries.CreateWorkspaceExportParams")).Return(assert.AnError)
 
 	svc := &WorkspaceBackupService{queries: mockQueries}
 
 	result, err := svc.ExportWorkspace(ctx, workspaceID, FormatExcel, false, exportedBy)
+	svc.audits.Wait()
 
 	// Export should succeed even if audit record fails
 	assert.NoError(t, err)
@@ -837,11 +875,12 @@ func TestExportWorkspace_WithIncludeArchived(t *testing.T) {
 	mockQueries.On("ListAllInventory", ctx, workspaceID).Return([]queries.WarehouseInventory{}, nil)
 	mockQueries.On("ListAllLoans", ctx, workspaceID).Return([]queries.WarehouseLoan{}, nil)
 	mockQueries.On("ListAllAttachments", ctx, workspaceID).Return([]queries.WarehouseAttachment{}, nil)
-	mockQueries.On("CreateWorkspaceExport", ctx, mock.AnythingOfType("queries.CreateWorkspaceExportParams")).Return(nil)
+	mockQueries.On("CreateWorkspaceExport", mock.Anything, mock.AnythingOfType("queries.CreateWorkspaceExportParams")).Return(nil)
 
 	svc := &WorkspaceBackupService{queries: mockQueries}
 
 	_, err := svc.ExportWorkspace(ctx, workspaceID, FormatExcel, true, exportedBy)
+	svc.audits.Wait()
 
 	assert.NoError(t, err)
 	mockQueries.AssertExpectations(t)
@@ -871,11 +910,12 @@ func TestExportWorkspace_ExcelContainsCorrectHeaders(t *testing.T) {
 	mockQueries.On("ListAllInventory", ctx, workspaceID).Return([]queries.WarehouseInventory{}, nil)
 	mockQueries.On("ListAllLoans", ctx, workspaceID).Return([]queries.WarehouseLoan{}, nil)
 	mockQueries.On("ListAllAttachments", ctx, workspaceID).Return([]queries.WarehouseAttachment{}, nil)
-	mockQueries.On("CreateWorkspaceExport", ctx, mock.AnythingOfType("queries.CreateWorkspaceExportParams")).Return(nil)
+	mockQueries.On("CreateWorkspaceExport", mock.Anything, mock.AnythingOfType("queries.CreateWorkspaceExportParams")).Return(nil)
 
 	svc := &WorkspaceBackupService{queries: mockQueries}
 
 	result, err := svc.ExportWorkspace(ctx, workspaceID, FormatExcel, false, exportedBy)
+	svc.audits.Wait()
 	assert.NoError(t, err)
 
 	f, err := excelize.OpenReader(bytes.NewReader(result.Data))
@@ -916,11 +956,12 @@ func TestExportWorkspace_ExcelContainsCorrectData(t *testing.T) {
 	mockQueries.On("ListAllInventory", ctx, workspaceID).Return([]queries.WarehouseInventory{}, nil)
 	mockQueries.On("ListAllLoans", ctx, workspaceID).Return([]queries.WarehouseLoan{}, nil)
 	mockQueries.On("ListAllAttachments", ctx, workspaceID).Return([]queries.WarehouseAttachment{}, nil)
-	mockQueries.On("CreateWorkspaceExport", ctx, mock.AnythingOfType("queries.CreateWorkspaceExportParams")).Return(nil)
+	mockQueries.On("CreateWorkspaceExport", mock.Anything, mock.AnythingOfType("queries.CreateWorkspaceExportParams")).Return(nil)
 
 	svc := &WorkspaceBackupService{queries: mockQueries}
 
 	result, err := svc.ExportWorkspace(ctx, workspaceID, FormatExcel, false, exportedBy)
+	svc.audits.Wait()
 	assert.NoError(t, err)
 
 	f, err := excelize.OpenReader(bytes.NewReader(result.Data))
@@ -945,6 +986,135 @@ func TestExportWorkspace_ExcelContainsCorrectData(t *testing.T) {
 // Helper Function Tests
 // =============================================================================
 
+func TestExportETag(t *testing.T) {
+	ctx := context.Background()
+	workspaceID := uuid.New()
+	updatedAt := time.Date(2024, 6, 1, 12, 0, 0, 0, time.UTC)
+
+	mockQueries := new(MockWorkspaceBackupQueries)
+	mockQueries.On("GetWorkspaceExportVersion", ctx, workspaceID).Return(queries.GetWorkspaceExportVersionRow{
+		RecordCount: 42,
+		LastUpdated: makeTimestamp(updatedAt),
+	}, nil)
+
+	svc := &WorkspaceBackupService{queries: mockQueries}
+
+	etag, lastUpdated, err := svc.ExportETag(ctx, workspaceID, FormatExcel, false)
+	assert.NoError(t, err)
+	assert.NotEmpty(t, etag)
+	assert.True(t, updatedAt.Equal(lastUpdated))
+
+	again, _, err := svc.ExportETag(ctx, workspaceID, FormatExcel, false)
+	assert.NoError(t, err)
+	assert.Equal(t, etag, again, "same workspace state yields the same etag")
+
+	jsonETag, _, err := svc.ExportETag(ctx, workspaceID, FormatJSON, false)
+	assert.NoError(t, err)
+	assert.NotEqual(t, etag, jsonETag, "format is part of the etag")
+
+	archivedETag, _, err := svc.ExportETag(ctx, workspaceID, FormatExcel, true)
+	assert.NoError(t, err)
+	assert.NotEqual(t, etag, archivedETag, "include_archived is part of the etag")
+}
+
+func TestExportETag_ChangesWithWorkspaceData(t *testing.T) {
+	ctx := context.Background()
+	workspaceID := uuid.New()
+	updatedAt := time.Date(2024, 6, 1, 12, 0, 0, 0, time.UTC)
+
+	mockQueries := new(MockWorkspaceBackupQueries)
+	mockQueries.On("GetWorkspaceExportVersion", ctx, workspaceID).Return(queries.GetWorkspaceExportVersionRow{
+		RecordCount: 42,
+		LastUpdated: makeTimestamp(updatedAt),
+	}, nil).Once()
+	mockQueries.On("GetWorkspaceExportVersion", ctx, workspaceID).Return(queries.GetWorkspaceExportVersionRow{
+		RecordCount: 41,
+		LastUpdated: makeTimestamp(updatedAt),
+	}, nil).Once()
+
+	svc := &WorkspaceBackupService{queries: mockQueries}
+
+	before, _, err := svc.ExportETag(ctx, workspaceID, FormatExcel, false)
+	assert.NoError(t, err)
+	after, _, err := svc.ExportETag(ctx, workspaceID, FormatExcel, false)
+	assert.NoError(t, err)
+
+	assert.NotEqual(t, before, after)
+	mockQueries.AssertExpectations(t)
+}
+
+func TestExportETag_QueryError(t *testing.T) {
+	ctx := context.Background()
+	workspaceID := uuid.New()
+
+	mockQueries := new(MockWorkspaceBackupQueries)
+	mockQueries.On("GetWorkspaceExportVersion", ctx, workspaceID).Return(queries.GetWorkspaceExportVersionRow{}, assert.AnError)
+
+	svc := &WorkspaceBackupService{queries: mockQueries}
+
+	_, _, err := svc.ExportETag(ctx, workspaceID, FormatExcel, false)
+	assert.Error(t, err)
+	assert.Contains(t, err.Error(), "failed to fetch workspace export version")
+}
+
+func TestWriteSheet_WideSheetColumns(t *testing.T) {
+	f := excelize.NewFile()
+	defer f.Close()
+
+	// More than 26 columns, so names run past Z into AA..AD
+	headers := make([]string, 30)
+	for i := range headers {
+		headers[i] = fmt.Sprintf("Col %d", i+1)
+	}
+
+	err := writeSheet(f, "Wide", headers, []int{7}, 0, func(row []interface{}, v int) []interface{} {
+		for range headers {
+			row = append(row, v)
+		}
+		return row
+	})
+	assert.NoError(t, err)
+
+	buf, err := f.WriteToBuffer()
+	assert.NoError(t, err)
+	out, err := excelize.OpenReader(buf)
+	assert.NoError(t, err)
+	defer out.Close()
+
+	header, err := out.GetCellValue("Wide", "AD1")
+	assert.NoError(t, err)
+	assert.Equal(t, "Col 30", header)
+
+	value, err := out.GetCellValue("Wide", "AD2")
+	assert.NoError(t, err)
+	assert.Equal(t, "7", value)
+
+	for _, col := range []string{"A", "Z", "AA", "AD"} {
+		width, err := out.GetColWidth("Wide", col)
+		assert.NoError(t, err)
+		assert.Equal(t, float64(20), width, "column %s", col)
+	}
+}
+
+func TestWorkspaceData_RecordCounts(t *testing.T) {
+	workspaceID := uuid.New()
+	location := makeTestLocation(workspaceID, "Garage")
+	data := &WorkspaceData{
+		Categories: []queries.WarehouseCategory{makeTestCategory(workspaceID, "Tools"), makeTestCategory(workspaceID, "Books")},
+		Locations:  []queries.WarehouseLocation{location},
+		Containers: []queries.WarehouseContainer{makeTestContainer(workspaceID, location.ID, "Box")},
+	}
+
+	counts, total := data.recordCounts()
+
+	assert.Len(t, counts, 10)
+	assert.Equal(t, 2, counts["categories"])
+	assert.Equal(t, 1, counts["locations"])
+	assert.Equal(t, 1, counts["containers"])
+	assert.Equal(t, 0, counts["attachments"])
+	assert.Equal(t, 4, total)
+}
+
 func TestFormatTimestamp(t *testing.T) {
 	tests := []struct {
 		name     string
@@ -1070,6 +1240,19 @@ func TestNewWorkspaceBackupService(t *testing.T) {
 	assert.Equal(t, mockQueries, svc.queries)
 }
 
+func TestWorkspaceBackupService_WaitForAudits(t *testing.T) {
+	svc := NewWorkspaceBackupService(new(MockWorkspaceBackupQueries))
+	assert.NoError(t, svc.WaitForAudits(context.Background()))
+
+	svc.audits.Add(1) // an audit write still in flight
+	ctx, cancel := context.WithTimeout(context.Background(), 10*time.Millisecond)
+	defer cancel()
+	assert.ErrorIs(t, svc.WaitForAudits(ctx), context.DeadlineExceeded)
+
+	svc.audits.Done()
+	assert.NoError(t, svc.WaitForAudits(context.Background()))
+}
+
 // =============================================================================
 // Excel Sheet Generation Edge Cases
 // =============================================================================
@@ -1228,11 +1411,12 @@ func TestExportWorkspace_ExcelWithParentReferences(t *testing.T) {
 	mockQueries.On("ListAllInventory", ctx, workspaceID).Return(inventory, nil)
 	mockQueries.On("ListAllLoans", ctx, workspaceID).Return(loans, nil)
 	mockQueries.On("ListAllAttachments", ctx, workspaceID).Return(attachments, nil)
-	mockQueries.On("CreateWorkspaceExport", ctx, mock.AnythingOfType("queries.CreateWorkspaceExportParams")).Return(nil)
+	mockQueries.On("CreateWorkspaceExport", mock.Anything, mock.AnythingOfType("queries.CreateWorkspaceExportParams")).Return(nil)
 
 	svc := NewWorkspaceBackupService(mockQueries)
 
 	result, err := svc.ExportWorkspace(ctx, workspaceID, FormatExcel, false, exportedBy)
+	svc.audits.Wait()
 
 	assert.NoError(t, err)
 	assert.NotNil(t, result)
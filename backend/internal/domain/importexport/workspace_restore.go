@@ -118,15 +118,33 @@ const (
 	maxRowsPerSheet = 100_000
 )
 
-// getSheetRows reads a sheet's rows and enforces the per-sheet row cap.
-// A missing sheet is not an error (returns nil rows).
-func getSheetRows(f *excelize.File, sheet string) ([][]string, error) {
-	rows, err := f.GetRows(sheet)
+// getSheetDataRows streams a sheet's rows, dropping the header row and empty
+// rows, and enforces the per-sheet row cap as it goes so an oversized sheet
+// is rejected without decoding the rest of it. A missing sheet is not an
+// error (returns nil rows).
+func getSheetDataRows(f *excelize.File, sheet string) ([][]string, error) {
+	iter, err := f.Rows(sheet)
 	if err != nil {
 		return nil, nil // sheet missing or unreadable - treat as absent
 	}
-	if len(rows) > maxRowsPerSheet {
-		return nil, fmt.Errorf("sheet %q has %d rows, exceeding the maximum of %d", sheet, len(rows), maxRowsPerSheet)
+	defer iter.Close()
+
+	var rows [][]string
+	for n := 0; iter.Next(); n++ {
+		if n == maxRowsPerSheet {
+			return nil, fmt.Errorf("sheet %q exceeds the maximum of %d rows", sheet, maxRowsPerSheet)
+		}
+		row, err := iter.Columns()
+		if err != nil {
+			return nil, nil // unreadable - treat as absent
+		}
+		if n == 0 || len(row) == 0 {
+			continue // header or empty row
+		}
+		rows = append(rows, row)
+	}
+	if iter.Error() != nil {
+		return nil, nil
 	}
 	return rows, nil
 }
@@ -192,12 +210,12 @@ func (s *WorkspaceBackupService) parseExcel(data []byte) (*WorkspaceData, error)
 // row, assigns its parsed data rows (header skipped) via assign. A sheet read
 // error aborts the restore.
 func parseSheet[T any](f *excelize.File, name string, parse func([][]string) []T, assign func([]T)) error {
-	rows, err := getSheetRows(f, name)
+	rows, err := getSheetDataRows(f, name)
 	if err != nil {
 		return err
 	}
-	if len(rows) > 1 {
-		assign(parse(rows[1:]))
+	if len(rows) > 0 {
+		assign(parse(rows))
 	}
 	return nil
 }
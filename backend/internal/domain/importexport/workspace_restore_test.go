@@ -1,6 +1,7 @@
 package importexport
 
 import (
+	"bytes"
 	"context"
 	"encoding/json"
 	"fmt"
@@ -48,6 +49,63 @@ func createTestExcelFile(t *testing.T, sheets map[string][][]string) []byte {
 	return buf.Bytes()
 }
 
+func openTestExcelFile(t *testing.T, sheets map[string][][]string) *excelize.File {
+	t.Helper()
+	f, err := excelize.OpenReader(bytes.NewReader(createTestExcelFile(t, sheets)))
+	if err != nil {
+		t.Fatalf("Failed to open Excel file: %v", err)
+	}
+	t.Cleanup(func() { f.Close() })
+	return f
+}
+
+// =============================================================================
+// Sheet Reading Tests
+// =============================================================================
+
+func TestGetSheetDataRows_SkipsHeaderAndEmptyRows(t *testing.T) {
+	f := openTestExcelFile(t, map[string][][]string{
+		"Labels": {
+			{"id", "name"},
+			{"", "First"},
+			{},
+			{"", "Second"},
+		},
+	})
+
+	rows, err := getSheetDataRows(f, "Labels")
+
+	assert.NoError(t, err)
+	assert.Equal(t, [][]string{{"", "First"}, {"", "Second"}}, rows)
+}
+
+func TestGetSheetDataRows_MissingSheet(t *testing.T) {
+	f := openTestExcelFile(t, map[string][][]string{"Labels": {{"id", "name"}}})
+
+	rows, err := getSheetDataRows(f, "Categories")
+
+	assert.NoError(t, err)
+	assert.Nil(t, rows)
+}
+
+func TestGetSheetDataRows_EnforcesRowCap(t *testing.T) {
+	f := excelize.NewFile()
+	defer f.Close()
+	sw, err := f.NewStreamWriter("Sheet1")
+	assert.NoError(t, err)
+	for i := 1; i <= maxRowsPerSheet+1; i++ {
+		cell, _ := excelize.CoordinatesToCellName(1, i)
+		assert.NoError(t, sw.SetRow(cell, []interface{}{"x", "y"}))
+	}
+	assert.NoError(t, sw.Flush())
+
+	rows, err := getSheetDataRows(f, "Sheet1")
+
+	assert.Error(t, err)
+	assert.Contains(t, err.Error(), "exceeds the maximum")
+	assert.Nil(t, rows)
+}
+
 // =============================================================================
 // Import Workspace Tests - JSON Format
 // =============================================================================
@@ -0,0 +1,108 @@
+package favorite
+
+import (
+	"sync"
+	"time"
+
+	"github.com/google/uuid"
+)
+
+const (
+	// statusCacheTTL bounds how stale a cached IsFavorite answer can be. Writes
+	// through this Service invalidate immediately; the TTL only covers writes
+	// made by other replicas.
+	statusCacheTTL = 5 * time.Second
+	// statusCacheMaxEntries caps memory; a full cache is swept of expired
+	// entries and, if still full, reset.
+	statusCacheMaxEntries = 10_000
+)
+
+type statusKey struct {
+	userID       uuid.UUID
+	workspaceID  uuid.UUID
+	favoriteType FavoriteType
+	targetID     uuid.UUID
+}
+
+type statusEntry struct {
+	favorited bool
+	expiresAt time.Time
+}
+
+// statusCache is a small in-process TTL cache of IsFavorite results, so
+// repeated checks of the same target while a page renders skip the database.
+//
+// gen is bumped by every invalidate. A reader takes the generation before it
+// queries the repository and passes it to set, which drops the result if an
+// invalidate happened in between: that read may predate the write, and
+// caching it would serve the old value until the TTL ran out.
+type statusCache struct {
+	mu         sync.Mutex
+	entries    map[statusKey]statusEntry
+	gen        uint64
+	ttl        time.Duration
+	maxEntries int
+	now        func() time.Time
+}
+
+func newStatusCache(ttl time.Duration, maxEntries int) *statusCache {
+	return &statusCache{
+		entries:    make(map[statusKey]statusEntry),
+		ttl:        ttl,
+		maxEntries: maxEntries,
+		now:        time.Now,
+	}
+}
+
+func (c *statusCache) get(key statusKey) (favorited, ok bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	entry, exists := c.entries[key]
+	if !exists {
+		return false, false
+	}
+	if c.now().After(entry.expiresAt) {
+		delete(c.entries, key)
+		return false, false
+	}
+	return entry.favorited, true
+}
+
+// generation returns the current invalidation generation, to be passed to
+// set once the value it caches has been read.
+func (c *statusCache) generation() uint64 {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	return c.gen
+}
+
+// set caches favorited for key unless an invalidate has happened since gen
+// was taken.
+func (c *statusCache) set(key statusKey, favorited bool, gen uint64) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	if gen != c.gen {
+		return
+	}
+	now := c.now()
+	if _, exists := c.entries[key]; !exists && len(c.entries) >= c.maxEntries {
+		for k, entry := range c.entries {
+			if now.After(entry.expiresAt) {
+				delete(c.entries, k)
+			}
+		}
+		if len(c.entries) >= c.maxEntries {
+			c.entries = make(map[statusKey]statusEntry)
+		}
+	}
+	c.entries[key] = statusEntry{favorited: favorited, expiresAt: now.Add(c.ttl)}
+}
+
+func (c *statusCache) invalidate(key statusKey) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	c.gen++
+	delete(c.entries, key)
+}
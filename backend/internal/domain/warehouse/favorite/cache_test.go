@@ -0,0 +1,59 @@
+package favorite
+
+import (
+	"testing"
+	"time"
+
+	"github.com/google/uuid"
+	"github.com/stretchr/testify/assert"
+)
+
+func TestStatusCache_GetSetExpire(t *testing.T) {
+	now := time.Now()
+	c := newStatusCache(5*time.Second, 10)
+	c.now = func() time.Time { return now }
+	key := statusKey{uuid.New(), uuid.New(), TypeItem, uuid.New()}
+
+	_, ok := c.get(key)
+	assert.False(t, ok)
+
+	c.set(key, true, c.generation())
+	favorited, ok := c.get(key)
+	assert.True(t, ok)
+	assert.True(t, favorited)
+
+	now = now.Add(6 * time.Second)
+	_, ok = c.get(key)
+	assert.False(t, ok, "entry should expire after the TTL")
+}
+
+func TestStatusCache_Invalidate(t *testing.T) {
+	c := newStatusCache(time.Minute, 10)
+	key := statusKey{uuid.New(), uuid.New(), TypeLocation, uuid.New()}
+
+	c.set(key, false, c.generation())
+	c.invalidate(key)
+
+	_, ok := c.get(key)
+	assert.False(t, ok)
+}
+
+func TestStatusCache_BoundedSize(t *testing.T) {
+	c := newStatusCache(time.Minute, 3)
+	for i := 0; i < 10; i++ {
+		c.set(statusKey{uuid.New(), uuid.New(), TypeItem, uuid.New()}, true, c.generation())
+		assert.LessOrEqual(t, len(c.entries), 3)
+	}
+}
+
+func TestStatusCache_SetDropsValueReadBeforeInvalidate(t *testing.T) {
+	c := newStatusCache(time.Minute, 10)
+	key := statusKey{uuid.New(), uuid.New(), TypeItem, uuid.New()}
+
+	gen := c.generation() // reader misses and queries the repository...
+	c.invalidate(key)     // ...while a write lands and invalidates
+	c.set(key, false, gen)
+
+	_, ok := c.get(key)
+	assert.False(t, ok, "a value read before the invalidate must not be cached")
+}
@@ -5,4 +5,5 @@ import "errors"
 var (
 	ErrFavoriteNotFound    = errors.New("favorite not found")
 	ErrInvalidFavoriteType = errors.New("invalid favorite type")
+	ErrAlreadyFavorited    = errors.New("target is already a favorite")
 )
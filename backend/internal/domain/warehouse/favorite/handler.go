@@ -2,6 +2,9 @@ package favorite
 
 import (
 	"context"
+	"encoding/base64"
+	"errors"
+	"strings"
 	"time"
 
 	"github.com/danielgtaylor/huma/v2"
@@ -22,12 +25,15 @@ const (
 func RegisterRoutes(api huma.API, svc ServiceInterface, broadcaster *events.Broadcaster) {
 	huma.Get(api, "/favorites", listFavorites(svc))
 	huma.Post(api, "/favorites", toggleFavorite(svc, broadcaster))
+	huma.Post(api, "/favorites/bulk", addFavorites(svc, broadcaster))
 	huma.Get(api, "/favorites/check/{favorite_type}/{target_id}", checkFavorite(svc))
+	huma.Post(api, "/favorites/check", checkFavorites(svc))
 }
 
-// listFavorites lists the authenticated user's favorites.
-func listFavorites(svc ServiceInterface) func(context.Context, *struct{}) (*ListFavoritesOutput, error) {
-	return func(ctx context.Context, input *struct{}) (*ListFavoritesOutput, error) {
+// listFavorites lists the authenticated user's favorites, newest first, one
+// keyset page at a time.
+func listFavorites(svc ServiceInterface) func(context.Context, *ListFavoritesInput) (*ListFavoritesOutput, error) {
+	return func(ctx context.Context, input *ListFavoritesInput) (*ListFavoritesOutput, error) {
 		workspaceID, ok := appMiddleware.GetWorkspaceID(ctx)
 		if !ok {
 			return nil, huma.Error401Unauthorized(msgWorkspaceContextRequired)
@@ -38,7 +44,16 @@ func listFavorites(svc ServiceInterface) func(context.Context, *struct{}) (*List
 			return nil, huma.Error401Unauthorized(msgAuthenticationRequired)
 		}
 
-		favorites, err := svc.ListFavorites(ctx, authUser.ID, workspaceID)
+		var after *Cursor
+		if input.Cursor != "" {
+			cursor, err := decodeCursor(input.Cursor)
+			if err != nil {
+				return nil, huma.Error400BadRequest("invalid cursor")
+			}
+			after = &cursor
+		}
+
+		favorites, err := svc.ListFavorites(ctx, authUser.ID, workspaceID, after, input.Limit)
 		if err != nil {
 			return nil, huma.Error500InternalServerError("failed to list favorites")
 		}
@@ -48,8 +63,14 @@ func listFavorites(svc ServiceInterface) func(context.Context, *struct{}) (*List
 			items[i] = toFavoriteResponse(fav)
 		}
 
+		var nextCursor string
+		if len(favorites) == input.Limit {
+			last := favorites[len(favorites)-1]
+			nextCursor = encodeCursor(Cursor{CreatedAt: last.CreatedAt(), ID: last.ID()})
+		}
+
 		return &ListFavoritesOutput{
-			Body: FavoriteListResponse{Items: items},
+			Body: FavoriteListResponse{Items: items, NextCursor: nextCursor},
 		}, nil
 	}
 }
@@ -67,7 +88,7 @@ func toggleFavorite(svc ServiceInterface, broadcaster *events.Broadcaster) func(
 			return nil, huma.Error401Unauthorized(msgAuthenticationRequired)
 		}
 
-		favoriteType := FavoriteType(input.Body.FavoriteType)
+		favoriteType := input.Body.FavoriteType
 		if !favoriteType.IsValid() {
 			return nil, huma.Error400BadRequest("invalid favorite type")
 		}
@@ -91,7 +112,7 @@ func toggleFavorite(svc ServiceInterface, broadcaster *events.Broadcaster) func(
 				UserID:     authUser.ID,
 				Data: map[string]any{
 					"target_id":     input.Body.TargetID,
-					"favorite_type": input.Body.FavoriteType,
+					"favorite_type": string(input.Body.FavoriteType),
 					"added":         added,
 					"user_name":     userName,
 				},
@@ -106,6 +127,61 @@ func toggleFavorite(svc ServiceInterface, broadcaster *events.Broadcaster) func(
 	}
 }
 
+// addFavorites favorites several targets in one request.
+func addFavorites(svc ServiceInterface, broadcaster *events.Broadcaster) func(context.Context, *AddFavoritesInput) (*AddFavoritesOutput, error) {
+	return func(ctx context.Context, input *AddFavoritesInput) (*AddFavoritesOutput, error) {
+		workspaceID, ok := appMiddleware.GetWorkspaceID(ctx)
+		if !ok {
+			return nil, huma.Error401Unauthorized(msgWorkspaceContextRequired)
+		}
+
+		authUser, ok := appMiddleware.GetAuthUser(ctx)
+		if !ok {
+			return nil, huma.Error401Unauthorized(msgAuthenticationRequired)
+		}
+
+		targets := make([]Target, len(input.Body.Items))
+		for i, item := range input.Body.Items {
+			targets[i] = Target{FavoriteType: item.FavoriteType, TargetID: item.TargetID}
+		}
+
+		favorites, err := svc.AddFavorites(ctx, authUser.ID, workspaceID, targets)
+		if err != nil {
+			if errors.Is(err, ErrInvalidFavoriteType) {
+				return nil, huma.Error400BadRequest("invalid favorite type")
+			}
+			return nil, huma.Error500InternalServerError("failed to add favorites")
+		}
+
+		items := make([]FavoriteResponse, len(favorites))
+		for i, fav := range favorites {
+			items[i] = toFavoriteResponse(fav)
+		}
+
+		if broadcaster != nil {
+			userName := appMiddleware.GetUserDisplayName(ctx)
+			for _, fav := range favorites {
+				broadcaster.Publish(workspaceID, events.Event{
+					Type:       "favorite.created",
+					EntityID:   fav.TargetID().String(),
+					EntityType: "favorite",
+					UserID:     authUser.ID,
+					Data: map[string]any{
+						"target_id":     fav.TargetID(),
+						"favorite_type": string(fav.FavoriteType()),
+						"added":         true,
+						"user_name":     userName,
+					},
+				})
+			}
+		}
+
+		return &AddFavoritesOutput{
+			Body: FavoriteListResponse{Items: items},
+		}, nil
+	}
+}
+
 // checkFavorite reports whether the target entity is favorited by the user.
 func checkFavorite(svc ServiceInterface) func(context.Context, *CheckFavoriteInput) (*CheckFavoriteOutput, error) {
 	return func(ctx context.Context, input *CheckFavoriteInput) (*CheckFavoriteOutput, error) {
@@ -137,6 +213,60 @@ func checkFavorite(svc ServiceInterface) func(context.Context, *CheckFavoriteInp
 	}
 }
 
+// checkFavorites reports which of a batch of targets are favorited by the user.
+func checkFavorites(svc ServiceInterface) func(context.Context, *CheckFavoritesInput) (*CheckFavoritesOutput, error) {
+	return func(ctx context.Context, input *CheckFavoritesInput) (*CheckFavoritesOutput, error) {
+		workspaceID, ok := appMiddleware.GetWorkspaceID(ctx)
+		if !ok {
+			return nil, huma.Error401Unauthorized(msgWorkspaceContextRequired)
+		}
+
+		authUser, ok := appMiddleware.GetAuthUser(ctx)
+		if !ok {
+			return nil, huma.Error401Unauthorized(msgAuthenticationRequired)
+		}
+
+		favorited, err := svc.FavoritedTargets(ctx, authUser.ID, workspaceID, input.Body.FavoriteType, input.Body.TargetIDs)
+		if err != nil {
+			if errors.Is(err, ErrInvalidFavoriteType) {
+				return nil, huma.Error400BadRequest("invalid favorite type")
+			}
+			return nil, huma.Error500InternalServerError("failed to check favorites")
+		}
+
+		return &CheckFavoritesOutput{
+			Body: CheckFavoritesResponse{FavoritedIDs: favorited},
+		}, nil
+	}
+}
+
+// encodeCursor renders a list position as an opaque URL-safe token.
+func encodeCursor(c Cursor) string {
+	raw := c.CreatedAt.UTC().Format(time.RFC3339Nano) + "_" + c.ID.String()
+	return base64.RawURLEncoding.EncodeToString([]byte(raw))
+}
+
+// decodeCursor parses a token produced by encodeCursor.
+func decodeCursor(token string) (Cursor, error) {
+	raw, err := base64.RawURLEncoding.DecodeString(token)
+	if err != nil {
+		return Cursor{}, err
+	}
+	createdAt, id, ok := strings.Cut(string(raw), "_")
+	if !ok {
+		return Cursor{}, errors.New("malformed cursor")
+	}
+	t, err := time.Parse(time.RFC3339Nano, createdAt)
+	if err != nil {
+		return Cursor{}, err
+	}
+	u, err := uuid.Parse(id)
+	if err != nil {
+		return Cursor{}, err
+	}
+	return Cursor{CreatedAt: t, ID: u}, nil
+}
+
 func toFavoriteResponse(fav *Favorite) FavoriteResponse {
 	return FavoriteResponse{
 		ID:           fav.ID(),
@@ -154,11 +284,26 @@ func toFavoriteResponse(fav *Favorite) FavoriteResponse {
 
 type ToggleFavoriteInput struct {
 	Body struct {
-		FavoriteType string    `json:"favorite_type" enum:"ITEM,LOCATION,CONTAINER" doc:"Type of entity to favorite"`
-		TargetID     uuid.UUID `json:"target_id" doc:"ID of the entity to favorite"`
+		FavoriteType FavoriteType `json:"favorite_type" enum:"ITEM,LOCATION,CONTAINER" doc:"Type of entity to favorite"`
+		TargetID     uuid.UUID    `json:"target_id" doc:"ID of the entity to favorite"`
+	}
+}
+
+type FavoriteTargetInput struct {
+	FavoriteType FavoriteType `json:"favorite_type" enum:"ITEM,LOCATION,CONTAINER" doc:"Type of entity to favorite"`
+	TargetID     uuid.UUID    `json:"target_id" doc:"ID of the entity to favorite"`
+}
+
+type AddFavoritesInput struct {
+	Body struct {
+		Items []FavoriteTargetInput `json:"items" minItems:"1" maxItems:"100" doc:"Entities to favorite"`
 	}
 }
 
+type AddFavoritesOutput struct {
+	Body FavoriteListResponse
+}
+
 type ToggleFavoriteOutput struct {
 	Body ToggleFavoriteResponse
 }
@@ -180,12 +325,33 @@ type CheckFavoriteResponse struct {
 	IsFavorite bool `json:"is_favorite"`
 }
 
+type CheckFavoritesInput struct {
+	Body struct {
+		FavoriteType FavoriteType `json:"favorite_type" enum:"ITEM,LOCATION,CONTAINER" doc:"Type of the entities to check"`
+		TargetIDs    []uuid.UUID  `json:"target_ids" minItems:"1" maxItems:"100" doc:"IDs of the entities to check"`
+	}
+}
+
+type CheckFavoritesOutput struct {
+	Body CheckFavoritesResponse
+}
+
+type CheckFavoritesResponse struct {
+	FavoritedIDs []uuid.UUID `json:"favorited_ids" doc:"Subset of target_ids the user has favorited"`
+}
+
+type ListFavoritesInput struct {
+	Limit  int    `query:"limit" default:"50" minimum:"1" maximum:"100"`
+	Cursor string `query:"cursor" doc:"next_cursor from the previous page; omit for the first page"`
+}
+
 type ListFavoritesOutput struct {
 	Body FavoriteListResponse
 }
 
 type FavoriteListResponse struct {
-	Items []FavoriteResponse `json:"items"`
+	Items      []FavoriteResponse `json:"items"`
+	NextCursor string             `json:"next_cursor,omitempty" doc:"Cursor for the next page; absent on the last page"`
 }
 
 type FavoriteResponse struct {
@@ -28,6 +28,14 @@ func (m *MockService) AddFavorite(ctx context.Context, userID, workspaceID uuid.
 	return args.Get(0).(*favorite.Favorite), args.Error(1)
 }
 
+func (m *MockService) AddFavorites(ctx context.Context, userID, workspaceID uuid.UUID, targets []favorite.Target) ([]*favorite.Favorite, error) {
+	args := m.Called(ctx, userID, workspaceID, targets)
+	if args.Get(0) == nil {
+		return nil, args.Error(1)
+	}
+	return args.Get(0).([]*favorite.Favorite), args.Error(1)
+}
+
 func (m *MockService) RemoveFavorite(ctx context.Context, userID, workspaceID uuid.UUID, favoriteType favorite.FavoriteType, targetID uuid.UUID) error {
 	args := m.Called(ctx, userID, workspaceID, favoriteType, targetID)
 	return args.Error(0)
@@ -38,11 +46,19 @@ func (m *MockService) ToggleFavorite(ctx context.Context, userID, workspaceID uu
 	return args.Bool(0), args.Error(1)
 }
 
-func (m *MockService) ListFavorites(ctx context.Context, userID, workspaceID uuid.UUID) ([]*favorite.Favorite, error) {
-	args := m.Called(ctx, userID, workspaceID)
+func (m *MockService) ListFavorites(ctx context.Context, userID, workspaceID uuid.UUID, after *favorite.Cursor, limit int) ([]*favorite.Favorite, error) {
+	args := m.Called(ctx, userID, workspaceID, after, limit)
 	return args.Get(0).([]*favorite.Favorite), args.Error(1)
 }
 
+func (m *MockService) FavoritedTargets(ctx context.Context, userID, workspaceID uuid.UUID, favoriteType favorite.FavoriteType, targetIDs []uuid.UUID) ([]uuid.UUID, error) {
+	args := m.Called(ctx, userID, workspaceID, favoriteType, targetIDs)
+	if args.Get(0) == nil {
+		return nil, args.Error(1)
+	}
+	return args.Get(0).([]uuid.UUID), args.Error(1)
+}
+
 func mockBoolErr(args mock.Arguments) (bool, error) {
 	return args.Bool(0), args.Error(1)
 }
@@ -64,7 +80,7 @@ func TestFavoriteHandler_ListFavorites(t *testing.T) {
 		fav1, _ := favorite.NewFavorite(setup.UserID, setup.WorkspaceID, favorite.TypeItem, itemID)
 		favorites := []*favorite.Favorite{fav1}
 
-		mockSvc.On("ListFavorites", mock.Anything, setup.UserID, setup.WorkspaceID).
+		mockSvc.On("ListFavorites", mock.Anything, setup.UserID, setup.WorkspaceID, (*favorite.Cursor)(nil), 50).
 			Return(favorites, nil).Once()
 
 		rec := setup.Get("/favorites")
@@ -74,7 +90,7 @@ func TestFavoriteHandler_ListFavorites(t *testing.T) {
 	})
 
 	t.Run("returns empty list when no favorites", func(t *testing.T) {
-		mockSvc.On("ListFavorites", mock.Anything, setup.UserID, setup.WorkspaceID).
+		mockSvc.On("ListFavorites", mock.Anything, setup.UserID, setup.WorkspaceID, (*favorite.Cursor)(nil), 50).
 			Return([]*favorite.Favorite{}, nil).Once()
 
 		rec := setup.Get("/favorites")
@@ -82,6 +98,39 @@ func TestFavoriteHandler_ListFavorites(t *testing.T) {
 		testutil.AssertStatus(t, rec, http.StatusOK)
 		mockSvc.AssertExpectations(t)
 	})
+
+	t.Run("returns next cursor on a full page and accepts it back", func(t *testing.T) {
+		fav1, _ := favorite.NewFavorite(setup.UserID, setup.WorkspaceID, favorite.TypeItem, uuid.New())
+		fav2, _ := favorite.NewFavorite(setup.UserID, setup.WorkspaceID, favorite.TypeItem, uuid.New())
+
+		mockSvc.On("ListFavorites", mock.Anything, setup.UserID, setup.WorkspaceID, (*favorite.Cursor)(nil), 2).
+			Return([]*favorite.Favorite{fav1, fav2}, nil).Once()
+
+		rec := setup.Get("/favorites?limit=2")
+
+		testutil.AssertStatus(t, rec, http.StatusOK)
+		page := testutil.ParseJSONResponse[favorite.FavoriteListResponse](t, rec)
+		assert.Len(t, page.Items, 2)
+		assert.NotEmpty(t, page.NextCursor)
+
+		mockSvc.On("ListFavorites", mock.Anything, setup.UserID, setup.WorkspaceID,
+			mock.MatchedBy(func(c *favorite.Cursor) bool {
+				return c != nil && c.ID == fav2.ID() && c.CreatedAt.Equal(fav2.CreatedAt())
+			}), 2).
+			Return([]*favorite.Favorite{}, nil).Once()
+
+		rec = setup.Get("/favorites?limit=2&cursor=" + page.NextCursor)
+
+		testutil.AssertStatus(t, rec, http.StatusOK)
+		assert.NotContains(t, rec.Body.String(), "next_cursor")
+		mockSvc.AssertExpectations(t)
+	})
+
+	t.Run("returns 400 for malformed cursor", func(t *testing.T) {
+		rec := setup.Get("/favorites?cursor=not-a-cursor")
+
+		testutil.AssertStatus(t, rec, http.StatusBadRequest)
+	})
 }
 
 func TestFavoriteHandler_ToggleFavorite(t *testing.T) {
@@ -151,6 +200,52 @@ func TestFavoriteHandler_ToggleFavorite(t *testing.T) {
 	})
 }
 
+func TestFavoriteHandler_AddFavorites(t *testing.T) {
+	setup := testutil.NewHandlerTestSetup()
+	mockSvc := new(MockService)
+	favorite.RegisterRoutes(setup.API, mockSvc, nil)
+
+	t.Run("adds favorites in bulk", func(t *testing.T) {
+		itemID := uuid.New()
+		locationID := uuid.New()
+		targets := []favorite.Target{
+			{FavoriteType: favorite.TypeItem, TargetID: itemID},
+			{FavoriteType: favorite.TypeLocation, TargetID: locationID},
+		}
+		fav, _ := favorite.NewFavorite(setup.UserID, setup.WorkspaceID, favorite.TypeItem, itemID)
+
+		mockSvc.On("AddFavorites", mock.Anything, setup.UserID, setup.WorkspaceID, targets).
+			Return([]*favorite.Favorite{fav}, nil).Once()
+
+		body := fmt.Sprintf(`{"items":[{"favorite_type":"ITEM","target_id":"%s"},{"favorite_type":"LOCATION","target_id":"%s"}]}`, itemID, locationID)
+		rec := setup.Post("/favorites/bulk", body)
+
+		testutil.AssertStatus(t, rec, http.StatusOK)
+		assert.Contains(t, rec.Body.String(), itemID.String())
+		mockSvc.AssertExpectations(t)
+	})
+
+	t.Run("returns 422 for empty items", func(t *testing.T) {
+		rec := setup.Post("/favorites/bulk", `{"items":[]}`)
+
+		testutil.AssertStatus(t, rec, http.StatusUnprocessableEntity)
+	})
+
+	t.Run("returns 500 on service error", func(t *testing.T) {
+		itemID := uuid.New()
+		targets := []favorite.Target{{FavoriteType: favorite.TypeItem, TargetID: itemID}}
+
+		mockSvc.On("AddFavorites", mock.Anything, setup.UserID, setup.WorkspaceID, targets).
+			Return(nil, fmt.Errorf("database error")).Once()
+
+		body := fmt.Sprintf(`{"items":[{"favorite_type":"ITEM","target_id":"%s"}]}`, itemID)
+		rec := setup.Post("/favorites/bulk", body)
+
+		testutil.AssertStatus(t, rec, http.StatusInternalServerError)
+		mockSvc.AssertExpectations(t)
+	})
+}
+
 func TestFavoriteHandler_CheckFavorite(t *testing.T) {
 	setup := testutil.NewHandlerTestSetup()
 	mockSvc := new(MockService)
@@ -215,6 +310,34 @@ func TestFavoriteHandler_CheckFavorite(t *testing.T) {
 
 // Event Publishing Tests
 
+func TestFavoriteHandler_CheckFavorites(t *testing.T) {
+	setup := testutil.NewHandlerTestSetup()
+	mockSvc := new(MockService)
+	favorite.RegisterRoutes(setup.API, mockSvc, nil)
+
+	t.Run("returns favorited subset", func(t *testing.T) {
+		favorited := uuid.New()
+		other := uuid.New()
+
+		mockSvc.On("FavoritedTargets", mock.Anything, setup.UserID, setup.WorkspaceID, favorite.TypeItem, []uuid.UUID{favorited, other}).
+			Return([]uuid.UUID{favorited}, nil).Once()
+
+		body := fmt.Sprintf(`{"favorite_type":"ITEM","target_ids":["%s","%s"]}`, favorited, other)
+		rec := setup.Post("/favorites/check", body)
+
+		testutil.AssertStatus(t, rec, http.StatusOK)
+		resp := testutil.ParseJSONResponse[favorite.CheckFavoritesResponse](t, rec)
+		assert.Equal(t, []uuid.UUID{favorited}, resp.FavoritedIDs)
+		mockSvc.AssertExpectations(t)
+	})
+
+	t.Run("returns 422 for empty target_ids", func(t *testing.T) {
+		rec := setup.Post("/favorites/check", `{"favorite_type":"ITEM","target_ids":[]}`)
+
+		testutil.AssertStatus(t, rec, http.StatusUnprocessableEntity)
+	})
+}
+
 func TestFavoriteHandler_Toggle_PublishesEvent(t *testing.T) {
 	setup := testutil.NewHandlerTestSetup()
 	mockSvc := new(MockService)
@@ -7,9 +7,22 @@ import (
 )
 
 type Repository interface {
+	// Save inserts the favorite, returning ErrAlreadyFavorited if the user
+	// has already favorited the same target.
 	Save(ctx context.Context, favorite *Favorite) error
-	FindByUser(ctx context.Context, userID, workspaceID uuid.UUID) ([]*Favorite, error)
+	// SaveBatch inserts the user's favorites in one statement and returns
+	// those created; already-favorited targets are skipped.
+	SaveBatch(ctx context.Context, userID, workspaceID uuid.UUID, favorites []*Favorite) ([]*Favorite, error)
+	// FindByUser returns up to limit favorites, newest first, starting after
+	// the given cursor (nil for the first page).
+	FindByUser(ctx context.Context, userID, workspaceID uuid.UUID, after *Cursor, limit int) ([]*Favorite, error)
 	Delete(ctx context.Context, id, userID uuid.UUID) error
 	DeleteByTarget(ctx context.Context, userID, workspaceID uuid.UUID, favoriteType FavoriteType, targetID uuid.UUID) error
 	IsFavorite(ctx context.Context, userID, workspaceID uuid.UUID, favoriteType FavoriteType, targetID uuid.UUID) (bool, error)
+	// FindFavoritedTargets returns the subset of targetIDs the user has
+	// favorited as favoriteType.
+	FindFavoritedTargets(ctx context.Context, userID, workspaceID uuid.UUID, favoriteType FavoriteType, targetIDs []uuid.UUID) ([]uuid.UUID, error)
+	// Toggle deletes the favorite's target if already favorited, otherwise
+	// saves it, and reports whether the target is favorited afterwards.
+	Toggle(ctx context.Context, favorite *Favorite) (bool, error)
 }
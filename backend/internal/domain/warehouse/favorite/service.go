@@ -2,6 +2,8 @@ package favorite
 
 import (
 	"context"
+	"errors"
+	"time"
 
 	"github.com/google/uuid"
 )
@@ -9,70 +11,125 @@ import (
 // ServiceInterface defines the favorite service operations.
 type ServiceInterface interface {
 	AddFavorite(ctx context.Context, userID, workspaceID uuid.UUID, favoriteType FavoriteType, targetID uuid.UUID) (*Favorite, error)
+	AddFavorites(ctx context.Context, userID, workspaceID uuid.UUID, targets []Target) ([]*Favorite, error)
 	RemoveFavorite(ctx context.Context, userID, workspaceID uuid.UUID, favoriteType FavoriteType, targetID uuid.UUID) error
 	ToggleFavorite(ctx context.Context, userID, workspaceID uuid.UUID, favoriteType FavoriteType, targetID uuid.UUID) (bool, error)
-	ListFavorites(ctx context.Context, userID, workspaceID uuid.UUID) ([]*Favorite, error)
+	ListFavorites(ctx context.Context, userID, workspaceID uuid.UUID, after *Cursor, limit int) ([]*Favorite, error)
 	IsFavorite(ctx context.Context, userID, workspaceID uuid.UUID, favoriteType FavoriteType, targetID uuid.UUID) (bool, error)
+	FavoritedTargets(ctx context.Context, userID, workspaceID uuid.UUID, favoriteType FavoriteType, targetIDs []uuid.UUID) ([]uuid.UUID, error)
+}
+
+// Target identifies an entity to favorite.
+type Target struct {
+	FavoriteType FavoriteType
+	TargetID     uuid.UUID
+}
+
+// Cursor marks a position in a user's favorites list, which is ordered by
+// (created_at, id) descending.
+type Cursor struct {
+	CreatedAt time.Time
+	ID        uuid.UUID
 }
 
 type Service struct {
-	repo Repository
+	repo   Repository
+	status *statusCache
 }
 
 func NewService(repo Repository) *Service {
-	return &Service{repo: repo}
+	return &Service{
+		repo:   repo,
+		status: newStatusCache(statusCacheTTL, statusCacheMaxEntries),
+	}
 }
 
 func (s *Service) AddFavorite(ctx context.Context, userID, workspaceID uuid.UUID, favoriteType FavoriteType, targetID uuid.UUID) (*Favorite, error) {
-	// Check if already favorited
-	exists, err := s.repo.IsFavorite(ctx, userID, workspaceID, favoriteType, targetID)
-	if err != nil {
-		return nil, err
-	}
-	if exists {
-		// Already favorited, return nil (idempotent operation)
-		return nil, nil
-	}
-
 	favorite, err := NewFavorite(userID, workspaceID, favoriteType, targetID)
 	if err != nil {
 		return nil, err
 	}
 
+	defer s.status.invalidate(statusKey{userID, workspaceID, favoriteType, targetID})
 	if err := s.repo.Save(ctx, favorite); err != nil {
+		if errors.Is(err, ErrAlreadyFavorited) {
+			// Already favorited, return nil (idempotent operation)
+			return nil, nil
+		}
 		return nil, err
 	}
 
 	return favorite, nil
 }
 
+// AddFavorites favorites several targets at once and returns the favorites
+// that were created. Targets that are already favorited are skipped, so the
+// result may be shorter than targets.
+func (s *Service) AddFavorites(ctx context.Context, userID, workspaceID uuid.UUID, targets []Target) ([]*Favorite, error) {
+	favorites := make([]*Favorite, 0, len(targets))
+	for _, target := range targets {
+		favorite, err := NewFavorite(userID, workspaceID, target.FavoriteType, target.TargetID)
+		if err != nil {
+			return nil, err
+		}
+		favorites = append(favorites, favorite)
+	}
+	if len(favorites) == 0 {
+		return []*Favorite{}, nil
+	}
+
+	defer func() {
+		for _, target := range targets {
+			s.status.invalidate(statusKey{userID, workspaceID, target.FavoriteType, target.TargetID})
+		}
+	}()
+	return s.repo.SaveBatch(ctx, userID, workspaceID, favorites)
+}
+
 func (s *Service) RemoveFavorite(ctx context.Context, userID, workspaceID uuid.UUID, favoriteType FavoriteType, targetID uuid.UUID) error {
+	defer s.status.invalidate(statusKey{userID, workspaceID, favoriteType, targetID})
 	return s.repo.DeleteByTarget(ctx, userID, workspaceID, favoriteType, targetID)
 }
 
 func (s *Service) ToggleFavorite(ctx context.Context, userID, workspaceID uuid.UUID, favoriteType FavoriteType, targetID uuid.UUID) (bool, error) {
-	exists, err := s.repo.IsFavorite(ctx, userID, workspaceID, favoriteType, targetID)
+	favorite, err := NewFavorite(userID, workspaceID, favoriteType, targetID)
 	if err != nil {
 		return false, err
 	}
 
-	if exists {
-		if err := s.RemoveFavorite(ctx, userID, workspaceID, favoriteType, targetID); err != nil {
-			return false, err
-		}
-		return false, nil
+	defer s.status.invalidate(statusKey{userID, workspaceID, favoriteType, targetID})
+	return s.repo.Toggle(ctx, favorite)
+}
+
+func (s *Service) ListFavorites(ctx context.Context, userID, workspaceID uuid.UUID, after *Cursor, limit int) ([]*Favorite, error) {
+	return s.repo.FindByUser(ctx, userID, workspaceID, after, limit)
+}
+
+// IsFavorite answers from a short-lived in-process cache when it can; writes
+// through this Service invalidate the affected entry.
+func (s *Service) IsFavorite(ctx context.Context, userID, workspaceID uuid.UUID, favoriteType FavoriteType, targetID uuid.UUID) (bool, error) {
+	key := statusKey{userID, workspaceID, favoriteType, targetID}
+	if favorited, ok := s.status.get(key); ok {
+		return favorited, nil
 	}
 
-	if _, err := s.AddFavorite(ctx, userID, workspaceID, favoriteType, targetID); err != nil {
+	gen := s.status.generation()
+	favorited, err := s.repo.IsFavorite(ctx, userID, workspaceID, favoriteType, targetID)
+	if err != nil {
 		return false, err
 	}
-	return true, nil
-}
-
-func (s *Service) ListFavorites(ctx context.Context, userID, workspaceID uuid.UUID) ([]*Favorite, error) {
-	return s.repo.FindByUser(ctx, userID, workspaceID)
+	s.status.set(key, favorited, gen)
+	return favorited, nil
 }
 
-func (s *Service) IsFavorite(ctx context.Context, userID, workspaceID uuid.UUID, favoriteType FavoriteType, targetID uuid.UUID) (bool, error) {
-	return s.repo.IsFavorite(ctx, userID, workspaceID, favoriteType, targetID)
+// FavoritedTargets reports which of targetIDs are favorited, so a page of
+// entities can be checked with one query instead of one IsFavorite each.
+func (s *Service) FavoritedTargets(ctx context.Context, userID, workspaceID uuid.UUID, favoriteType FavoriteType, targetIDs []uuid.UUID) ([]uuid.UUID, error) {
+	if !favoriteType.IsValid() {
+		return nil, ErrInvalidFavoriteType
+	}
+	if len(targetIDs) == 0 {
+		return []uuid.UUID{}, nil
+	}
+	return s.repo.FindFavoritedTargets(ctx, userID, workspaceID, favoriteType, targetIDs)
 }
@@ -21,6 +21,14 @@ func (m *MockRepository) Save(ctx context.Context, favorite *Favorite) error {
 	return args.Error(0)
 }
 
+func (m *MockRepository) SaveBatch(ctx context.Context, userID, workspaceID uuid.UUID, favorites []*Favorite) ([]*Favorite, error) {
+	args := m.Called(ctx, userID, workspaceID, favorites)
+	if args.Get(0) == nil {
+		return nil, args.Error(1)
+	}
+	return args.Get(0).([]*Favorite), args.Error(1)
+}
+
 func (m *MockRepository) FindByID(ctx context.Context, id uuid.UUID) (*Favorite, error) {
 	args := m.Called(ctx, id)
 	if args.Get(0) == nil {
@@ -29,8 +37,8 @@ func (m *MockRepository) FindByID(ctx context.Context, id uuid.UUID) (*Favorite,
 	return args.Get(0).(*Favorite), args.Error(1)
 }
 
-func (m *MockRepository) FindByUser(ctx context.Context, userID, workspaceID uuid.UUID) ([]*Favorite, error) {
-	args := m.Called(ctx, userID, workspaceID)
+func (m *MockRepository) FindByUser(ctx context.Context, userID, workspaceID uuid.UUID, after *Cursor, limit int) ([]*Favorite, error) {
+	args := m.Called(ctx, userID, workspaceID, after, limit)
 	if args.Get(0) == nil {
 		return nil, args.Error(1)
 	}
@@ -52,6 +60,103 @@ func (m *MockRepository) IsFavorite(ctx context.Context, userID, workspaceID uui
 	return args.Bool(0), args.Error(1)
 }
 
+func (m *MockRepository) FindFavoritedTargets(ctx context.Context, userID, workspaceID uuid.UUID, favoriteType FavoriteType, targetIDs []uuid.UUID) ([]uuid.UUID, error) {
+	args := m.Called(ctx, userID, workspaceID, favoriteType, targetIDs)
+	if args.Get(0) == nil {
+		return nil, args.Error(1)
+	}
+	return args.Get(0).([]uuid.UUID), args.Error(1)
+}
+
+func (m *MockRepository) Toggle(ctx context.Context, favorite *Favorite) (bool, error) {
+	args := m.Called(ctx, favorite)
+	return args.Bool(0), args.Error(1)
+}
+
+// fakeRepo is an in-memory Repository for tests that exercise the service
+// across several calls, where scripting every mock expectation would just
+// restate the storage rules.
+type fakeRepo struct {
+	favorites []*Favorite
+}
+
+func (f *fakeRepo) find(userID, workspaceID uuid.UUID, favoriteType FavoriteType, targetID uuid.UUID) int {
+	for i, fav := range f.favorites {
+		if fav.UserID() == userID && fav.WorkspaceID() == workspaceID &&
+			fav.FavoriteType() == favoriteType && fav.TargetID() == targetID {
+			return i
+		}
+	}
+	return -1
+}
+
+func (f *fakeRepo) Save(_ context.Context, favorite *Favorite) error {
+	if f.find(favorite.UserID(), favorite.WorkspaceID(), favorite.FavoriteType(), favorite.TargetID()) >= 0 {
+		return ErrAlreadyFavorited
+	}
+	f.favorites = append(f.favorites, favorite)
+	return nil
+}
+
+func (f *fakeRepo) SaveBatch(ctx context.Context, _, _ uuid.UUID, favorites []*Favorite) ([]*Favorite, error) {
+	created := []*Favorite{}
+	for _, fav := range favorites {
+		if err := f.Save(ctx, fav); err == nil {
+			created = append(created, fav)
+		}
+	}
+	return created, nil
+}
+
+func (f *fakeRepo) FindByUser(_ context.Context, userID, workspaceID uuid.UUID, _ *Cursor, limit int) ([]*Favorite, error) {
+	result := []*Favorite{}
+	for i := len(f.favorites) - 1; i >= 0 && len(result) < limit; i-- {
+		if fav := f.favorites[i]; fav.UserID() == userID && fav.WorkspaceID() == workspaceID {
+			result = append(result, fav)
+		}
+	}
+	return result, nil
+}
+
+func (f *fakeRepo) Delete(_ context.Context, id, userID uuid.UUID) error {
+	for i, fav := range f.favorites {
+		if fav.ID() == id && fav.UserID() == userID {
+			f.favorites = append(f.favorites[:i], f.favorites[i+1:]...)
+			return nil
+		}
+	}
+	return nil
+}
+
+func (f *fakeRepo) DeleteByTarget(_ context.Context, userID, workspaceID uuid.UUID, favoriteType FavoriteType, targetID uuid.UUID) error {
+	if i := f.find(userID, workspaceID, favoriteType, targetID); i >= 0 {
+		f.favorites = append(f.favorites[:i], f.favorites[i+1:]...)
+	}
+	return nil
+}
+
+func (f *fakeRepo) IsFavorite(_ context.Context, userID, workspaceID uuid.UUID, favoriteType FavoriteType, targetID uuid.UUID) (bool, error) {
+	return f.find(userID, workspaceID, favoriteType, targetID) >= 0, nil
+}
+
+func (f *fakeRepo) FindFavoritedTargets(_ context.Context, userID, workspaceID uuid.UUID, favoriteType FavoriteType, targetIDs []uuid.UUID) ([]uuid.UUID, error) {
+	result := []uuid.UUID{}
+	for _, id := range targetIDs {
+		if f.find(userID, workspaceID, favoriteType, id) >= 0 {
+			result = append(result, id)
+		}
+	}
+	return result, nil
+}
+
+func (f *fakeRepo) Toggle(ctx context.Context, favorite *Favorite) (bool, error) {
+	if i := f.find(favorite.UserID(), favorite.WorkspaceID(), favorite.FavoriteType(), favorite.TargetID()); i >= 0 {
+		f.favorites = append(f.favorites[:i], f.favorites[i+1:]...)
+		return false, nil
+	}
+	return true, f.Save(ctx, favorite)
+}
+
 // Helper functions
 func ptrUUID(u uuid.UUID) *uuid.UUID {
 	return &u
@@ -182,6 +287,8 @@ func TestNewFavorite(t *testing.T) {
 				assert.NoError(t, err)
 				assert.NotNil(t, favorite)
 				assert.NotEqual(t, uuid.Nil, favorite.ID())
+				// Time-ordered ids keep inserts at the tail of the primary key index.
+				assert.Equal(t, uuid.Version(7), favorite.ID().Version())
 				assert.Equal(t, tt.userID, favorite.UserID())
 				assert.Equal(t, tt.workspaceID, favorite.WorkspaceID())
 				assert.Equal(t, tt.favoriteType, favorite.FavoriteType())
@@ -380,7 +487,6 @@ func TestService_AddFavorite(t *testing.T) {
 			favoriteType: TypeItem,
 			targetID:     targetID,
 			setupMock: func(m *MockRepository) {
-				m.On("IsFavorite", ctx, userID, workspaceID, TypeItem, targetID).Return(false, nil)
 				m.On("Save", ctx, mock.AnythingOfType("*favorite.Favorite")).Return(nil)
 			},
 			expectError: false,
@@ -393,32 +499,19 @@ func TestService_AddFavorite(t *testing.T) {
 			favoriteType: TypeItem,
 			targetID:     targetID,
 			setupMock: func(m *MockRepository) {
-				m.On("IsFavorite", ctx, userID, workspaceID, TypeItem, targetID).Return(true, nil)
+				m.On("Save", ctx, mock.AnythingOfType("*favorite.Favorite")).Return(ErrAlreadyFavorited)
 			},
 			expectError: false,
 			expectNil:   true,
 		},
-		{
-			testName:     "IsFavorite returns error",
-			userID:       userID,
-			workspaceID:  workspaceID,
-			favoriteType: TypeItem,
-			targetID:     targetID,
-			setupMock: func(m *MockRepository) {
-				m.On("IsFavorite", ctx, userID, workspaceID, TypeItem, targetID).Return(false, errors.New("database error"))
-			},
-			expectError: true,
-		},
 		{
 			testName:     "invalid favorite type",
 			userID:       userID,
 			workspaceID:  workspaceID,
 			favoriteType: FavoriteType("INVALID"),
 			targetID:     targetID,
-			setupMock: func(m *MockRepository) {
-				m.On("IsFavorite", ctx, userID, workspaceID, FavoriteType("INVALID"), targetID).Return(false, nil)
-			},
-			expectError: true,
+			setupMock:    func(m *MockRepository) {},
+			expectError:  true,
 		},
 		{
 			testName:     "save returns error",
@@ -427,7 +520,6 @@ func TestService_AddFavorite(t *testing.T) {
 			favoriteType: TypeLocation,
 			targetID:     targetID,
 			setupMock: func(m *MockRepository) {
-				m.On("IsFavorite", ctx, userID, workspaceID, TypeLocation, targetID).Return(false, nil)
 				m.On("Save", ctx, mock.AnythingOfType("*favorite.Favorite")).Return(errors.New("save error"))
 			},
 			expectError: true,
@@ -463,6 +555,76 @@ func TestService_AddFavorite(t *testing.T) {
 	}
 }
 
+func TestService_AddFavorites(t *testing.T) {
+	ctx := context.Background()
+	userID := uuid.New()
+	workspaceID := uuid.New()
+	itemID := uuid.New()
+	locationID := uuid.New()
+
+	t.Run("saves all targets in one batch", func(t *testing.T) {
+		mockRepo := new(MockRepository)
+		svc := NewService(mockRepo)
+
+		matchBatch := mock.MatchedBy(func(favorites []*Favorite) bool {
+			return len(favorites) == 2 &&
+				favorites[0].FavoriteType() == TypeItem && favorites[0].TargetID() == itemID &&
+				favorites[1].FavoriteType() == TypeLocation && favorites[1].TargetID() == locationID
+		})
+		created, _ := NewFavorite(userID, workspaceID, TypeItem, itemID)
+		mockRepo.On("SaveBatch", ctx, userID, workspaceID, matchBatch).Return([]*Favorite{created}, nil)
+
+		favorites, err := svc.AddFavorites(ctx, userID, workspaceID, []Target{
+			{FavoriteType: TypeItem, TargetID: itemID},
+			{FavoriteType: TypeLocation, TargetID: locationID},
+		})
+
+		assert.NoError(t, err)
+		assert.Len(t, favorites, 1)
+		mockRepo.AssertExpectations(t)
+	})
+
+	t.Run("rejects invalid favorite type without saving", func(t *testing.T) {
+		mockRepo := new(MockRepository)
+		svc := NewService(mockRepo)
+
+		favorites, err := svc.AddFavorites(ctx, userID, workspaceID, []Target{
+			{FavoriteType: TypeItem, TargetID: itemID},
+			{FavoriteType: FavoriteType("INVALID"), TargetID: locationID},
+		})
+
+		assert.ErrorIs(t, err, ErrInvalidFavoriteType)
+		assert.Nil(t, favorites)
+		mockRepo.AssertNotCalled(t, "SaveBatch", mock.Anything, mock.Anything, mock.Anything, mock.Anything)
+	})
+
+	t.Run("empty targets skip the repository", func(t *testing.T) {
+		mockRepo := new(MockRepository)
+		svc := NewService(mockRepo)
+
+		favorites, err := svc.AddFavorites(ctx, userID, workspaceID, nil)
+
+		assert.NoError(t, err)
+		assert.Empty(t, favorites)
+		mockRepo.AssertNotCalled(t, "SaveBatch", mock.Anything, mock.Anything, mock.Anything, mock.Anything)
+	})
+
+	t.Run("repository error is returned", func(t *testing.T) {
+		mockRepo := new(MockRepository)
+		svc := NewService(mockRepo)
+
+		mockRepo.On("SaveBatch", ctx, userID, workspaceID, mock.Anything).Return(nil, errors.New("insert error"))
+
+		favorites, err := svc.AddFavorites(ctx, userID, workspaceID, []Target{
+			{FavoriteType: TypeItem, TargetID: itemID},
+		})
+
+		assert.Error(t, err)
+		assert.Nil(t, favorites)
+		mockRepo.AssertExpectations(t)
+	})
+}
+
 func TestService_RemoveFavorite(t *testing.T) {
 	ctx := context.Background()
 	userID := uuid.New()
@@ -530,49 +692,37 @@ func TestService_ToggleFavorite(t *testing.T) {
 			testName:     "toggle on - was not favorited",
 			favoriteType: TypeItem,
 			setupMock: func(m *MockRepository) {
-				m.On("IsFavorite", ctx, userID, workspaceID, TypeItem, targetID).Return(false, nil).Once()
-				m.On("IsFavorite", ctx, userID, workspaceID, TypeItem, targetID).Return(false, nil).Once()
-				m.On("Save", ctx, mock.AnythingOfType("*favorite.Favorite")).Return(nil)
+				m.On("Toggle", ctx, mock.MatchedBy(func(f *Favorite) bool {
+					return f.UserID() == userID && f.WorkspaceID() == workspaceID && f.TargetID() == targetID
+				})).Return(true, nil)
 			},
 			expectError:    false,
 			expectedResult: true,
 		},
 		{
 			testName:     "toggle off - was favorited",
-			favoriteType: TypeItem,
+			favoriteType: TypeLocation,
 			setupMock: func(m *MockRepository) {
-				m.On("IsFavorite", ctx, userID, workspaceID, TypeItem, targetID).Return(true, nil)
-				m.On("DeleteByTarget", ctx, userID, workspaceID, TypeItem, targetID).Return(nil)
+				m.On("Toggle", ctx, mock.MatchedBy(func(f *Favorite) bool {
+					return f.UserID() == userID && f.WorkspaceID() == workspaceID && f.TargetID() == targetID
+				})).Return(false, nil)
 			},
 			expectError:    false,
 			expectedResult: false,
 		},
 		{
-			testName:     "IsFavorite returns error",
+			testName:     "toggle returns error",
 			favoriteType: TypeItem,
 			setupMock: func(m *MockRepository) {
-				m.On("IsFavorite", ctx, userID, workspaceID, TypeItem, targetID).Return(false, errors.New("database error"))
+				m.On("Toggle", ctx, mock.AnythingOfType("*favorite.Favorite")).Return(false, errors.New("database error"))
 			},
 			expectError: true,
 		},
 		{
-			testName:     "remove favorite returns error",
-			favoriteType: TypeItem,
-			setupMock: func(m *MockRepository) {
-				m.On("IsFavorite", ctx, userID, workspaceID, TypeItem, targetID).Return(true, nil)
-				m.On("DeleteByTarget", ctx, userID, workspaceID, TypeItem, targetID).Return(errors.New("delete error"))
-			},
-			expectError: true,
-		},
-		{
-			testName:     "add favorite returns error",
-			favoriteType: TypeItem,
-			setupMock: func(m *MockRepository) {
-				m.On("IsFavorite", ctx, userID, workspaceID, TypeItem, targetID).Return(false, nil).Once()
-				m.On("IsFavorite", ctx, userID, workspaceID, TypeItem, targetID).Return(false, nil).Once()
-				m.On("Save", ctx, mock.AnythingOfType("*favorite.Favorite")).Return(errors.New("save error"))
-			},
-			expectError: true,
+			testName:     "invalid favorite type",
+			favoriteType: FavoriteType("INVALID"),
+			setupMock:    func(m *MockRepository) {},
+			expectError:  true,
 		},
 	}
 
@@ -616,7 +766,7 @@ func TestService_ListFavorites(t *testing.T) {
 					{id: uuid.New(), userID: userID, workspaceID: workspaceID, favoriteType: TypeLocation},
 					{id: uuid.New(), userID: userID, workspaceID: workspaceID, favoriteType: TypeContainer},
 				}
-				m.On("FindByUser", ctx, userID, workspaceID).Return(favorites, nil)
+				m.On("FindByUser", ctx, userID, workspaceID, (*Cursor)(nil), 50).Return(favorites, nil)
 			},
 			expectLen:   3,
 			expectError: false,
@@ -624,7 +774,7 @@ func TestService_ListFavorites(t *testing.T) {
 		{
 			testName: "empty results",
 			setupMock: func(m *MockRepository) {
-				m.On("FindByUser", ctx, userID, workspaceID).Return([]*Favorite{}, nil)
+				m.On("FindByUser", ctx, userID, workspaceID, (*Cursor)(nil), 50).Return([]*Favorite{}, nil)
 			},
 			expectLen:   0,
 			expectError: false,
@@ -632,7 +782,7 @@ func TestService_ListFavorites(t *testing.T) {
 		{
 			testName: "repository returns error",
 			setupMock: func(m *MockRepository) {
-				m.On("FindByUser", ctx, userID, workspaceID).Return(nil, errors.New("database error"))
+				m.On("FindByUser", ctx, userID, workspaceID, (*Cursor)(nil), 50).Return(nil, errors.New("database error"))
 			},
 			expectLen:   0,
 			expectError: true,
@@ -646,7 +796,7 @@ func TestService_ListFavorites(t *testing.T) {
 
 			tt.setupMock(mockRepo)
 
-			favorites, err := svc.ListFavorites(ctx, userID, workspaceID)
+			favorites, err := svc.ListFavorites(ctx, userID, workspaceID, nil, 50)
 
 			if tt.expectError {
 				assert.Error(t, err)
@@ -661,6 +811,23 @@ func TestService_ListFavorites(t *testing.T) {
 	}
 }
 
+func TestService_ListFavorites_PassesCursor(t *testing.T) {
+	ctx := context.Background()
+	userID := uuid.New()
+	workspaceID := uuid.New()
+	after := &Cursor{CreatedAt: time.Now(), ID: uuid.New()}
+
+	mockRepo := new(MockRepository)
+	svc := NewService(mockRepo)
+	mockRepo.On("FindByUser", ctx, userID, workspaceID, after, 10).Return([]*Favorite{}, nil)
+
+	favorites, err := svc.ListFavorites(ctx, userID, workspaceID, after, 10)
+
+	assert.NoError(t, err)
+	assert.Empty(t, favorites)
+	mockRepo.AssertExpectations(t)
+}
+
 func TestService_IsFavorite(t *testing.T) {
 	ctx := context.Background()
 	userID := uuid.New()
@@ -723,3 +890,142 @@ func TestService_IsFavorite(t *testing.T) {
 		})
 	}
 }
+
+func TestService_FavoritedTargets(t *testing.T) {
+	ctx := context.Background()
+	userID := uuid.New()
+	workspaceID := uuid.New()
+	favorited := uuid.New()
+	targetIDs := []uuid.UUID{favorited, uuid.New()}
+
+	t.Run("returns favorited subset from one lookup", func(t *testing.T) {
+		mockRepo := new(MockRepository)
+		svc := NewService(mockRepo)
+		mockRepo.On("FindFavoritedTargets", ctx, userID, workspaceID, TypeItem, targetIDs).Return([]uuid.UUID{favorited}, nil).Once()
+
+		result, err := svc.FavoritedTargets(ctx, userID, workspaceID, TypeItem, targetIDs)
+
+		assert.NoError(t, err)
+		assert.Equal(t, []uuid.UUID{favorited}, result)
+		mockRepo.AssertExpectations(t)
+	})
+
+	t.Run("invalid favorite type", func(t *testing.T) {
+		mockRepo := new(MockRepository)
+		svc := NewService(mockRepo)
+
+		result, err := svc.FavoritedTargets(ctx, userID, workspaceID, FavoriteType("INVALID"), targetIDs)
+
+		assert.ErrorIs(t, err, ErrInvalidFavoriteType)
+		assert.Nil(t, result)
+		mockRepo.AssertNotCalled(t, "FindFavoritedTargets", mock.Anything, mock.Anything, mock.Anything, mock.Anything, mock.Anything)
+	})
+
+	t.Run("no targets skips the repository", func(t *testing.T) {
+		mockRepo := new(MockRepository)
+		svc := NewService(mockRepo)
+
+		result, err := svc.FavoritedTargets(ctx, userID, workspaceID, TypeItem, nil)
+
+		assert.NoError(t, err)
+		assert.Empty(t, result)
+		mockRepo.AssertNotCalled(t, "FindFavoritedTargets", mock.Anything, mock.Anything, mock.Anything, mock.Anything, mock.Anything)
+	})
+}
+
+func TestService_IsFavorite_CachesUntilWrite(t *testing.T) {
+	ctx := context.Background()
+	userID := uuid.New()
+	workspaceID := uuid.New()
+	targetID := uuid.New()
+
+	mockRepo := new(MockRepository)
+	svc := NewService(mockRepo)
+
+	mockRepo.On("IsFavorite", ctx, userID, workspaceID, TypeItem, targetID).Return(false, nil).Once()
+
+	for i := 0; i < 3; i++ {
+		isFav, err := svc.IsFavorite(ctx, userID, workspaceID, TypeItem, targetID)
+		assert.NoError(t, err)
+		assert.False(t, isFav)
+	}
+
+	mockRepo.On("Toggle", ctx, mock.AnythingOfType("*favorite.Favorite")).Return(true, nil).Once()
+	_, err := svc.ToggleFavorite(ctx, userID, workspaceID, TypeItem, targetID)
+	assert.NoError(t, err)
+
+	mockRepo.On("IsFavorite", ctx, userID, workspaceID, TypeItem, targetID).Return(true, nil).Once()
+	isFav, err := svc.IsFavorite(ctx, userID, workspaceID, TypeItem, targetID)
+	assert.NoError(t, err)
+	assert.True(t, isFav)
+
+	mockRepo.AssertExpectations(t)
+}
+
+func TestService_IsFavorite_ErrorNotCached(t *testing.T) {
+	ctx := context.Background()
+	userID := uuid.New()
+	workspaceID := uuid.New()
+	targetID := uuid.New()
+
+	mockRepo := new(MockRepository)
+	svc := NewService(mockRepo)
+
+	mockRepo.On("IsFavorite", ctx, userID, workspaceID, TypeItem, targetID).Return(false, errors.New("database error")).Once()
+	mockRepo.On("IsFavorite", ctx, userID, workspaceID, TypeItem, targetID).Return(true, nil).Once()
+
+	_, err := svc.IsFavorite(ctx, userID, workspaceID, TypeItem, targetID)
+	assert.Error(t, err)
+
+	isFav, err := svc.IsFavorite(ctx, userID, workspaceID, TypeItem, targetID)
+	assert.NoError(t, err)
+	assert.True(t, isFav)
+	mockRepo.AssertExpectations(t)
+}
+
+func TestService_FavoriteLifecycle(t *testing.T) {
+	ctx := context.Background()
+	userID := uuid.New()
+	workspaceID := uuid.New()
+	itemID := uuid.New()
+	locationID := uuid.New()
+
+	svc := NewService(&fakeRepo{})
+
+	fav, err := svc.AddFavorite(ctx, userID, workspaceID, TypeItem, itemID)
+	assert.NoError(t, err)
+	assert.NotNil(t, fav)
+
+	dup, err := svc.AddFavorite(ctx, userID, workspaceID, TypeItem, itemID)
+	assert.NoError(t, err)
+	assert.Nil(t, dup, "re-adding is idempotent")
+
+	created, err := svc.AddFavorites(ctx, userID, workspaceID, []Target{
+		{FavoriteType: TypeItem, TargetID: itemID},
+		{FavoriteType: TypeLocation, TargetID: locationID},
+	})
+	assert.NoError(t, err)
+	assert.Len(t, created, 1, "bulk add skips existing favorites")
+
+	favorited, err := svc.FavoritedTargets(ctx, userID, workspaceID, TypeItem, []uuid.UUID{itemID, locationID})
+	assert.NoError(t, err)
+	assert.Equal(t, []uuid.UUID{itemID}, favorited)
+
+	isFav, err := svc.IsFavorite(ctx, userID, workspaceID, TypeLocation, locationID)
+	assert.NoError(t, err)
+	assert.True(t, isFav)
+
+	added, err := svc.ToggleFavorite(ctx, userID, workspaceID, TypeLocation, locationID)
+	assert.NoError(t, err)
+	assert.False(t, added)
+
+	isFav, err = svc.IsFavorite(ctx, userID, workspaceID, TypeLocation, locationID)
+	assert.NoError(t, err)
+	assert.False(t, isFav, "toggle must invalidate the cached status")
+
+	assert.NoError(t, svc.RemoveFavorite(ctx, userID, workspaceID, TypeItem, itemID))
+
+	favorites, err := svc.ListFavorites(ctx, userID, workspaceID, nil, 50)
+	assert.NoError(t, err)
+	assert.Empty(t, favorites)
+}
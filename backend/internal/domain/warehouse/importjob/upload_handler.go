@@ -16,6 +16,16 @@ import (
 	"github.com/antti/home-warehouse/go-backend/internal/infra/queue"
 )
 
+const (
+	// uploadMemoryLimit is how much of a multipart upload is buffered in
+	// memory; the rest spills to a temp file, so concurrent uploads don't
+	// each hold a full file in RAM.
+	uploadMemoryLimit = 1 << 20 // 1MB
+	// maxUploadBodySize bounds the request body: the file plus room for the
+	// multipart framing and form fields.
+	maxUploadBodySize = MaxFileSize + 1<<20
+)
+
 // UploadHandler handles file upload for import jobs
 type UploadHandler struct {
 	repo  Repository
@@ -60,11 +70,13 @@ func (h *UploadHandler) HandleUpload(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	// Parse multipart form (10MB limit)
-	if err := r.ParseMultipartForm(MaxFileSize); err != nil {
+	// Parse multipart form, rejecting bodies over the upload limit
+	r.Body = http.MaxBytesReader(w, r.Body, maxUploadBodySize)
+	if err := r.ParseMultipartForm(uploadMemoryLimit); err != nil {
 		http.Error(w, "file too large", http.StatusBadRequest)
 		return
 	}
+	defer r.MultipartForm.RemoveAll()
 
 	// Get entity type
 	entityTypeStr := r.FormValue("entity_type")
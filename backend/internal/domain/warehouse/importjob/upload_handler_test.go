@@ -274,6 +274,24 @@ func TestUploadHandler_InvalidFileExtension(t *testing.T) {
 	}
 }
 
+func TestUploadHandler_RejectsOversizedBody(t *testing.T) {
+	setup := NewUploadTestSetup()
+	mockRepo := new(MockRepository)
+
+	handler := importjob.NewUploadHandler(mockRepo, nil)
+	handler.RegisterUploadRoutes(setup.Router)
+
+	content := bytes.Repeat([]byte("a"), importjob.MaxFileSize+2<<20)
+	req := createUploadRequest(t, "items", "big.csv", content)
+
+	rec := httptest.NewRecorder()
+	setup.Router.ServeHTTP(rec, req)
+
+	assert.Equal(t, http.StatusBadRequest, rec.Code)
+	assert.Contains(t, rec.Body.String(), "file too large")
+	mockRepo.AssertNotCalled(t, "SaveJob")
+}
+
 // Tests for Upload Handler - Missing Workspace Context
 
 func TestUploadHandler_MissingWorkspaceContext(t *testing.T) {
@@ -2,8 +2,10 @@ package postgres
 
 import (
 	"context"
+	"errors"
 
 	"github.com/google/uuid"
+	"github.com/jackc/pgx/v5"
 	"github.com/jackc/pgx/v5/pgtype"
 	"github.com/jackc/pgx/v5/pgxpool"
 
@@ -36,6 +38,8 @@ func (r *FavoriteRepository) Save(ctx context.Context, f *favorite.Favorite) err
 		containerID = pgtype.UUID{Bytes: *f.ContainerID(), Valid: true}
 	}
 
+	// CreateFavorite skips the insert on a unique-target conflict, which
+	// surfaces as no row returned.
 	_, err := r.queries.CreateFavorite(ctx, queries.CreateFavoriteParams{
 		ID:           f.ID(),
 		UserID:       f.UserID(),
@@ -45,14 +49,52 @@ func (r *FavoriteRepository) Save(ctx context.Context, f *favorite.Favorite) err
 		LocationID:   locationID,
 		ContainerID:  containerID,
 	})
+	if errors.Is(err, pgx.ErrNoRows) {
+		return favorite.ErrAlreadyFavorited
+	}
 	return err
 }
 
-func (r *FavoriteRepository) FindByUser(ctx context.Context, userID, workspaceID uuid.UUID) ([]*favorite.Favorite, error) {
-	rows, err := r.queries.ListFavoritesByUser(ctx, queries.ListFavoritesByUserParams{
+// SaveBatch inserts favorites in one statement and returns the ones that were
+// created; targets the user has already favorited are skipped.
+func (r *FavoriteRepository) SaveBatch(ctx context.Context, userID, workspaceID uuid.UUID, favorites []*favorite.Favorite) ([]*favorite.Favorite, error) {
+	params := queries.CreateFavoritesParams{
+		UserID:        userID,
+		WorkspaceID:   workspaceID,
+		Ids:           make([]uuid.UUID, len(favorites)),
+		FavoriteTypes: make([]string, len(favorites)),
+		TargetIds:     make([]uuid.UUID, len(favorites)),
+	}
+	for i, f := range favorites {
+		params.Ids[i] = f.ID()
+		params.FavoriteTypes[i] = string(f.FavoriteType())
+		params.TargetIds[i] = f.TargetID()
+	}
+
+	rows, err := r.queries.CreateFavorites(ctx, params)
+	if err != nil {
+		return nil, err
+	}
+
+	created := make([]*favorite.Favorite, len(rows))
+	for i, row := range rows {
+		created[i] = r.rowToFavorite(row)
+	}
+	return created, nil
+}
+
+func (r *FavoriteRepository) FindByUser(ctx context.Context, userID, workspaceID uuid.UUID, after *favorite.Cursor, limit int) ([]*favorite.Favorite, error) {
+	params := queries.ListFavoritesByUserParams{
 		UserID:      userID,
 		WorkspaceID: workspaceID,
-	})
+		Limit:       int32(limit),
+	}
+	if after != nil {
+		params.AfterCreatedAt = pgtype.Timestamptz{Time: after.CreatedAt, Valid: true}
+		params.AfterID = pgtype.UUID{Bytes: after.ID, Valid: true}
+	}
+
+	rows, err := r.queries.ListFavoritesByUser(ctx, params)
 	if err != nil {
 		return nil, err
 	}
@@ -65,12 +107,50 @@ func (r *FavoriteRepository) FindByUser(ctx context.Context, userID, workspaceID
 }
 
 func (r *FavoriteRepository) IsFavorite(ctx context.Context, userID, workspaceID uuid.UUID, favoriteType favorite.FavoriteType, targetID uuid.UUID) (bool, error) {
+	itemID, locationID, containerID := favoriteTargetColumns(favoriteType, targetID)
 	return r.queries.IsFavorite(ctx, queries.IsFavoriteParams{
+		UserID:      userID,
+		WorkspaceID: workspaceID,
+		ItemID:      itemID,
+		LocationID:  locationID,
+		ContainerID: containerID,
+	})
+}
+
+// Toggle removes f's target from the user's favorites if present and saves f
+// otherwise, returning whether the target is favorited afterwards.
+func (r *FavoriteRepository) Toggle(ctx context.Context, f *favorite.Favorite) (bool, error) {
+	itemID, locationID, containerID := favoriteTargetColumns(f.FavoriteType(), f.TargetID())
+	return r.queries.ToggleFavorite(ctx, queries.ToggleFavoriteParams{
+		UserID:       f.UserID(),
+		WorkspaceID:  f.WorkspaceID(),
+		ItemID:       itemID,
+		LocationID:   locationID,
+		ContainerID:  containerID,
+		ID:           f.ID(),
+		FavoriteType: queries.WarehouseFavoriteTypeEnum(f.FavoriteType()),
+	})
+}
+
+// FindFavoritedTargets returns the subset of targetIDs the user has favorited
+// as favoriteType, in one query.
+func (r *FavoriteRepository) FindFavoritedTargets(ctx context.Context, userID, workspaceID uuid.UUID, favoriteType favorite.FavoriteType, targetIDs []uuid.UUID) ([]uuid.UUID, error) {
+	params := queries.ListFavoritedTargetsParams{
 		UserID:       userID,
 		WorkspaceID:  workspaceID,
-		FavoriteType: queries.WarehouseFavoriteTypeEnum(favoriteType),
-		ItemID:       pgtype.UUID{Bytes: targetID, Valid: true},
-	})
+		ItemIds:      []uuid.UUID{},
+		LocationIds:  []uuid.UUID{},
+		ContainerIds: []uuid.UUID{},
+	}
+	switch favoriteType {
+	case favorite.TypeItem:
+		params.ItemIds = targetIDs
+	case favorite.TypeLocation:
+		params.LocationIds = targetIDs
+	case favorite.TypeContainer:
+		params.ContainerIds = targetIDs
+	}
+	return r.queries.ListFavoritedTargets(ctx, params)
 }
 
 func (r *FavoriteRepository) Delete(ctx context.Context, id, userID uuid.UUID) error {
@@ -81,14 +161,33 @@ func (r *FavoriteRepository) Delete(ctx context.Context, id, userID uuid.UUID) e
 }
 
 func (r *FavoriteRepository) DeleteByTarget(ctx context.Context, userID, workspaceID uuid.UUID, favoriteType favorite.FavoriteType, targetID uuid.UUID) error {
+	itemID, locationID, containerID := favoriteTargetColumns(favoriteType, targetID)
 	return r.queries.DeleteFavoriteByTarget(ctx, queries.DeleteFavoriteByTargetParams{
-		UserID:       userID,
-		WorkspaceID:  workspaceID,
-		FavoriteType: queries.WarehouseFavoriteTypeEnum(favoriteType),
-		ItemID:       pgtype.UUID{Bytes: targetID, Valid: true},
+		UserID:      userID,
+		WorkspaceID: workspaceID,
+		ItemID:      itemID,
+		LocationID:  locationID,
+		ContainerID: containerID,
 	})
 }
 
+// favoriteTargetColumns maps a favorite type to the nullable target column it
+// is stored in, so lookups filter on that column alone instead of branching
+// on favorite_type in SQL. Unknown types leave all three columns NULL, which
+// matches no rows.
+func favoriteTargetColumns(favoriteType favorite.FavoriteType, targetID uuid.UUID) (itemID, locationID, containerID pgtype.UUID) {
+	target := pgtype.UUID{Bytes: targetID, Valid: true}
+	switch favoriteType {
+	case favorite.TypeItem:
+		itemID = target
+	case favorite.TypeLocation:
+		locationID = target
+	case favorite.TypeContainer:
+		containerID = target
+	}
+	return itemID, locationID, containerID
+}
+
 func (r *FavoriteRepository) rowToFavorite(row queries.WarehouseFavorite) *favorite.Favorite {
 	var itemID, locationID, containerID *uuid.UUID
 
@@ -22,7 +22,7 @@ import (
 // (the id-only GetFavorite query was removed as dead/unscoped in the A3 fix).
 func findFavoriteByID(t *testing.T, ctx context.Context, repo *FavoriteRepository, f *favorite.Favorite) *favorite.Favorite {
 	t.Helper()
-	favorites, err := repo.FindByUser(ctx, f.UserID(), f.WorkspaceID())
+	favorites, err := repo.FindByUser(ctx, f.UserID(), f.WorkspaceID(), nil, 100)
 	require.NoError(t, err)
 	for _, got := range favorites {
 		if got.ID() == f.ID() {
@@ -93,6 +93,19 @@ func TestFavoriteRepository_Save(t *testing.T) {
 		assert.Equal(t, favorite.TypeLocation, retrieved.FavoriteType())
 		assert.Equal(t, loc.ID(), *retrieved.LocationID())
 	})
+
+	t.Run("returns ErrAlreadyFavorited for duplicate target", func(t *testing.T) {
+		itm, _ := item.NewItem(testfixtures.TestWorkspaceID, "Dup Fav Item "+uuid.NewString()[:4], "SKU-"+uuid.NewString()[:8], 0)
+		itm.SetShortCode(uuid.NewString()[:8])
+		require.NoError(t, itemRepo.Save(ctx, itm))
+
+		f, _ := favorite.NewFavorite(testfixtures.TestUserID, testfixtures.TestWorkspaceID, favorite.TypeItem, itm.ID())
+		require.NoError(t, repo.Save(ctx, f))
+
+		dup, _ := favorite.NewFavorite(testfixtures.TestUserID, testfixtures.TestWorkspaceID, favorite.TypeItem, itm.ID())
+		err := repo.Save(ctx, dup)
+		assert.ErrorIs(t, err, favorite.ErrAlreadyFavorited)
+	})
 }
 
 func TestFavoriteRepository_FindByUser(t *testing.T) {
@@ -116,10 +129,37 @@ func TestFavoriteRepository_FindByUser(t *testing.T) {
 			require.NoError(t, repo.Save(ctx, f))
 		}
 
-		favorites, err := repo.FindByUser(ctx, testfixtures.TestUserID, testfixtures.TestWorkspaceID)
+		favorites, err := repo.FindByUser(ctx, testfixtures.TestUserID, testfixtures.TestWorkspaceID, nil, 100)
 		require.NoError(t, err)
 		assert.GreaterOrEqual(t, len(favorites), 3)
 	})
+
+	t.Run("pages through favorites with a cursor", func(t *testing.T) {
+		for i := 0; i < 3; i++ {
+			itm, _ := item.NewItem(testfixtures.TestWorkspaceID, "Page Fav Item "+uuid.NewString()[:4], "SKU-"+uuid.NewString()[:8], 0)
+			itm.SetShortCode(uuid.NewString()[:8])
+			require.NoError(t, itemRepo.Save(ctx, itm))
+
+			f, _ := favorite.NewFavorite(testfixtures.TestUserID, testfixtures.TestWorkspaceID, favorite.TypeItem, itm.ID())
+			require.NoError(t, repo.Save(ctx, f))
+		}
+
+		first, err := repo.FindByUser(ctx, testfixtures.TestUserID, testfixtures.TestWorkspaceID, nil, 2)
+		require.NoError(t, err)
+		require.Len(t, first, 2)
+
+		last := first[1]
+		second, err := repo.FindByUser(ctx, testfixtures.TestUserID, testfixtures.TestWorkspaceID,
+			&favorite.Cursor{CreatedAt: last.CreatedAt(), ID: last.ID()}, 2)
+		require.NoError(t, err)
+		require.NotEmpty(t, second)
+
+		seen := map[uuid.UUID]bool{first[0].ID(): true, first[1].ID(): true}
+		for _, f := range second {
+			assert.False(t, seen[f.ID()], "page two repeats a favorite from page one")
+			assert.False(t, f.CreatedAt().After(last.CreatedAt()))
+		}
+	})
 }
 
 func TestFavoriteRepository_IsFavorite(t *testing.T) {
@@ -209,3 +249,106 @@ func TestFavoriteRepository_DeleteByTarget(t *testing.T) {
 		assert.False(t, isFav)
 	})
 }
+
+func TestFavoriteRepository_Toggle(t *testing.T) {
+	if testing.Short() {
+		t.Skip("skipping integration test")
+	}
+
+	pool := testdb.SetupTestDB(t)
+	repo := NewFavoriteRepository(pool)
+	itemRepo := NewItemRepository(pool)
+	ctx := context.Background()
+
+	t.Run("toggles favorite on and off", func(t *testing.T) {
+		itm, _ := item.NewItem(testfixtures.TestWorkspaceID, "Toggle Item "+uuid.NewString()[:4], "SKU-"+uuid.NewString()[:8], 0)
+		itm.SetShortCode(uuid.NewString()[:8])
+		require.NoError(t, itemRepo.Save(ctx, itm))
+
+		f, _ := favorite.NewFavorite(testfixtures.TestUserID, testfixtures.TestWorkspaceID, favorite.TypeItem, itm.ID())
+		favorited, err := repo.Toggle(ctx, f)
+		require.NoError(t, err)
+		assert.True(t, favorited)
+
+		isFav, err := repo.IsFavorite(ctx, testfixtures.TestUserID, testfixtures.TestWorkspaceID, favorite.TypeItem, itm.ID())
+		require.NoError(t, err)
+		assert.True(t, isFav)
+
+		f, _ = favorite.NewFavorite(testfixtures.TestUserID, testfixtures.TestWorkspaceID, favorite.TypeItem, itm.ID())
+		favorited, err = repo.Toggle(ctx, f)
+		require.NoError(t, err)
+		assert.False(t, favorited)
+
+		isFav, err = repo.IsFavorite(ctx, testfixtures.TestUserID, testfixtures.TestWorkspaceID, favorite.TypeItem, itm.ID())
+		require.NoError(t, err)
+		assert.False(t, isFav)
+	})
+}
+
+func TestFavoriteRepository_SaveBatch(t *testing.T) {
+	if testing.Short() {
+		t.Skip("skipping integration test")
+	}
+
+	pool := testdb.SetupTestDB(t)
+	repo := NewFavoriteRepository(pool)
+	itemRepo := NewItemRepository(pool)
+	locRepo := NewLocationRepository(pool)
+	ctx := context.Background()
+
+	t.Run("saves mixed targets and skips existing favorites", func(t *testing.T) {
+		itm, _ := item.NewItem(testfixtures.TestWorkspaceID, "Batch Fav Item "+uuid.NewString()[:4], "SKU-"+uuid.NewString()[:8], 0)
+		itm.SetShortCode(uuid.NewString()[:8])
+		require.NoError(t, itemRepo.Save(ctx, itm))
+
+		loc, err := location.NewLocation(testfixtures.TestWorkspaceID, "Batch Fav Loc "+uuid.NewString()[:4], nil, nil, uuid.NewString()[:8])
+		require.NoError(t, err)
+		require.NoError(t, locRepo.Save(ctx, loc))
+
+		existing, _ := favorite.NewFavorite(testfixtures.TestUserID, testfixtures.TestWorkspaceID, favorite.TypeItem, itm.ID())
+		require.NoError(t, repo.Save(ctx, existing))
+
+		itemFav, _ := favorite.NewFavorite(testfixtures.TestUserID, testfixtures.TestWorkspaceID, favorite.TypeItem, itm.ID())
+		locFav, _ := favorite.NewFavorite(testfixtures.TestUserID, testfixtures.TestWorkspaceID, favorite.TypeLocation, loc.ID())
+
+		created, err := repo.SaveBatch(ctx, testfixtures.TestUserID, testfixtures.TestWorkspaceID, []*favorite.Favorite{itemFav, locFav})
+		require.NoError(t, err)
+		require.Len(t, created, 1)
+		assert.Equal(t, locFav.ID(), created[0].ID())
+		assert.Equal(t, favorite.TypeLocation, created[0].FavoriteType())
+		assert.Equal(t, loc.ID(), *created[0].LocationID())
+		assert.Nil(t, created[0].ItemID())
+	})
+}
+
+func TestFavoriteRepository_FindFavoritedTargets(t *testing.T) {
+	if testing.Short() {
+		t.Skip("skipping integration test")
+	}
+
+	pool := testdb.SetupTestDB(t)
+	repo := NewFavoriteRepository(pool)
+	itemRepo := NewItemRepository(pool)
+	ctx := context.Background()
+
+	t.Run("returns only favorited targets", func(t *testing.T) {
+		var itemIDs []uuid.UUID
+		for i := 0; i < 3; i++ {
+			itm, _ := item.NewItem(testfixtures.TestWorkspaceID, "Check Fav Item "+uuid.NewString()[:4], "SKU-"+uuid.NewString()[:8], 0)
+			itm.SetShortCode(uuid.NewString()[:8])
+			require.NoError(t, itemRepo.Save(ctx, itm))
+			itemIDs = append(itemIDs, itm.ID())
+		}
+
+		f, _ := favorite.NewFavorite(testfixtures.TestUserID, testfixtures.TestWorkspaceID, favorite.TypeItem, itemIDs[1])
+		require.NoError(t, repo.Save(ctx, f))
+
+		favorited, err := repo.FindFavoritedTargets(ctx, testfixtures.TestUserID, testfixtures.TestWorkspaceID, favorite.TypeItem, itemIDs)
+		require.NoError(t, err)
+		assert.Equal(t, []uuid.UUID{itemIDs[1]}, favorited)
+
+		favorited, err = repo.FindFavoritedTargets(ctx, testfixtures.TestUserID, testfixtures.TestWorkspaceID, favorite.TypeLocation, itemIDs)
+		require.NoError(t, err)
+		assert.Empty(t, favorited)
+	})
+}
@@ -24,9 +24,9 @@ func NewImportExportRepositoryFromQueries(q *queries.Queries) *ImportExportRepos
 	return &ImportExportRepository{q: q}
 }
 
-// ListAllItems returns all items in a workspace
-func (r *ImportExportRepository) ListAllItems(ctx context.Context, workspaceID uuid.UUID, includeArchived bool) ([]queries.WarehouseItem, error) {
-	return r.q.ListAllItems(ctx, queries.ListAllItemsParams{
+// ListAllItems returns all items in a workspace with category names resolved
+func (r *ImportExportRepository) ListAllItems(ctx context.Context, workspaceID uuid.UUID, includeArchived bool) ([]queries.ListItemsForExportRow, error) {
+	return r.q.ListItemsForExport(ctx, queries.ListItemsForExportParams{
 		WorkspaceID:     workspaceID,
 		IncludeArchived: includeArchived,
 	})
@@ -49,9 +49,9 @@ func (r *ImportExportRepository) GetCategoryByName(ctx context.Context, workspac
 	return &cat, nil
 }
 
-// ListAllLocations returns all locations in a workspace
-func (r *ImportExportRepository) ListAllLocations(ctx context.Context, workspaceID uuid.UUID, includeArchived bool) ([]queries.WarehouseLocation, error) {
-	return r.q.ListAllLocations(ctx, queries.ListAllLocationsParams{
+// ListAllLocations returns all locations in a workspace with parent location names resolved
+func (r *ImportExportRepository) ListAllLocations(ctx context.Context, workspaceID uuid.UUID, includeArchived bool) ([]queries.ListLocationsForExportRow, error) {
+	return r.q.ListLocationsForExport(ctx, queries.ListLocationsForExportParams{
 		WorkspaceID:     workspaceID,
 		IncludeArchived: includeArchived,
 	})
@@ -74,9 +74,9 @@ func (r *ImportExportRepository) GetLocationByName(ctx context.Context, workspac
 	return &loc, nil
 }
 
-// ListAllCategories returns all categories in a workspace
-func (r *ImportExportRepository) ListAllCategories(ctx context.Context, workspaceID uuid.UUID, includeArchived bool) ([]queries.WarehouseCategory, error) {
-	return r.q.ListAllCategories(ctx, queries.ListAllCategoriesParams{
+// ListAllCategories returns all categories in a workspace with parent category names resolved
+func (r *ImportExportRepository) ListAllCategories(ctx context.Context, workspaceID uuid.UUID, includeArchived bool) ([]queries.ListCategoriesForExportRow, error) {
+	return r.q.ListCategoriesForExport(ctx, queries.ListCategoriesForExportParams{
 		WorkspaceID:     workspaceID,
 		IncludeArchived: includeArchived,
 	})
@@ -87,9 +87,9 @@ func (r *ImportExportRepository) CreateCategory(ctx context.Context, params quer
 	return r.q.CreateCategory(ctx, params)
 }
 
-// ListAllContainers returns all containers in a workspace
-func (r *ImportExportRepository) ListAllContainers(ctx context.Context, workspaceID uuid.UUID, includeArchived bool) ([]queries.WarehouseContainer, error) {
-	return r.q.ListAllContainers(ctx, queries.ListAllContainersParams{
+// ListAllContainers returns all containers in a workspace with location names resolved
+func (r *ImportExportRepository) ListAllContainers(ctx context.Context, workspaceID uuid.UUID, includeArchived bool) ([]queries.ListContainersForExportRow, error) {
+	return r.q.ListContainersForExport(ctx, queries.ListContainersForExportParams{
 		WorkspaceID:     workspaceID,
 		IncludeArchived: includeArchived,
 	})
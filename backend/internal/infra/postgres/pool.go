@@ -11,6 +11,27 @@ import (
 // from config (DATABASE_MAX_CONN / DATABASE_MIN_CONN); non-positive values
 // fall back to the previous hardcoded defaults.
 func NewPool(ctx context.Context, databaseURL string, maxConns, minConns int) (*pgxpool.Pool, error) {
+	config, err := newPoolConfig(databaseURL, maxConns, minConns)
+	if err != nil {
+		return nil, err
+	}
+
+	pool, err := pgxpool.NewWithConfig(ctx, config)
+	if err != nil {
+		return nil, fmt.Errorf("failed to create connection pool: %w", err)
+	}
+
+	// Verify connection
+	if err := pool.Ping(ctx); err != nil {
+		return nil, fmt.Errorf("failed to ping database: %w", err)
+	}
+
+	return pool, nil
+}
+
+// newPoolConfig parses databaseURL and applies the pool sizing defaults.
+// Split out of NewPool so the settings can be checked without a database.
+func newPoolConfig(databaseURL string, maxConns, minConns int) (*pgxpool.Config, error) {
 	config, err := pgxpool.ParseConfig(databaseURL)
 	if err != nil {
 		return nil, fmt.Errorf("failed to parse database URL: %w", err)
@@ -26,15 +47,12 @@ func NewPool(ctx context.Context, databaseURL string, maxConns, minConns int) (*
 	config.MaxConns = int32(maxConns)
 	config.MinConns = int32(minConns)
 
-	pool, err := pgxpool.NewWithConfig(ctx, config)
-	if err != nil {
-		return nil, fmt.Errorf("failed to create connection pool: %w", err)
-	}
+	// Statement caching is left at pgx's default (QueryExecModeCacheStatement):
+	// each sqlc query is prepared once per connection and reused by name, so
+	// hot paths like the workspace export never re-parse or re-plan their SQL.
+	// The per-connection cache (512 entries) comfortably holds every query in
+	// db/queries. A default_query_exec_mode in the URL still takes precedence,
+	// which matters behind transaction-pooling PgBouncer.
 
-	// Verify connection
-	if err := pool.Ping(ctx); err != nil {
-		return nil, fmt.Errorf("failed to ping database: %w", err)
-	}
-
-	return pool, nil
+	return config, nil
 }
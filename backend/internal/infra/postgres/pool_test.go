@@ -0,0 +1,44 @@
+package postgres
+
+import (
+	"testing"
+
+	"github.com/jackc/pgx/v5"
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+const testPoolURL = "postgresql://wh:wh@localhost:5432/warehouse_test"
+
+func TestNewPoolConfig_Defaults(t *testing.T) {
+	config, err := newPoolConfig(testPoolURL, 0, 0)
+	require.NoError(t, err)
+
+	assert.Equal(t, int32(25), config.MaxConns)
+	assert.Equal(t, int32(5), config.MinConns)
+	// Short, high-QPS endpoints (favorites, lookups) rely on warm connections
+	// reusing prepared statements rather than re-planning per request.
+	assert.Equal(t, pgx.QueryExecModeCacheStatement, config.ConnConfig.DefaultQueryExecMode)
+	assert.GreaterOrEqual(t, config.ConnConfig.StatementCacheCapacity, 512)
+	assert.Positive(t, config.HealthCheckPeriod)
+}
+
+func TestNewPoolConfig_ExplicitSizes(t *testing.T) {
+	config, err := newPoolConfig(testPoolURL, 50, 10)
+	require.NoError(t, err)
+
+	assert.Equal(t, int32(50), config.MaxConns)
+	assert.Equal(t, int32(10), config.MinConns)
+}
+
+func TestNewPoolConfig_URLExecModeOverride(t *testing.T) {
+	config, err := newPoolConfig(testPoolURL+"?default_query_exec_mode=exec", 0, 0)
+	require.NoError(t, err)
+
+	assert.Equal(t, pgx.QueryExecModeExec, config.ConnConfig.DefaultQueryExecMode)
+}
+
+func TestNewPoolConfig_InvalidURL(t *testing.T) {
+	_, err := newPoolConfig("postgres://%zz", 0, 0)
+	assert.Error(t, err)
+}
@@ -257,8 +257,8 @@ func (q *Queries) ListAttachmentsByItem(ctx context.Context, arg ListAttachments
 
 const setPrimaryAttachment = `-- name: SetPrimaryAttachment :exec
 UPDATE warehouse.attachments
-SET is_primary = (id = $2)
-WHERE item_id = $1 AND workspace_id = $3
+SET is_primary = (id = $2), updated_at = now()
+WHERE item_id = $1 AND workspace_id = $3 AND is_primary IS DISTINCT FROM (id = $2)
 `
 
 type SetPrimaryAttachmentParams struct {
@@ -198,6 +198,39 @@ func (q *Queries) ListCategoriesByParent(ctx context.Context, arg ListCategories
 	return items, nil
 }
 
+const listCategoryRefs = `-- name: ListCategoryRefs :many
+SELECT id, name FROM warehouse.categories
+WHERE workspace_id = $1 AND is_archived = false
+ORDER BY name
+`
+
+type ListCategoryRefsRow struct {
+	ID   uuid.UUID `json:"id"`
+	Name string    `json:"name"`
+}
+
+// ListCategoryRefs returns just the columns the import worker resolves
+// category references by, for all active categories of a workspace.
+func (q *Queries) ListCategoryRefs(ctx context.Context, workspaceID uuid.UUID) ([]ListCategoryRefsRow, error) {
+	rows, err := q.db.Query(ctx, listCategoryRefs, workspaceID)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+	items := []ListCategoryRefsRow{}
+	for rows.Next() {
+		var i ListCategoryRefsRow
+		if err := rows.Scan(&i.ID, &i.Name); err != nil {
+			return nil, err
+		}
+		items = append(items, i)
+	}
+	if err := rows.Err(); err != nil {
+		return nil, err
+	}
+	return items, nil
+}
+
 const listRootCategories = `-- name: ListRootCategories :many
 SELECT id, workspace_id, name, parent_category_id, description, is_archived, created_at, updated_at FROM warehouse.categories
 WHERE workspace_id = $1 AND parent_category_id IS NULL AND is_archived = false
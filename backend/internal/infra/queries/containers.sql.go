@@ -142,6 +142,40 @@ func (q *Queries) GetContainerByShortCode(ctx context.Context, arg GetContainerB
 	return i, err
 }
 
+const listContainerRefs = `-- name: ListContainerRefs :many
+SELECT id, name, short_code FROM warehouse.containers
+WHERE workspace_id = $1 AND is_archived = false
+ORDER BY name
+`
+
+type ListContainerRefsRow struct {
+	ID        uuid.UUID `json:"id"`
+	Name      string    `json:"name"`
+	ShortCode string    `json:"short_code"`
+}
+
+// ListContainerRefs returns just the columns the import worker resolves
+// container references by, for all active containers of a workspace.
+func (q *Queries) ListContainerRefs(ctx context.Context, workspaceID uuid.UUID) ([]ListContainerRefsRow, error) {
+	rows, err := q.db.Query(ctx, listContainerRefs, workspaceID)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+	items := []ListContainerRefsRow{}
+	for rows.Next() {
+		var i ListContainerRefsRow
+		if err := rows.Scan(&i.ID, &i.Name, &i.ShortCode); err != nil {
+			return nil, err
+		}
+		items = append(items, i)
+	}
+	if err := rows.Err(); err != nil {
+		return nil, err
+	}
+	return items, nil
+}
+
 const listContainersByLocation = `-- name: ListContainersByLocation :many
 SELECT id, workspace_id, name, location_id, description, capacity, short_code, is_archived, search_vector, created_at, updated_at FROM warehouse.containers
 WHERE workspace_id = $1 AND location_id = $2 AND is_archived = false
@@ -103,6 +103,50 @@ func (q *Queries) GetLocationByName(ctx context.Context, arg GetLocationByNamePa
 	return i, err
 }
 
+const getWorkspaceExportVersion = `-- name: GetWorkspaceExportVersion :one
+SELECT
+    (
+        (SELECT count(*) FROM warehouse.categories WHERE workspace_id = $1) +
+        (SELECT count(*) FROM warehouse.labels WHERE workspace_id = $1) +
+        (SELECT count(*) FROM warehouse.companies WHERE workspace_id = $1) +
+        (SELECT count(*) FROM warehouse.locations WHERE workspace_id = $1) +
+        (SELECT count(*) FROM warehouse.borrowers WHERE workspace_id = $1) +
+        (SELECT count(*) FROM warehouse.items WHERE workspace_id = $1) +
+        (SELECT count(*) FROM warehouse.containers WHERE workspace_id = $1) +
+        (SELECT count(*) FROM warehouse.inventory WHERE workspace_id = $1) +
+        (SELECT count(*) FROM warehouse.loans WHERE workspace_id = $1) +
+        (SELECT count(*) FROM warehouse.attachments WHERE workspace_id = $1)
+    )::bigint AS record_count,
+    GREATEST(
+        (SELECT max(updated_at) FROM warehouse.categories WHERE workspace_id = $1),
+        (SELECT max(updated_at) FROM warehouse.labels WHERE workspace_id = $1),
+        (SELECT max(updated_at) FROM warehouse.companies WHERE workspace_id = $1),
+        (SELECT max(updated_at) FROM warehouse.locations WHERE workspace_id = $1),
+        (SELECT max(updated_at) FROM warehouse.borrowers WHERE workspace_id = $1),
+        (SELECT max(updated_at) FROM warehouse.items WHERE workspace_id = $1),
+        (SELECT max(updated_at) FROM warehouse.containers WHERE workspace_id = $1),
+        (SELECT max(updated_at) FROM warehouse.inventory WHERE workspace_id = $1),
+        (SELECT max(updated_at) FROM warehouse.loans WHERE workspace_id = $1),
+        (SELECT max(updated_at) FROM warehouse.attachments WHERE workspace_id = $1)
+    )::timestamptz AS last_updated
+`
+
+type GetWorkspaceExportVersionRow struct {
+	RecordCount int64              `json:"record_count"`
+	LastUpdated pgtype.Timestamptz `json:"last_updated"`
+}
+
+// Cheap fingerprint of everything a workspace backup contains. Inserts and
+// deletes change the row count; every UPDATE on these tables must also set
+// updated_at = now() or the change is invisible here. Deletes never advance
+// last_updated, so it is only usable as part of the ETag, not as Last-Modified.
+func (q *Queries) GetWorkspaceExportVersion(ctx context.Context, workspaceID uuid.UUID) (GetWorkspaceExportVersionRow, error) {
+	row := q.db.QueryRow(ctx, getWorkspaceExportVersion, workspaceID)
+	var i GetWorkspaceExportVersionRow
+	err := row.Scan(&i.RecordCount, &i.LastUpdated)
+	return i, err
+}
+
 const listAllAttachments = `-- name: ListAllAttachments :many
 SELECT a.id, a.item_id, a.file_id, a.attachment_type, a.title, a.is_primary, a.external_doc_id, a.created_at, a.updated_at, a.workspace_id, a.dms_type FROM warehouse.attachments a
 JOIN warehouse.items i ON a.item_id = i.id
@@ -808,6 +852,259 @@ func (q *Queries) ListAllLocationsIncludingArchived(ctx context.Context, workspa
 	return items, nil
 }
 
+const listCategoriesForExport = `-- name: ListCategoriesForExport :many
+SELECT c.id, c.workspace_id, c.name, c.parent_category_id, c.description,
+       c.is_archived, c.created_at, c.updated_at,
+       p.name AS parent_category_name
+FROM warehouse.categories c
+LEFT JOIN warehouse.categories p ON p.id = c.parent_category_id
+WHERE c.workspace_id = $1
+  AND ($2::boolean OR c.is_archived = false)
+ORDER BY c.name
+`
+
+type ListCategoriesForExportParams struct {
+	WorkspaceID     uuid.UUID `json:"workspace_id"`
+	IncludeArchived bool      `json:"include_archived"`
+}
+
+type ListCategoriesForExportRow struct {
+	ID                 uuid.UUID          `json:"id"`
+	WorkspaceID        uuid.UUID          `json:"workspace_id"`
+	Name               string             `json:"name"`
+	ParentCategoryID   pgtype.UUID        `json:"parent_category_id"`
+	Description        *string            `json:"description"`
+	IsArchived         bool               `json:"is_archived"`
+	CreatedAt          pgtype.Timestamptz `json:"created_at"`
+	UpdatedAt          pgtype.Timestamptz `json:"updated_at"`
+	ParentCategoryName *string            `json:"parent_category_name"`
+}
+
+func (q *Queries) ListCategoriesForExport(ctx context.Context, arg ListCategoriesForExportParams) ([]ListCategoriesForExportRow, error) {
+	rows, err := q.db.Query(ctx, listCategoriesForExport, arg.WorkspaceID, arg.IncludeArchived)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+	items := []ListCategoriesForExportRow{}
+	for rows.Next() {
+		var i ListCategoriesForExportRow
+		if err := rows.Scan(
+			&i.ID,
+			&i.WorkspaceID,
+			&i.Name,
+			&i.ParentCategoryID,
+			&i.Description,
+			&i.IsArchived,
+			&i.CreatedAt,
+			&i.UpdatedAt,
+			&i.ParentCategoryName,
+		); err != nil {
+			return nil, err
+		}
+		items = append(items, i)
+	}
+	if err := rows.Err(); err != nil {
+		return nil, err
+	}
+	return items, nil
+}
+
+const listContainersForExport = `-- name: ListContainersForExport :many
+SELECT c.id, c.workspace_id, c.name, c.location_id, c.description, c.capacity,
+       c.short_code, c.is_archived, c.created_at, c.updated_at,
+       l.name AS location_name
+FROM warehouse.containers c
+JOIN warehouse.locations l ON l.id = c.location_id
+WHERE c.workspace_id = $1
+  AND ($2::boolean OR c.is_archived = false)
+ORDER BY c.name
+`
+
+type ListContainersForExportParams struct {
+	WorkspaceID     uuid.UUID `json:"workspace_id"`
+	IncludeArchived bool      `json:"include_archived"`
+}
+
+type ListContainersForExportRow struct {
+	ID           uuid.UUID          `json:"id"`
+	WorkspaceID  uuid.UUID          `json:"workspace_id"`
+	Name         string             `json:"name"`
+	LocationID   uuid.UUID          `json:"location_id"`
+	Description  *string            `json:"description"`
+	Capacity     *string            `json:"capacity"`
+	ShortCode    string             `json:"short_code"`
+	IsArchived   bool               `json:"is_archived"`
+	CreatedAt    pgtype.Timestamptz `json:"created_at"`
+	UpdatedAt    pgtype.Timestamptz `json:"updated_at"`
+	LocationName string             `json:"location_name"`
+}
+
+func (q *Queries) ListContainersForExport(ctx context.Context, arg ListContainersForExportParams) ([]ListContainersForExportRow, error) {
+	rows, err := q.db.Query(ctx, listContainersForExport, arg.WorkspaceID, arg.IncludeArchived)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+	items := []ListContainersForExportRow{}
+	for rows.Next() {
+		var i ListContainersForExportRow
+		if err := rows.Scan(
+			&i.ID,
+			&i.WorkspaceID,
+			&i.Name,
+			&i.LocationID,
+			&i.Description,
+			&i.Capacity,
+			&i.ShortCode,
+			&i.IsArchived,
+			&i.CreatedAt,
+			&i.UpdatedAt,
+			&i.LocationName,
+		); err != nil {
+			return nil, err
+		}
+		items = append(items, i)
+	}
+	if err := rows.Err(); err != nil {
+		return nil, err
+	}
+	return items, nil
+}
+
+const listItemsForExport = `-- name: ListItemsForExport :many
+SELECT i.id, i.workspace_id, i.sku, i.name, i.description, i.category_id,
+       i.brand, i.model, i.manufacturer, i.barcode, i.short_code,
+       i.min_stock_level, i.is_archived, i.created_at, i.updated_at,
+       c.name AS category_name
+FROM warehouse.items i
+LEFT JOIN warehouse.categories c ON c.id = i.category_id
+WHERE i.workspace_id = $1
+  AND ($2::boolean OR i.is_archived = false)
+ORDER BY i.name
+`
+
+type ListItemsForExportParams struct {
+	WorkspaceID     uuid.UUID `json:"workspace_id"`
+	IncludeArchived bool      `json:"include_archived"`
+}
+
+type ListItemsForExportRow struct {
+	ID            uuid.UUID          `json:"id"`
+	WorkspaceID   uuid.UUID          `json:"workspace_id"`
+	Sku           string             `json:"sku"`
+	Name          string             `json:"name"`
+	Description   *string            `json:"description"`
+	CategoryID    pgtype.UUID        `json:"category_id"`
+	Brand         *string            `json:"brand"`
+	Model         *string            `json:"model"`
+	Manufacturer  *string            `json:"manufacturer"`
+	Barcode       *string            `json:"barcode"`
+	ShortCode     string             `json:"short_code"`
+	MinStockLevel int32              `json:"min_stock_level"`
+	IsArchived    bool               `json:"is_archived"`
+	CreatedAt     pgtype.Timestamptz `json:"created_at"`
+	UpdatedAt     pgtype.Timestamptz `json:"updated_at"`
+	CategoryName  *string            `json:"category_name"`
+}
+
+func (q *Queries) ListItemsForExport(ctx context.Context, arg ListItemsForExportParams) ([]ListItemsForExportRow, error) {
+	rows, err := q.db.Query(ctx, listItemsForExport, arg.WorkspaceID, arg.IncludeArchived)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+	items := []ListItemsForExportRow{}
+	for rows.Next() {
+		var i ListItemsForExportRow
+		if err := rows.Scan(
+			&i.ID,
+			&i.WorkspaceID,
+			&i.Sku,
+			&i.Name,
+			&i.Description,
+			&i.CategoryID,
+			&i.Brand,
+			&i.Model,
+			&i.Manufacturer,
+			&i.Barcode,
+			&i.ShortCode,
+			&i.MinStockLevel,
+			&i.IsArchived,
+			&i.CreatedAt,
+			&i.UpdatedAt,
+			&i.CategoryName,
+		); err != nil {
+			return nil, err
+		}
+		items = append(items, i)
+	}
+	if err := rows.Err(); err != nil {
+		return nil, err
+	}
+	return items, nil
+}
+
+const listLocationsForExport = `-- name: ListLocationsForExport :many
+SELECT l.id, l.workspace_id, l.name, l.parent_location, l.description,
+       l.short_code, l.is_archived, l.created_at, l.updated_at,
+       p.name AS parent_location_name
+FROM warehouse.locations l
+LEFT JOIN warehouse.locations p ON p.id = l.parent_location
+WHERE l.workspace_id = $1
+  AND ($2::boolean OR l.is_archived = false)
+ORDER BY l.name
+`
+
+type ListLocationsForExportParams struct {
+	WorkspaceID     uuid.UUID `json:"workspace_id"`
+	IncludeArchived bool      `json:"include_archived"`
+}
+
+type ListLocationsForExportRow struct {
+	ID                 uuid.UUID          `json:"id"`
+	WorkspaceID        uuid.UUID          `json:"workspace_id"`
+	Name               string             `json:"name"`
+	ParentLocation     pgtype.UUID        `json:"parent_location"`
+	Description        *string            `json:"description"`
+	ShortCode          string             `json:"short_code"`
+	IsArchived         bool               `json:"is_archived"`
+	CreatedAt          pgtype.Timestamptz `json:"created_at"`
+	UpdatedAt          pgtype.Timestamptz `json:"updated_at"`
+	ParentLocationName *string            `json:"parent_location_name"`
+}
+
+func (q *Queries) ListLocationsForExport(ctx context.Context, arg ListLocationsForExportParams) ([]ListLocationsForExportRow, error) {
+	rows, err := q.db.Query(ctx, listLocationsForExport, arg.WorkspaceID, arg.IncludeArchived)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+	items := []ListLocationsForExportRow{}
+	for rows.Next() {
+		var i ListLocationsForExportRow
+		if err := rows.Scan(
+			&i.ID,
+			&i.WorkspaceID,
+			&i.Name,
+			&i.ParentLocation,
+			&i.Description,
+			&i.ShortCode,
+			&i.IsArchived,
+			&i.CreatedAt,
+			&i.UpdatedAt,
+			&i.ParentLocationName,
+		); err != nil {
+			return nil, err
+		}
+		items = append(items, i)
+	}
+	if err := rows.Err(); err != nil {
+		return nil, err
+	}
+	return items, nil
+}
+
 const listWorkspaceExports = `-- name: ListWorkspaceExports :many
 SELECT id, workspace_id, exported_by, format, file_size_bytes, record_counts, created_at FROM auth.workspace_exports
 WHERE workspace_id = $1
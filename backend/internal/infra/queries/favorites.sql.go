@@ -15,6 +15,7 @@ import (
 const createFavorite = `-- name: CreateFavorite :one
 INSERT INTO warehouse.favorites (id, user_id, workspace_id, favorite_type, item_id, location_id, container_id)
 VALUES ($1, $2, $3, $4, $5, $6, $7)
+ON CONFLICT DO NOTHING
 RETURNING id, user_id, workspace_id, favorite_type, item_id, location_id, container_id, created_at
 `
 
@@ -52,6 +53,63 @@ func (q *Queries) CreateFavorite(ctx context.Context, arg CreateFavoriteParams)
 	return i, err
 }
 
+const createFavorites = `-- name: CreateFavorites :many
+INSERT INTO warehouse.favorites (id, user_id, workspace_id, favorite_type, item_id, location_id, container_id)
+SELECT t.id, $1::uuid, $2::uuid, t.favorite_type::warehouse.favorite_type_enum,
+       CASE WHEN t.favorite_type = 'ITEM' THEN t.target_id END,
+       CASE WHEN t.favorite_type = 'LOCATION' THEN t.target_id END,
+       CASE WHEN t.favorite_type = 'CONTAINER' THEN t.target_id END
+FROM unnest($3::uuid[], $4::text[], $5::uuid[]) AS t(id, favorite_type, target_id)
+ON CONFLICT DO NOTHING
+RETURNING id, user_id, workspace_id, favorite_type, item_id, location_id, container_id, created_at
+`
+
+type CreateFavoritesParams struct {
+	UserID        uuid.UUID   `json:"user_id"`
+	WorkspaceID   uuid.UUID   `json:"workspace_id"`
+	Ids           []uuid.UUID `json:"ids"`
+	FavoriteTypes []string    `json:"favorite_types"`
+	TargetIds     []uuid.UUID `json:"target_ids"`
+}
+
+// Inserts a batch of favorites for one user in a single statement. Each row's
+// target_id lands in the column matching its favorite_type; targets the user
+// has already favorited are skipped and not returned.
+func (q *Queries) CreateFavorites(ctx context.Context, arg CreateFavoritesParams) ([]WarehouseFavorite, error) {
+	rows, err := q.db.Query(ctx, createFavorites,
+		arg.UserID,
+		arg.WorkspaceID,
+		arg.Ids,
+		arg.FavoriteTypes,
+		arg.TargetIds,
+	)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+	items := []WarehouseFavorite{}
+	for rows.Next() {
+		var i WarehouseFavorite
+		if err := rows.Scan(
+			&i.ID,
+			&i.UserID,
+			&i.WorkspaceID,
+			&i.FavoriteType,
+			&i.ItemID,
+			&i.LocationID,
+			&i.ContainerID,
+			&i.CreatedAt,
+		); err != nil {
+			return nil, err
+		}
+		items = append(items, i)
+	}
+	if err := rows.Err(); err != nil {
+		return nil, err
+	}
+	return items, nil
+}
+
 const deleteFavorite = `-- name: DeleteFavorite :exec
 DELETE FROM warehouse.favorites WHERE id = $1 AND user_id = $2
 `
@@ -68,25 +126,25 @@ func (q *Queries) DeleteFavorite(ctx context.Context, arg DeleteFavoriteParams)
 
 const deleteFavoriteByTarget = `-- name: DeleteFavoriteByTarget :exec
 DELETE FROM warehouse.favorites
-WHERE user_id = $1 AND workspace_id = $2 AND favorite_type = $3
-  AND ((favorite_type = 'ITEM' AND item_id = $4)
-    OR (favorite_type = 'LOCATION' AND location_id = $4)
-    OR (favorite_type = 'CONTAINER' AND container_id = $4))
+WHERE user_id = $1 AND workspace_id = $2
+  AND (item_id = $3 OR location_id = $4 OR container_id = $5)
 `
 
 type DeleteFavoriteByTargetParams struct {
-	UserID       uuid.UUID                 `json:"user_id"`
-	WorkspaceID  uuid.UUID                 `json:"workspace_id"`
-	FavoriteType WarehouseFavoriteTypeEnum `json:"favorite_type"`
-	ItemID       pgtype.UUID               `json:"item_id"`
+	UserID      uuid.UUID   `json:"user_id"`
+	WorkspaceID uuid.UUID   `json:"workspace_id"`
+	ItemID      pgtype.UUID `json:"item_id"`
+	LocationID  pgtype.UUID `json:"location_id"`
+	ContainerID pgtype.UUID `json:"container_id"`
 }
 
 func (q *Queries) DeleteFavoriteByTarget(ctx context.Context, arg DeleteFavoriteByTargetParams) error {
 	_, err := q.db.Exec(ctx, deleteFavoriteByTarget,
 		arg.UserID,
 		arg.WorkspaceID,
-		arg.FavoriteType,
 		arg.ItemID,
+		arg.LocationID,
+		arg.ContainerID,
 	)
 	return err
 }
@@ -185,45 +243,105 @@ func (q *Queries) GetFavoriteItems(ctx context.Context, arg GetFavoriteItemsPara
 const isFavorite = `-- name: IsFavorite :one
 SELECT EXISTS(
     SELECT 1 FROM warehouse.favorites
-    WHERE user_id = $1 AND workspace_id = $2 AND favorite_type = $3
-      AND ((favorite_type = 'ITEM' AND item_id = $4)
-        OR (favorite_type = 'LOCATION' AND location_id = $4)
-        OR (favorite_type = 'CONTAINER' AND container_id = $4))
+    WHERE user_id = $1 AND workspace_id = $2
+      AND (item_id = $3 OR location_id = $4 OR container_id = $5)
 )
 `
 
 type IsFavoriteParams struct {
-	UserID       uuid.UUID                 `json:"user_id"`
-	WorkspaceID  uuid.UUID                 `json:"workspace_id"`
-	FavoriteType WarehouseFavoriteTypeEnum `json:"favorite_type"`
-	ItemID       pgtype.UUID               `json:"item_id"`
+	UserID      uuid.UUID   `json:"user_id"`
+	WorkspaceID uuid.UUID   `json:"workspace_id"`
+	ItemID      pgtype.UUID `json:"item_id"`
+	LocationID  pgtype.UUID `json:"location_id"`
+	ContainerID pgtype.UUID `json:"container_id"`
 }
 
 func (q *Queries) IsFavorite(ctx context.Context, arg IsFavoriteParams) (bool, error) {
 	row := q.db.QueryRow(ctx, isFavorite,
 		arg.UserID,
 		arg.WorkspaceID,
-		arg.FavoriteType,
 		arg.ItemID,
+		arg.LocationID,
+		arg.ContainerID,
 	)
 	var exists bool
 	err := row.Scan(&exists)
 	return exists, err
 }
 
+const listFavoritedTargets = `-- name: ListFavoritedTargets :many
+SELECT COALESCE(item_id, location_id, container_id)::uuid AS target_id
+FROM warehouse.favorites
+WHERE user_id = $1 AND workspace_id = $2
+  AND (item_id = ANY($3::uuid[])
+    OR location_id = ANY($4::uuid[])
+    OR container_id = ANY($5::uuid[]))
+`
+
+type ListFavoritedTargetsParams struct {
+	UserID       uuid.UUID   `json:"user_id"`
+	WorkspaceID  uuid.UUID   `json:"workspace_id"`
+	ItemIds      []uuid.UUID `json:"item_ids"`
+	LocationIds  []uuid.UUID `json:"location_ids"`
+	ContainerIds []uuid.UUID `json:"container_ids"`
+}
+
+// Returns which of the given targets the user has favorited. Only the array
+// for the requested type is non-empty, so each branch probes that type's
+// partial unique index on (user_id, <target>).
+func (q *Queries) ListFavoritedTargets(ctx context.Context, arg ListFavoritedTargetsParams) ([]uuid.UUID, error) {
+	rows, err := q.db.Query(ctx, listFavoritedTargets,
+		arg.UserID,
+		arg.WorkspaceID,
+		arg.ItemIds,
+		arg.LocationIds,
+		arg.ContainerIds,
+	)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+	items := []uuid.UUID{}
+	for rows.Next() {
+		var target_id uuid.UUID
+		if err := rows.Scan(&target_id); err != nil {
+			return nil, err
+		}
+		items = append(items, target_id)
+	}
+	if err := rows.Err(); err != nil {
+		return nil, err
+	}
+	return items, nil
+}
+
 const listFavoritesByUser = `-- name: ListFavoritesByUser :many
 SELECT id, user_id, workspace_id, favorite_type, item_id, location_id, container_id, created_at FROM warehouse.favorites
 WHERE user_id = $1 AND workspace_id = $2
-ORDER BY created_at DESC
+  AND ($3::timestamptz IS NULL
+       OR (created_at, id) < ($3::timestamptz, $4::uuid))
+ORDER BY created_at DESC, id DESC
+LIMIT $5
 `
 
 type ListFavoritesByUserParams struct {
-	UserID      uuid.UUID `json:"user_id"`
-	WorkspaceID uuid.UUID `json:"workspace_id"`
+	UserID         uuid.UUID          `json:"user_id"`
+	WorkspaceID    uuid.UUID          `json:"workspace_id"`
+	AfterCreatedAt pgtype.Timestamptz `json:"after_created_at"`
+	AfterID        pgtype.UUID        `json:"after_id"`
+	Limit          int32              `json:"limit"`
 }
 
+// Keyset-paginated, newest first. Pass the last row's (created_at, id) as
+// after_created_at/after_id to fetch the next page; NULL starts from the top.
 func (q *Queries) ListFavoritesByUser(ctx context.Context, arg ListFavoritesByUserParams) ([]WarehouseFavorite, error) {
-	rows, err := q.db.Query(ctx, listFavoritesByUser, arg.UserID, arg.WorkspaceID)
+	rows, err := q.db.Query(ctx, listFavoritesByUser,
+		arg.UserID,
+		arg.WorkspaceID,
+		arg.AfterCreatedAt,
+		arg.AfterID,
+		arg.Limit,
+	)
 	if err != nil {
 		return nil, err
 	}
@@ -250,3 +368,48 @@ func (q *Queries) ListFavoritesByUser(ctx context.Context, arg ListFavoritesByUs
 	}
 	return items, nil
 }
+
+const toggleFavorite = `-- name: ToggleFavorite :one
+WITH del AS (
+    DELETE FROM warehouse.favorites
+    WHERE user_id = $1 AND workspace_id = $2
+      AND (item_id = $3 OR location_id = $4 OR container_id = $5)
+    RETURNING id
+), ins AS (
+    INSERT INTO warehouse.favorites (id, user_id, workspace_id, favorite_type, item_id, location_id, container_id)
+    SELECT $6::uuid, $1, $2,
+           $7::warehouse.favorite_type_enum,
+           $3, $4, $5
+    WHERE NOT EXISTS (SELECT 1 FROM del)
+    ON CONFLICT DO NOTHING
+    RETURNING id
+)
+SELECT EXISTS(SELECT 1 FROM ins) AS favorited
+`
+
+type ToggleFavoriteParams struct {
+	UserID       uuid.UUID                 `json:"user_id"`
+	WorkspaceID  uuid.UUID                 `json:"workspace_id"`
+	ItemID       pgtype.UUID               `json:"item_id"`
+	LocationID   pgtype.UUID               `json:"location_id"`
+	ContainerID  pgtype.UUID               `json:"container_id"`
+	ID           uuid.UUID                 `json:"id"`
+	FavoriteType WarehouseFavoriteTypeEnum `json:"favorite_type"`
+}
+
+// Removes the favorite if it exists, otherwise creates it, in one round trip.
+// Returns true when the target ended up favorited.
+func (q *Queries) ToggleFavorite(ctx context.Context, arg ToggleFavoriteParams) (bool, error) {
+	row := q.db.QueryRow(ctx, toggleFavorite,
+		arg.UserID,
+		arg.WorkspaceID,
+		arg.ItemID,
+		arg.LocationID,
+		arg.ContainerID,
+		arg.ID,
+		arg.FavoriteType,
+	)
+	var favorited bool
+	err := row.Scan(&favorited)
+	return favorited, err
+}
@@ -519,6 +519,46 @@ func (q *Queries) ItemSKUExists(ctx context.Context, arg ItemSKUExistsParams) (b
 	return exists, err
 }
 
+const listItemRefs = `-- name: ListItemRefs :many
+SELECT id, sku, name, short_code FROM warehouse.items
+WHERE workspace_id = $1 AND is_archived = false
+ORDER BY name
+`
+
+type ListItemRefsRow struct {
+	ID        uuid.UUID `json:"id"`
+	Sku       string    `json:"sku"`
+	Name      string    `json:"name"`
+	ShortCode string    `json:"short_code"`
+}
+
+// ListItemRefs returns just the columns the import worker resolves item
+// references by, for all active items of a workspace.
+func (q *Queries) ListItemRefs(ctx context.Context, workspaceID uuid.UUID) ([]ListItemRefsRow, error) {
+	rows, err := q.db.Query(ctx, listItemRefs, workspaceID)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+	items := []ListItemRefsRow{}
+	for rows.Next() {
+		var i ListItemRefsRow
+		if err := rows.Scan(
+			&i.ID,
+			&i.Sku,
+			&i.Name,
+			&i.ShortCode,
+		); err != nil {
+			return nil, err
+		}
+		items = append(items, i)
+	}
+	if err := rows.Err(); err != nil {
+		return nil, err
+	}
+	return items, nil
+}
+
 const listItems = `-- name: ListItems :many
 SELECT id, workspace_id, sku, name, description, category_id, brand, model, image_url, serial_number, manufacturer, barcode, is_insured, is_archived, needs_review, lifetime_warranty, warranty_details, purchased_from, min_stock_level, short_code, obsidian_vault_path, obsidian_note_path, search_vector, created_at, updated_at FROM warehouse.items
 WHERE workspace_id = $1 AND is_archived = false
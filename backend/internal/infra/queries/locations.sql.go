@@ -138,6 +138,40 @@ func (q *Queries) GetLocationByShortCode(ctx context.Context, arg GetLocationByS
 	return i, err
 }
 
+const listLocationRefs = `-- name: ListLocationRefs :many
+SELECT id, name, short_code FROM warehouse.locations
+WHERE workspace_id = $1 AND is_archived = false
+ORDER BY name
+`
+
+type ListLocationRefsRow struct {
+	ID        uuid.UUID `json:"id"`
+	Name      string    `json:"name"`
+	ShortCode string    `json:"short_code"`
+}
+
+// ListLocationRefs returns just the columns the import worker resolves location
+// references by, for all active locations of a workspace.
+func (q *Queries) ListLocationRefs(ctx context.Context, workspaceID uuid.UUID) ([]ListLocationRefsRow, error) {
+	rows, err := q.db.Query(ctx, listLocationRefs, workspaceID)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+	items := []ListLocationRefsRow{}
+	for rows.Next() {
+		var i ListLocationRefsRow
+		if err := rows.Scan(&i.ID, &i.Name, &i.ShortCode); err != nil {
+			return nil, err
+		}
+		items = append(items, i)
+	}
+	if err := rows.Err(); err != nil {
+		return nil, err
+	}
+	return items, nil
+}
+
 const listLocations = `-- name: ListLocations :many
 SELECT id, workspace_id, name, parent_location, description, short_code, is_archived, search_vector, created_at, updated_at FROM warehouse.locations
 WHERE workspace_id = $1 AND is_archived = false
@@ -1,13 +1,60 @@
 package csvparser
 
 import (
+	"bufio"
+	"bytes"
 	"encoding/csv"
 	"fmt"
 	"io"
 	"os"
 	"strings"
+	"unicode/utf8"
+
+	"golang.org/x/text/encoding/charmap"
+	"golang.org/x/text/transform"
 )
 
+// utf8BOM is the byte order mark spreadsheet tools (notably Excel) prepend
+// to UTF-8 CSV exports.
+var utf8BOM = []byte{0xEF, 0xBB, 0xBF}
+
+// sniffSize is how much of the input is checked for valid UTF-8.
+const sniffSize = 64 << 10
+
+// NewReader returns a csv.Reader over r that skips a leading UTF-8 BOM and
+// decodes Windows-1252 input (the usual non-UTF-8 Windows export) to UTF-8.
+// The encoding is decided from the first sniffSize bytes with a peek, so the
+// input is still read only once.
+func NewReader(r io.Reader) *csv.Reader {
+	br := bufio.NewReaderSize(r, sniffSize)
+	if prefix, err := br.Peek(len(utf8BOM)); err == nil && bytes.Equal(prefix, utf8BOM) {
+		_, _ = br.Discard(len(utf8BOM))
+		return csv.NewReader(br)
+	}
+	sniff, _ := br.Peek(sniffSize) // short input returns what is there
+	if len(sniff) == sniffSize {
+		sniff = trimPartialRune(sniff)
+	}
+	if !utf8.Valid(sniff) {
+		return csv.NewReader(transform.NewReader(br, charmap.Windows1252.NewDecoder()))
+	}
+	return csv.NewReader(br)
+}
+
+// trimPartialRune drops a multi-byte sequence cut off at the end of b by the
+// sniff window, so it isn't mistaken for invalid UTF-8.
+func trimPartialRune(b []byte) []byte {
+	for i := len(b) - 1; i >= 0 && i >= len(b)-utf8.UTFMax; i-- {
+		if utf8.RuneStart(b[i]) {
+			if !utf8.FullRune(b[i:]) {
+				return b[:i]
+			}
+			break
+		}
+	}
+	return b
+}
+
 type CSVParser struct {
 	filePath string
 	headers  []string
@@ -18,51 +65,14 @@ func NewCSVParser(filePath string) *CSVParser {
 }
 
 func (p *CSVParser) Parse() ([]map[string]string, error) {
-	file, err := os.Open(p.filePath)
-	if err != nil {
-		return nil, fmt.Errorf("failed to open file: %w", err)
-	}
-	defer file.Close()
-
-	reader := csv.NewReader(file)
-	reader.TrimLeadingSpace = true
-
-	// Read header row
-	headers, err := reader.Read()
-	if err != nil {
-		return nil, fmt.Errorf("failed to read headers: %w", err)
-	}
-
-	// Normalize headers (lowercase, trim spaces)
-	for i, h := range headers {
-		headers[i] = strings.TrimSpace(strings.ToLower(h))
-	}
-	p.headers = headers
-
-	// Read all rows
 	var rows []map[string]string
-	rowNum := 1
-	for {
-		record, err := reader.Read()
-		if err == io.EOF {
-			break
-		}
-		if err != nil {
-			return nil, fmt.Errorf("error reading row %d: %w", rowNum, err)
-		}
-
-		// Convert row to map
-		rowMap := make(map[string]string)
-		for i, value := range record {
-			if i < len(headers) {
-				rowMap[headers[i]] = strings.TrimSpace(value)
-			}
-		}
-
-		rows = append(rows, rowMap)
-		rowNum++
+	err := p.ParseStream(func(_ int, row map[string]string) error {
+		rows = append(rows, row)
+		return nil
+	})
+	if err != nil {
+		return nil, err
 	}
-
 	return rows, nil
 }
 
@@ -73,19 +83,19 @@ func (p *CSVParser) ParseStream(callback func(rowNum int, row map[string]string)
 	}
 	defer file.Close()
 
-	reader := csv.NewReader(file)
+	reader := NewReader(file)
 	reader.TrimLeadingSpace = true
+	// Values are copied out into the row map, so the record slice itself can
+	// be reused between rows.
+	reader.ReuseRecord = true
 
 	// Read header row
 	headers, err := reader.Read()
 	if err != nil {
 		return fmt.Errorf("failed to read headers: %w", err)
 	}
-
-	// Normalize headers
-	for i, h := range headers {
-		headers[i] = strings.TrimSpace(strings.ToLower(h))
-	}
+	// Normalized once here; every row map is keyed from this slice.
+	headers = NormalizeHeaders(headers)
 	p.headers = headers
 
 	// Stream rows
@@ -99,16 +109,7 @@ func (p *CSVParser) ParseStream(callback func(rowNum int, row map[string]string)
 			return fmt.Errorf("error reading row %d: %w", rowNum, err)
 		}
 
-		// Convert row to map
-		rowMap := make(map[string]string)
-		for i, value := range record {
-			if i < len(headers) {
-				rowMap[headers[i]] = strings.TrimSpace(value)
-			}
-		}
-
-		// Call callback
-		if err := callback(rowNum, rowMap); err != nil {
+		if err := callback(rowNum, RecordToMap(headers, record)); err != nil {
 			return err
 		}
 
@@ -118,6 +119,27 @@ func (p *CSVParser) ParseStream(callback func(rowNum int, row map[string]string)
 	return nil
 }
 
+// NormalizeHeaders returns a copy of headers lowercased and trimmed.
+func NormalizeHeaders(headers []string) []string {
+	normalized := make([]string, len(headers))
+	for i, h := range headers {
+		normalized[i] = strings.TrimSpace(strings.ToLower(h))
+	}
+	return normalized
+}
+
+// RecordToMap keys a record's trimmed values by the already-normalized
+// headers. Columns beyond the header row are dropped.
+func RecordToMap(headers, record []string) map[string]string {
+	row := make(map[string]string, len(headers))
+	for i, value := range record {
+		if i < len(headers) {
+			row[headers[i]] = strings.TrimSpace(value)
+		}
+	}
+	return row
+}
+
 func (p *CSVParser) Headers() []string {
 	return p.headers
 }
@@ -129,7 +151,8 @@ func (p *CSVParser) CountRows() (int, error) {
 	}
 	defer file.Close()
 
-	reader := csv.NewReader(file)
+	reader := NewReader(file)
+	reader.ReuseRecord = true
 
 	// Skip header
 	if _, err := reader.Read(); err != nil {
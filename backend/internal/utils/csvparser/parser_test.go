@@ -5,6 +5,7 @@ import (
 	"maps"
 	"os"
 	"path/filepath"
+	"strings"
 	"testing"
 
 	"github.com/stretchr/testify/assert"
@@ -451,11 +452,45 @@ func TestParse_UTF8BOM(t *testing.T) {
 	require.NoError(t, err)
 	require.Len(t, rows, 1)
 
-	// Note: The standard Go CSV reader includes BOM in the first field
-	// This test documents current behavior
-	headers := parser.Headers()
-	// The first header will have BOM prefix unless stripped
-	assert.Contains(t, headers[0], "name")
+	assert.Equal(t, []string{"name", "email", "age"}, parser.Headers())
+	assert.Equal(t, "John", rows[0]["name"])
+}
+
+func TestParseStream_UTF8BOM(t *testing.T) {
+	parser := NewCSVParser(testdataPath("bom.csv"))
+
+	var rows []map[string]string
+	err := parser.ParseStream(func(rowNum int, row map[string]string) error {
+		rows = append(rows, row)
+		return nil
+	})
+
+	require.NoError(t, err)
+	require.Len(t, rows, 1)
+	assert.Equal(t, "John", rows[0]["name"])
+}
+
+func TestNewReader(t *testing.T) {
+	tests := []struct {
+		name  string
+		input string
+		want  []string
+	}{
+		{name: "with BOM", input: "\xEF\xBB\xBFname,qty\n", want: []string{"name", "qty"}},
+		{name: "without BOM", input: "name,qty\n", want: []string{"name", "qty"}},
+		{name: "shorter than BOM", input: "a\n", want: []string{"a"}},
+		{name: "UTF-8", input: "café,qty\n", want: []string{"café", "qty"}},
+		{name: "Windows-1252", input: "caf\xE9,\x80 price\n", want: []string{"café", "€ price"}},
+		{name: "Windows-1252 last byte", input: "caf\xE9", want: []string{"café"}},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			record, err := NewReader(strings.NewReader(tt.input)).Read()
+			require.NoError(t, err)
+			assert.Equal(t, tt.want, record)
+		})
+	}
 }
 
 // =============================================================================
@@ -636,3 +671,28 @@ func TestParse_MultipleCalls(t *testing.T) {
 	// Data should be the same
 	assert.Equal(t, rows1[0]["name"], rows2[0]["name"])
 }
+
+func TestNormalizeHeaders(t *testing.T) {
+	raw := []string{" Name ", "QUANTITY", "Purchase Date"}
+
+	headers := NormalizeHeaders(raw)
+
+	assert.Equal(t, []string{"name", "quantity", "purchase date"}, headers)
+	assert.Equal(t, " Name ", raw[0], "input must not be modified")
+}
+
+func TestRecordToMap(t *testing.T) {
+	headers := []string{"name", "qty"}
+
+	assert.Equal(t, map[string]string{"name": "Drill", "qty": "2"}, RecordToMap(headers, []string{" Drill ", "2", "extra"}))
+	assert.Equal(t, map[string]string{"name": "Drill"}, RecordToMap(headers, []string{"Drill"}))
+}
+
+func TestTrimPartialRune(t *testing.T) {
+	euro := []byte("€") // 3 bytes
+
+	assert.Equal(t, []byte("a"), trimPartialRune(append([]byte("a"), euro[:2]...)))
+	assert.Equal(t, append([]byte("a"), euro...), trimPartialRune(append([]byte("a"), euro...)))
+	assert.Equal(t, []byte("abc"), trimPartialRune([]byte("abc")))
+	assert.Empty(t, trimPartialRune(nil))
+}
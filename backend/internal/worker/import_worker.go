@@ -6,6 +6,7 @@ import (
 	"log"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/google/uuid"
@@ -21,8 +22,8 @@ import (
 	"github.com/antti/home-warehouse/go-backend/internal/domain/warehouse/movement"
 	"github.com/antti/home-warehouse/go-backend/internal/infra/events"
 	"github.com/antti/home-warehouse/go-backend/internal/infra/postgres"
+	"github.com/antti/home-warehouse/go-backend/internal/infra/queries"
 	"github.com/antti/home-warehouse/go-backend/internal/infra/queue"
-	"github.com/antti/home-warehouse/go-backend/internal/shared"
 	"github.com/antti/home-warehouse/go-backend/internal/utils/csvparser"
 )
 
@@ -229,16 +230,14 @@ func (w *ImportWorker) processItemImport(ctx context.Context, job *importjob.Imp
 	itemService := item.NewService(itemRepo, categoryRepo)
 
 	// Process rows
-	processedRows := 0
-	successCount := 0
-	errorCount := 0
+	progress := w.newImportProgress(job, totalRows)
 
 	err = parser.ParseStream(func(rowNum int, row map[string]string) error {
 		// Map CSV fields to item
 		name := row["name"]
 		if name == "" {
 			w.saveRowError(ctx, job.ID(), rowNum, strPtr("name"), msgNameIsRequired, row)
-			errorCount++
+			progress.failed++
 		} else {
 			// Get or generate SKU
 			sku := row["sku"]
@@ -264,39 +263,17 @@ func (w *ImportWorker) processItemImport(ctx context.Context, job *importjob.Imp
 
 			if err != nil {
 				w.saveRowError(ctx, job.ID(), rowNum, nil, err.Error(), row)
-				errorCount++
+				progress.failed++
 			} else {
-				successCount++
+				progress.succeeded++
 			}
 		}
 
-		processedRows++
-
-		// Update progress every 10 rows
-		if processedRows%10 == 0 {
-			job.UpdateProgress(processedRows, successCount, errorCount)
-			w.saveJob(ctx, job)
-			w.publishProgress(job, (processedRows*100)/totalRows)
-		}
-
+		progress.rowDone(ctx)
 		return nil
 	})
 
-	if err != nil {
-		job.Fail(err.Error())
-	} else {
-		job.UpdateProgress(processedRows, successCount, errorCount)
-		job.Complete()
-	}
-
-	// Save final state
-	if err := w.importRepo.SaveJob(ctx, job); err != nil {
-		return err
-	}
-
-	// Publish final progress
-	w.publishProgress(job, 100)
-
+	progress.finish(ctx, err)
 	return nil
 }
 
@@ -320,33 +297,23 @@ func (w *ImportWorker) processLocationImport(ctx context.Context, job *importjob
 	locationService := location.NewService(locationRepo)
 
 	// Build a cache of existing locations for parent lookups
-	existingLocations, err := findAllPages(ctx, func(ctx context.Context, p shared.Pagination) ([]*location.Location, int, error) {
-		return locationRepo.FindByWorkspace(ctx, job.WorkspaceID(), p)
-	})
+	locationCache, err := loadLocationRefs(ctx, w.refQueries(), job.WorkspaceID())
 	if err != nil {
 		return w.failJob(ctx, job, fmt.Sprintf(msgFailedToLoadExistingLocation, err))
 	}
-	locationCache := make(map[string]*location.Location)
-	for _, loc := range existingLocations {
-		locationCache[strings.ToLower(loc.Name())] = loc
-		locationCache[strings.ToLower(loc.ShortCode())] = loc
-	}
 
-	processedRows := 0
-	successCount := 0
-	errorCount := 0
+	progress := w.newImportProgress(job, totalRows)
 
 	err = parser.ParseStream(func(rowNum int, row map[string]string) error {
 		name := row["name"]
 		if name == "" {
 			w.saveRowError(ctx, job.ID(), rowNum, strPtr("name"), msgNameIsRequired, row)
-			errorCount++
+			progress.failed++
 		} else {
 			var parentLocation *uuid.UUID
 			if parentRef := row["parent_location"]; parentRef != "" {
-				if parent, ok := locationCache[strings.ToLower(parentRef)]; ok {
-					id := parent.ID()
-					parentLocation = &id
+				if parentID, ok := locationCache[strings.ToLower(parentRef)]; ok {
+					parentLocation = &parentID
 				}
 			}
 
@@ -360,33 +327,20 @@ func (w *ImportWorker) processLocationImport(ctx context.Context, job *importjob
 
 			if err != nil {
 				w.saveRowError(ctx, job.ID(), rowNum, nil, err.Error(), row)
-				errorCount++
+				progress.failed++
 			} else {
 				// Add to cache for potential parent references
-				locationCache[strings.ToLower(newLoc.Name())] = newLoc
-				locationCache[strings.ToLower(newLoc.ShortCode())] = newLoc
-				successCount++
+				locationCache[strings.ToLower(newLoc.Name())] = newLoc.ID()
+				locationCache[strings.ToLower(newLoc.ShortCode())] = newLoc.ID()
+				progress.succeeded++
 			}
 		}
 
-		processedRows++
-		if processedRows%10 == 0 {
-			job.UpdateProgress(processedRows, successCount, errorCount)
-			w.saveJob(ctx, job)
-			w.publishProgress(job, (processedRows*100)/totalRows)
-		}
+		progress.rowDone(ctx)
 		return nil
 	})
 
-	if err != nil {
-		job.Fail(err.Error())
-	} else {
-		job.UpdateProgress(processedRows, successCount, errorCount)
-		job.Complete()
-	}
-
-	w.saveJob(ctx, job)
-	w.publishProgress(job, 100)
+	progress.finish(ctx, err)
 	return nil
 }
 
@@ -411,21 +365,12 @@ func (w *ImportWorker) processContainerImport(ctx context.Context, job *importjo
 	containerService := container.NewService(containerRepo, locationRepo)
 
 	// Build location cache for lookups
-	existingLocations, err := findAllPages(ctx, func(ctx context.Context, p shared.Pagination) ([]*location.Location, int, error) {
-		return locationRepo.FindByWorkspace(ctx, job.WorkspaceID(), p)
-	})
+	locationCache, err := loadLocationRefs(ctx, w.refQueries(), job.WorkspaceID())
 	if err != nil {
 		return w.failJob(ctx, job, fmt.Sprintf(msgFailedToLoadExistingLocation, err))
 	}
-	locationCache := make(map[string]*location.Location)
-	for _, loc := range existingLocations {
-		locationCache[strings.ToLower(loc.Name())] = loc
-		locationCache[strings.ToLower(loc.ShortCode())] = loc
-	}
 
-	processedRows := 0
-	successCount := 0
-	errorCount := 0
+	progress := w.newImportProgress(job, totalRows)
 
 	err = parser.ParseStream(func(rowNum int, row map[string]string) error {
 		name := row["name"]
@@ -433,19 +378,19 @@ func (w *ImportWorker) processContainerImport(ctx context.Context, job *importjo
 
 		if name == "" {
 			w.saveRowError(ctx, job.ID(), rowNum, strPtr("name"), msgNameIsRequired, row)
-			errorCount++
+			progress.failed++
 		} else if locationRef == "" {
 			w.saveRowError(ctx, job.ID(), rowNum, strPtr("location"), "location is required", row)
-			errorCount++
+			progress.failed++
 		} else {
-			loc, ok := locationCache[strings.ToLower(locationRef)]
+			locationID, ok := locationCache[strings.ToLower(locationRef)]
 			if !ok {
 				w.saveRowError(ctx, job.ID(), rowNum, strPtr("location"), fmt.Sprintf("location '%s' not found", locationRef), row)
-				errorCount++
+				progress.failed++
 			} else {
 				_, err := containerService.Create(ctx, container.CreateInput{
 					WorkspaceID: job.WorkspaceID(),
-					LocationID:  loc.ID(),
+					LocationID:  locationID,
 					Name:        name,
 					Description: strPtrFromMap(row, "description"),
 					Capacity:    strPtrFromMap(row, "capacity"),
@@ -454,31 +399,18 @@ func (w *ImportWorker) processContainerImport(ctx context.Context, job *importjo
 
 				if err != nil {
 					w.saveRowError(ctx, job.ID(), rowNum, nil, err.Error(), row)
-					errorCount++
+					progress.failed++
 				} else {
-					successCount++
+					progress.succeeded++
 				}
 			}
 		}
 
-		processedRows++
-		if processedRows%10 == 0 {
-			job.UpdateProgress(processedRows, successCount, errorCount)
-			w.saveJob(ctx, job)
-			w.publishProgress(job, (processedRows*100)/totalRows)
-		}
+		progress.rowDone(ctx)
 		return nil
 	})
 
-	if err != nil {
-		job.Fail(err.Error())
-	} else {
-		job.UpdateProgress(processedRows, successCount, errorCount)
-		job.Complete()
-	}
-
-	w.saveJob(ctx, job)
-	w.publishProgress(job, 100)
+	progress.finish(ctx, err)
 	return nil
 }
 
@@ -502,30 +434,23 @@ func (w *ImportWorker) processCategoryImport(ctx context.Context, job *importjob
 	categoryService := category.NewService(categoryRepo)
 
 	// Build category cache for parent lookups
-	existingCategories, err := categoryRepo.FindByWorkspace(ctx, job.WorkspaceID())
+	categoryCache, err := loadCategoryRefs(ctx, w.refQueries(), job.WorkspaceID())
 	if err != nil {
 		return w.failJob(ctx, job, fmt.Sprintf("failed to load existing categories: %v", err))
 	}
-	categoryCache := make(map[string]*category.Category)
-	for _, cat := range existingCategories {
-		categoryCache[strings.ToLower(cat.Name())] = cat
-	}
 
-	processedRows := 0
-	successCount := 0
-	errorCount := 0
+	progress := w.newImportProgress(job, totalRows)
 
 	err = parser.ParseStream(func(rowNum int, row map[string]string) error {
 		name := row["name"]
 		if name == "" {
 			w.saveRowError(ctx, job.ID(), rowNum, strPtr("name"), msgNameIsRequired, row)
-			errorCount++
+			progress.failed++
 		} else {
 			var parentCategoryID *uuid.UUID
 			if parentRef := row["parent_category"]; parentRef != "" {
-				if parent, ok := categoryCache[strings.ToLower(parentRef)]; ok {
-					id := parent.ID()
-					parentCategoryID = &id
+				if parentID, ok := categoryCache[strings.ToLower(parentRef)]; ok {
+					parentCategoryID = &parentID
 				}
 			}
 
@@ -538,32 +463,19 @@ func (w *ImportWorker) processCategoryImport(ctx context.Context, job *importjob
 
 			if err != nil {
 				w.saveRowError(ctx, job.ID(), rowNum, nil, err.Error(), row)
-				errorCount++
+				progress.failed++
 			} else {
 				// Add to cache for potential parent references
-				categoryCache[strings.ToLower(newCat.Name())] = newCat
-				successCount++
+				categoryCache[strings.ToLower(newCat.Name())] = newCat.ID()
+				progress.succeeded++
 			}
 		}
 
-		processedRows++
-		if processedRows%10 == 0 {
-			job.UpdateProgress(processedRows, successCount, errorCount)
-			w.saveJob(ctx, job)
-			w.publishProgress(job, (processedRows*100)/totalRows)
-		}
+		progress.rowDone(ctx)
 		return nil
 	})
 
-	if err != nil {
-		job.Fail(err.Error())
-	} else {
-		job.UpdateProgress(processedRows, successCount, errorCount)
-		job.Complete()
-	}
-
-	w.saveJob(ctx, job)
-	w.publishProgress(job, 100)
+	progress.finish(ctx, err)
 	return nil
 }
 
@@ -586,15 +498,13 @@ func (w *ImportWorker) processBorrowerImport(ctx context.Context, job *importjob
 	borrowerRepo := postgres.NewBorrowerRepository(w.dbPool)
 	borrowerService := borrower.NewService(borrowerRepo)
 
-	processedRows := 0
-	successCount := 0
-	errorCount := 0
+	progress := w.newImportProgress(job, totalRows)
 
 	err = parser.ParseStream(func(rowNum int, row map[string]string) error {
 		name := row["name"]
 		if name == "" {
 			w.saveRowError(ctx, job.ID(), rowNum, strPtr("name"), msgNameIsRequired, row)
-			errorCount++
+			progress.failed++
 		} else {
 			_, err := borrowerService.Create(ctx, borrower.CreateInput{
 				WorkspaceID: job.WorkspaceID(),
@@ -606,83 +516,121 @@ func (w *ImportWorker) processBorrowerImport(ctx context.Context, job *importjob
 
 			if err != nil {
 				w.saveRowError(ctx, job.ID(), rowNum, nil, err.Error(), row)
-				errorCount++
+				progress.failed++
 			} else {
-				successCount++
+				progress.succeeded++
 			}
 		}
 
-		processedRows++
-		if processedRows%10 == 0 {
-			job.UpdateProgress(processedRows, successCount, errorCount)
-			w.saveJob(ctx, job)
-			w.publishProgress(job, (processedRows*100)/totalRows)
-		}
+		progress.rowDone(ctx)
 		return nil
 	})
 
-	if err != nil {
-		job.Fail(err.Error())
-	} else {
-		job.UpdateProgress(processedRows, successCount, errorCount)
-		job.Complete()
-	}
-
-	w.saveJob(ctx, job)
-	w.publishProgress(job, 100)
+	progress.finish(ctx, err)
 	return nil
 }
 
-// inventoryImportCaches holds the name/SKU/short-code → entity lookup maps the
+// inventoryImportCaches holds the name/SKU/short-code → ID lookup maps the
 // inventory importer builds once per job so each row resolves item, location,
 // and container references without a per-row query.
 type inventoryImportCaches struct {
-	items      map[string]*item.Item
-	locations  map[string]*location.Location
-	containers map[string]*container.Container
+	items      map[string]uuid.UUID
+	locations  map[string]uuid.UUID
+	containers map[string]uuid.UUID
 }
 
-// buildInventoryImportCaches exhaustively pages the item, location, and
-// container repositories for the workspace and indexes them by lower-cased
-// name / SKU / short code (mirroring the legacy inline cache build verbatim).
-func buildInventoryImportCaches(ctx context.Context, workspaceID uuid.UUID, itemRepo item.Repository, locationRepo location.Repository, containerRepo container.Repository) (*inventoryImportCaches, error) {
-	existingItems, err := findAllPages(ctx, func(ctx context.Context, p shared.Pagination) ([]*item.Item, int, error) {
-		return itemRepo.FindByWorkspace(ctx, workspaceID, p)
-	})
+// importRefQueries are the projection queries the importers build their
+// reference caches from: only IDs and the names, SKUs and short codes a CSV
+// may refer to, never whole rows.
+type importRefQueries interface {
+	ListItemRefs(ctx context.Context, workspaceID uuid.UUID) ([]queries.ListItemRefsRow, error)
+	ListLocationRefs(ctx context.Context, workspaceID uuid.UUID) ([]queries.ListLocationRefsRow, error)
+	ListContainerRefs(ctx context.Context, workspaceID uuid.UUID) ([]queries.ListContainerRefsRow, error)
+	ListCategoryRefs(ctx context.Context, workspaceID uuid.UUID) ([]queries.ListCategoryRefsRow, error)
+}
+
+func (w *ImportWorker) refQueries() importRefQueries {
+	return queries.New(w.dbPool)
+}
+
+// loadLocationRefs indexes a workspace's active locations by lower-cased name
+// and short code.
+func loadLocationRefs(ctx context.Context, q importRefQueries, workspaceID uuid.UUID) (map[string]uuid.UUID, error) {
+	rows, err := q.ListLocationRefs(ctx, workspaceID)
 	if err != nil {
-		return nil, fmt.Errorf("failed to load existing items: %v", err)
-	}
-	itemCache := make(map[string]*item.Item)
-	for _, itm := range existingItems {
-		itemCache[strings.ToLower(itm.Name())] = itm
-		itemCache[strings.ToLower(itm.SKU())] = itm
-		if itm.ShortCode() != "" {
-			itemCache[strings.ToLower(itm.ShortCode())] = itm
-		}
+		return nil, err
+	}
+	cache := make(map[string]uuid.UUID, 2*len(rows))
+	for _, loc := range rows {
+		cache[strings.ToLower(loc.Name)] = loc.ID
+		cache[strings.ToLower(loc.ShortCode)] = loc.ID
 	}
+	return cache, nil
+}
 
-	existingLocations, err := findAllPages(ctx, func(ctx context.Context, p shared.Pagination) ([]*location.Location, int, error) {
-		return locationRepo.FindByWorkspace(ctx, workspaceID, p)
-	})
+// loadCategoryRefs indexes a workspace's active categories by lower-cased
+// name.
+func loadCategoryRefs(ctx context.Context, q importRefQueries, workspaceID uuid.UUID) (map[string]uuid.UUID, error) {
+	rows, err := q.ListCategoryRefs(ctx, workspaceID)
 	if err != nil {
-		return nil, fmt.Errorf(msgFailedToLoadExistingLocation, err)
+		return nil, err
 	}
-	locationCache := make(map[string]*location.Location)
-	for _, loc := range existingLocations {
-		locationCache[strings.ToLower(loc.Name())] = loc
-		locationCache[strings.ToLower(loc.ShortCode())] = loc
+	cache := make(map[string]uuid.UUID, len(rows))
+	for _, cat := range rows {
+		cache[strings.ToLower(cat.Name)] = cat.ID
 	}
+	return cache, nil
+}
 
-	existingContainers, err := findAllPages(ctx, func(ctx context.Context, p shared.Pagination) ([]*container.Container, int, error) {
-		return containerRepo.FindByWorkspace(ctx, workspaceID, p)
-	})
-	if err != nil {
-		return nil, fmt.Errorf("failed to load existing containers: %v", err)
+// buildInventoryImportCaches loads the item, location, and container
+// references of the workspace and indexes them by lower-cased name / SKU /
+// short code. The three queries are independent, so they run concurrently on
+// separate pool connections and the job waits one round trip instead of three.
+func buildInventoryImportCaches(ctx context.Context, q importRefQueries, workspaceID uuid.UUID) (*inventoryImportCaches, error) {
+	var (
+		wg                       sync.WaitGroup
+		itemRows                 []queries.ListItemRefsRow
+		containerRows            []queries.ListContainerRefsRow
+		locationCache            map[string]uuid.UUID
+		itemErr, locErr, contErr error
+	)
+	wg.Add(3)
+	go func() {
+		defer wg.Done()
+		itemRows, itemErr = q.ListItemRefs(ctx, workspaceID)
+	}()
+	go func() {
+		defer wg.Done()
+		locationCache, locErr = loadLocationRefs(ctx, q, workspaceID)
+	}()
+	go func() {
+		defer wg.Done()
+		containerRows, contErr = q.ListContainerRefs(ctx, workspaceID)
+	}()
+	wg.Wait()
+
+	if itemErr != nil {
+		return nil, fmt.Errorf("failed to load existing items: %v", itemErr)
+	}
+	if locErr != nil {
+		return nil, fmt.Errorf(msgFailedToLoadExistingLocation, locErr)
+	}
+	if contErr != nil {
+		return nil, fmt.Errorf("failed to load existing containers: %v", contErr)
+	}
+
+	itemCache := make(map[string]uuid.UUID, 3*len(itemRows))
+	for _, itm := range itemRows {
+		itemCache[strings.ToLower(itm.Name)] = itm.ID
+		itemCache[strings.ToLower(itm.Sku)] = itm.ID
+		if itm.ShortCode != "" {
+			itemCache[strings.ToLower(itm.ShortCode)] = itm.ID
+		}
 	}
-	containerCache := make(map[string]*container.Container)
-	for _, cont := range existingContainers {
-		containerCache[strings.ToLower(cont.Name())] = cont
-		containerCache[strings.ToLower(cont.ShortCode())] = cont
+	containerCache := make(map[string]uuid.UUID, 2*len(containerRows))
+	for _, cont := range containerRows {
+		containerCache[strings.ToLower(cont.Name)] = cont.ID
+		containerCache[strings.ToLower(cont.ShortCode)] = cont.ID
 	}
 
 	return &inventoryImportCaches{
@@ -707,8 +655,7 @@ func parseInventoryQuantity(quantityStr string) int {
 // when the field is blank or unknown.
 func (c *inventoryImportCaches) resolveContainerID(row map[string]string) *uuid.UUID {
 	if containerRef := row["container"]; containerRef != "" {
-		if cont, ok := c.containers[strings.ToLower(containerRef)]; ok {
-			id := cont.ID()
+		if id, ok := c.containers[strings.ToLower(containerRef)]; ok {
 			return &id
 		}
 	}
@@ -761,11 +708,11 @@ func parseInventoryDateAcquired(row map[string]string) *time.Time {
 
 // buildInventoryCreateInput assembles the inventory.CreateInput for a resolved
 // row from the parsed/defaulted field helpers.
-func buildInventoryCreateInput(workspaceID uuid.UUID, itm *item.Item, loc *location.Location, caches *inventoryImportCaches, row map[string]string) inventory.CreateInput {
+func buildInventoryCreateInput(workspaceID, itemID, locationID uuid.UUID, caches *inventoryImportCaches, row map[string]string) inventory.CreateInput {
 	return inventory.CreateInput{
 		WorkspaceID:   workspaceID,
-		ItemID:        itm.ID(),
-		LocationID:    loc.ID(),
+		ItemID:        itemID,
+		LocationID:    locationID,
 		ContainerID:   caches.resolveContainerID(row),
 		Quantity:      parseInventoryQuantity(row["quantity"]),
 		Condition:     parseInventoryCondition(row),
@@ -801,40 +748,25 @@ func (w *ImportWorker) processInventoryImport(ctx context.Context, job *importjo
 	movementService := movement.NewService(movementRepo)
 	inventoryService := inventory.NewService(inventoryRepo, movementService, itemRepo, locationRepo, containerRepo)
 
-	caches, err := buildInventoryImportCaches(ctx, job.WorkspaceID(), itemRepo, locationRepo, containerRepo)
+	caches, err := buildInventoryImportCaches(ctx, w.refQueries(), job.WorkspaceID())
 	if err != nil {
 		return w.failJob(ctx, job, err.Error())
 	}
 
-	processedRows := 0
-	successCount := 0
-	errorCount := 0
+	progress := w.newImportProgress(job, totalRows)
 
 	err = parser.ParseStream(func(rowNum int, row map[string]string) error {
 		if w.importInventoryRow(ctx, job, inventoryService, caches, rowNum, row) {
-			successCount++
+			progress.succeeded++
 		} else {
-			errorCount++
+			progress.failed++
 		}
 
-		processedRows++
-		if processedRows%10 == 0 {
-			job.UpdateProgress(processedRows, successCount, errorCount)
-			w.saveJob(ctx, job)
-			w.publishProgress(job, (processedRows*100)/totalRows)
-		}
+		progress.rowDone(ctx)
 		return nil
 	})
 
-	if err != nil {
-		job.Fail(err.Error())
-	} else {
-		job.UpdateProgress(processedRows, successCount, errorCount)
-		job.Complete()
-	}
-
-	w.saveJob(ctx, job)
-	w.publishProgress(job, 100)
+	progress.finish(ctx, err)
 	return nil
 }
 
@@ -854,18 +786,18 @@ func (w *ImportWorker) importInventoryRow(ctx context.Context, job *importjob.Im
 		return false
 	}
 
-	itm, itemOk := caches.items[strings.ToLower(itemRef)]
+	itemID, itemOk := caches.items[strings.ToLower(itemRef)]
 	if !itemOk {
 		w.saveRowError(ctx, job.ID(), rowNum, strPtr("item"), fmt.Sprintf("item '%s' not found", itemRef), row)
 		return false
 	}
-	loc, locOk := caches.locations[strings.ToLower(locationRef)]
+	locationID, locOk := caches.locations[strings.ToLower(locationRef)]
 	if !locOk {
 		w.saveRowError(ctx, job.ID(), rowNum, strPtr("location"), fmt.Sprintf("location '%s' not found", locationRef), row)
 		return false
 	}
 
-	input := buildInventoryCreateInput(job.WorkspaceID(), itm, loc, caches, row)
+	input := buildInventoryCreateInput(job.WorkspaceID(), itemID, locationID, caches, row)
 	if _, err := inventoryService.Create(ctx, input); err != nil {
 		w.saveRowError(ctx, job.ID(), rowNum, nil, err.Error(), row)
 		return false
@@ -873,6 +805,64 @@ func (w *ImportWorker) importInventoryRow(ctx context.Context, job *importjob.Im
 	return true
 }
 
+const (
+	// progressFlushRows and progressFlushInterval bound how often an import
+	// persists and broadcasts its progress: each flush is a job-row write plus
+	// an SSE event, so flushing every few rows roughly doubled the round
+	// trips of a large import.
+	progressFlushRows     = 100
+	progressFlushInterval = time.Second
+)
+
+// importProgress tallies an import's row outcomes and flushes them to the
+// job row and subscribers every progressFlushRows rows or
+// progressFlushInterval, whichever comes first.
+type importProgress struct {
+	w         *ImportWorker
+	job       *importjob.ImportJob
+	totalRows int
+	processed int
+	succeeded int
+	failed    int
+	lastFlush time.Time
+	now       func() time.Time
+}
+
+func (w *ImportWorker) newImportProgress(job *importjob.ImportJob, totalRows int) *importProgress {
+	return &importProgress{w: w, job: job, totalRows: totalRows, lastFlush: time.Now(), now: time.Now}
+}
+
+// rowDone counts a processed row (after succeeded or failed was bumped) and
+// flushes progress when due.
+func (p *importProgress) rowDone(ctx context.Context) {
+	p.processed++
+	if p.processed%progressFlushRows != 0 && p.now().Sub(p.lastFlush) < progressFlushInterval {
+		return
+	}
+	p.lastFlush = p.now()
+	p.job.UpdateProgress(p.processed, p.succeeded, p.failed)
+	p.w.saveJob(ctx, p.job)
+	p.w.publishProgress(p.job, (p.processed*100)/p.totalRows)
+}
+
+// finish records the terminal job state (failed when parseErr is set),
+// persists and publishes it. A failed save is only logged: by now the rows
+// are written, and surfacing the error would make the queue retry the job
+// and import every row a second time.
+func (p *importProgress) finish(ctx context.Context, parseErr error) {
+	if parseErr != nil {
+		p.job.Fail(parseErr.Error())
+	} else {
+		p.job.UpdateProgress(p.processed, p.succeeded, p.failed)
+		p.job.Complete()
+	}
+
+	if err := p.w.importRepo.SaveJob(ctx, p.job); err != nil {
+		log.Printf("Error saving import job %s: %v", p.job.ID(), err)
+	}
+	p.w.publishProgress(p.job, 100)
+}
+
 func (w *ImportWorker) publishProgress(job *importjob.ImportJob, progressPercent int) {
 	if w.broadcaster != nil {
 		w.broadcaster.Publish(job.WorkspaceID(), events.Event{
@@ -926,26 +916,6 @@ func (w *ImportWorker) failJob(ctx context.Context, job *importjob.ImportJob, ms
 	return fmt.Errorf("%s", msg)
 }
 
-// findAllPages exhaustively pages through a FindByWorkspace-style lookup using
-// the shared pagination clamp (MaxPageSize per round trip). The import worker
-// uses it to build lookup caches: a single capped page would silently truncate
-// caches in workspaces with more than shared.MaxPageSize rows (the bug behind
-// spurious "location not found" errors on large imports).
-func findAllPages[T any](ctx context.Context, find func(context.Context, shared.Pagination) ([]T, int, error)) ([]T, error) {
-	var all []T
-	for page := 1; ; page++ {
-		p := shared.Pagination{Page: page, PageSize: shared.MaxPageSize}
-		batch, _, err := find(ctx, p)
-		if err != nil {
-			return nil, err
-		}
-		all = append(all, batch...)
-		if len(batch) < p.Limit() {
-			return all, nil
-		}
-	}
-}
-
 // Helper functions
 func strPtr(s string) *string {
 	return &s
@@ -1,15 +1,15 @@
 package worker
 
 import (
+	"context"
+	"errors"
 	"testing"
 	"time"
 
 	"github.com/google/uuid"
 
-	"github.com/antti/home-warehouse/go-backend/internal/domain/warehouse/container"
 	"github.com/antti/home-warehouse/go-backend/internal/domain/warehouse/inventory"
-	"github.com/antti/home-warehouse/go-backend/internal/domain/warehouse/item"
-	"github.com/antti/home-warehouse/go-backend/internal/domain/warehouse/location"
+	"github.com/antti/home-warehouse/go-backend/internal/infra/queries"
 )
 
 func TestParseInventoryQuantity(t *testing.T) {
@@ -101,14 +101,10 @@ func TestParseInventoryDateAcquired(t *testing.T) {
 }
 
 func TestInventoryImportCaches_ResolveContainerID(t *testing.T) {
-	loc := mustLocation(t)
-	cont, err := container.NewContainer(loc.WorkspaceID(), loc.ID(), "Bin A", nil, nil, "BIN-A")
-	if err != nil {
-		t.Fatalf("NewContainer: %v", err)
-	}
+	containerID := uuid.New()
 	caches := &inventoryImportCaches{
-		containers: map[string]*container.Container{
-			"bin a": cont,
+		containers: map[string]uuid.UUID{
+			"bin a": containerID,
 		},
 	}
 
@@ -119,24 +115,137 @@ func TestInventoryImportCaches_ResolveContainerID(t *testing.T) {
 		t.Errorf("unknown container ref = %v, want nil", got)
 	}
 	got := caches.resolveContainerID(map[string]string{"container": "Bin A"})
-	if got == nil || *got != cont.ID() {
-		t.Errorf("resolveContainerID case-insensitive match = %v, want %v", got, cont.ID())
+	if got == nil || *got != containerID {
+		t.Errorf("resolveContainerID case-insensitive match = %v, want %v", got, containerID)
 	}
 }
 
-func TestBuildInventoryCreateInput(t *testing.T) {
-	workspaceID := uuid.New()
-	itm, err := item.NewItem(workspaceID, "Drill", "SKU-1", 0)
-	if err != nil {
-		t.Fatalf("NewItem: %v", err)
+// fakeRefQueries serves fixed projection rows for the cache builders.
+type fakeRefQueries struct {
+	items      []queries.ListItemRefsRow
+	locations  []queries.ListLocationRefsRow
+	containers []queries.ListContainerRefsRow
+	categories []queries.ListCategoryRefsRow
+	err        error
+}
+
+func (f *fakeRefQueries) ListItemRefs(context.Context, uuid.UUID) ([]queries.ListItemRefsRow, error) {
+	return f.items, f.err
+}
+
+func (f *fakeRefQueries) ListLocationRefs(context.Context, uuid.UUID) ([]queries.ListLocationRefsRow, error) {
+	return f.locations, f.err
+}
+
+func (f *fakeRefQueries) ListContainerRefs(context.Context, uuid.UUID) ([]queries.ListContainerRefsRow, error) {
+	return f.containers, f.err
+}
+
+func (f *fakeRefQueries) ListCategoryRefs(context.Context, uuid.UUID) ([]queries.ListCategoryRefsRow, error) {
+	return f.categories, f.err
+}
+
+func TestBuildInventoryImportCaches(t *testing.T) {
+	itemID, noCodeItemID := uuid.New(), uuid.New()
+	locationID, containerID := uuid.New(), uuid.New()
+	refs := &fakeRefQueries{
+		items: []queries.ListItemRefsRow{
+			{ID: itemID, Sku: "SKU-1", Name: "Drill", ShortCode: "DRL"},
+			{ID: noCodeItemID, Sku: "SKU-2", Name: "Saw"},
+		},
+		locations:  []queries.ListLocationRefsRow{{ID: locationID, Name: "Garage", ShortCode: "GAR"}},
+		containers: []queries.ListContainerRefsRow{{ID: containerID, Name: "Bin A", ShortCode: "BIN-A"}},
 	}
-	loc := mustLocation(t)
-	cont, err := container.NewContainer(loc.WorkspaceID(), loc.ID(), "Bin A", nil, nil, "BIN-A")
+
+	caches, err := buildInventoryImportCaches(context.Background(), refs, uuid.New())
 	if err != nil {
-		t.Fatalf("NewContainer: %v", err)
+		t.Fatalf("buildInventoryImportCaches returned error: %v", err)
+	}
+
+	for _, key := range []string{"drill", "sku-1", "drl"} {
+		if got := caches.items[key]; got != itemID {
+			t.Errorf("items[%q] = %v, want %v", key, got, itemID)
+		}
+	}
+	if _, ok := caches.items[""]; ok {
+		t.Error("item without a short code was indexed under the empty key")
+	}
+	if got := caches.items["saw"]; got != noCodeItemID {
+		t.Errorf("items[\"saw\"] = %v, want %v", got, noCodeItemID)
 	}
+	if caches.locations["garage"] != locationID || caches.locations["gar"] != locationID {
+		t.Errorf("locations = %v, want garage/gar → %v", caches.locations, locationID)
+	}
+	if caches.containers["bin a"] != containerID || caches.containers["bin-a"] != containerID {
+		t.Errorf("containers = %v, want bin a/bin-a → %v", caches.containers, containerID)
+	}
+}
+
+func TestBuildInventoryImportCaches_PropagatesError(t *testing.T) {
+	boom := errors.New("db down")
+	_, err := buildInventoryImportCaches(context.Background(), &fakeRefQueries{err: boom}, uuid.New())
+	if err == nil {
+		t.Fatal("buildInventoryImportCaches error = nil, want error")
+	}
+}
+
+// barrierRefQueries holds every projection query until all three inventory
+// lookups have started, so it only returns if they run concurrently.
+type barrierRefQueries struct {
+	fakeRefQueries
+	started chan struct{}
+	release chan struct{}
+}
+
+func (b *barrierRefQueries) wait() {
+	b.started <- struct{}{}
+	<-b.release
+}
+
+func (b *barrierRefQueries) ListItemRefs(ctx context.Context, id uuid.UUID) ([]queries.ListItemRefsRow, error) {
+	b.wait()
+	return b.fakeRefQueries.ListItemRefs(ctx, id)
+}
+
+func (b *barrierRefQueries) ListLocationRefs(ctx context.Context, id uuid.UUID) ([]queries.ListLocationRefsRow, error) {
+	b.wait()
+	return b.fakeRefQueries.ListLocationRefs(ctx, id)
+}
+
+func (b *barrierRefQueries) ListContainerRefs(ctx context.Context, id uuid.UUID) ([]queries.ListContainerRefsRow, error) {
+	b.wait()
+	return b.fakeRefQueries.ListContainerRefs(ctx, id)
+}
+
+func TestBuildInventoryImportCaches_QueriesConcurrently(t *testing.T) {
+	refs := &barrierRefQueries{started: make(chan struct{}, 3), release: make(chan struct{})}
+
+	done := make(chan error, 1)
+	go func() {
+		_, err := buildInventoryImportCaches(context.Background(), refs, uuid.New())
+		done <- err
+	}()
+
+	for i := 0; i < 3; i++ {
+		select {
+		case <-refs.started:
+		case <-time.After(2 * time.Second):
+			close(refs.release)
+			t.Fatalf("only %d of 3 lookup queries started concurrently", i)
+		}
+	}
+	close(refs.release)
+
+	if err := <-done; err != nil {
+		t.Fatalf("buildInventoryImportCaches returned error: %v", err)
+	}
+}
+
+func TestBuildInventoryCreateInput(t *testing.T) {
+	workspaceID := uuid.New()
+	itemID, locationID, containerID := uuid.New(), uuid.New(), uuid.New()
 	caches := &inventoryImportCaches{
-		containers: map[string]*container.Container{"bin a": cont},
+		containers: map[string]uuid.UUID{"bin a": containerID},
 	}
 
 	row := map[string]string{
@@ -150,19 +259,19 @@ func TestBuildInventoryCreateInput(t *testing.T) {
 		"notes":          "handle with care",
 	}
 
-	got := buildInventoryCreateInput(workspaceID, itm, loc, caches, row)
+	got := buildInventoryCreateInput(workspaceID, itemID, locationID, caches, row)
 
 	if got.WorkspaceID != workspaceID {
 		t.Errorf("WorkspaceID = %v, want %v", got.WorkspaceID, workspaceID)
 	}
-	if got.ItemID != itm.ID() {
-		t.Errorf("ItemID = %v, want %v", got.ItemID, itm.ID())
+	if got.ItemID != itemID {
+		t.Errorf("ItemID = %v, want %v", got.ItemID, itemID)
 	}
-	if got.LocationID != loc.ID() {
-		t.Errorf("LocationID = %v, want %v", got.LocationID, loc.ID())
+	if got.LocationID != locationID {
+		t.Errorf("LocationID = %v, want %v", got.LocationID, locationID)
 	}
-	if got.ContainerID == nil || *got.ContainerID != cont.ID() {
-		t.Errorf("ContainerID = %v, want %v", got.ContainerID, cont.ID())
+	if got.ContainerID == nil || *got.ContainerID != containerID {
+		t.Errorf("ContainerID = %v, want %v", got.ContainerID, containerID)
 	}
 	if got.Quantity != 5 {
 		t.Errorf("Quantity = %d, want 5", got.Quantity)
@@ -188,15 +297,9 @@ func TestBuildInventoryCreateInput(t *testing.T) {
 }
 
 func TestBuildInventoryCreateInput_Defaults(t *testing.T) {
-	workspaceID := uuid.New()
-	itm, err := item.NewItem(workspaceID, "Drill", "SKU-1", 0)
-	if err != nil {
-		t.Fatalf("NewItem: %v", err)
-	}
-	loc := mustLocation(t)
-	caches := &inventoryImportCaches{containers: map[string]*container.Container{}}
+	caches := &inventoryImportCaches{containers: map[string]uuid.UUID{}}
 
-	got := buildInventoryCreateInput(workspaceID, itm, loc, caches, map[string]string{})
+	got := buildInventoryCreateInput(uuid.New(), uuid.New(), uuid.New(), caches, map[string]string{})
 
 	if got.ContainerID != nil {
 		t.Errorf("ContainerID = %v, want nil", got.ContainerID)
@@ -238,12 +341,3 @@ func TestStringMapToAnyMap(t *testing.T) {
 		t.Errorf("stringMapToAnyMap(%v) = %v", in, got)
 	}
 }
-
-func mustLocation(t *testing.T) *location.Location {
-	t.Helper()
-	loc, err := location.NewLocation(uuid.New(), "Garage", nil, nil, "GAR")
-	if err != nil {
-		t.Fatalf("NewLocation: %v", err)
-	}
-	return loc
-}
@@ -3,101 +3,87 @@ package worker
 import (
 	"context"
 	"errors"
-	"fmt"
 	"testing"
+	"time"
 
-	"github.com/antti/home-warehouse/go-backend/internal/shared"
+	"github.com/google/uuid"
+
+	"github.com/antti/home-warehouse/go-backend/internal/domain/warehouse/importjob"
 )
 
-// TestFindAllPages_LoadsBeyondMaxPageSize is the regression test for the
-// import-cache truncation bug: lookup caches were loaded with a single
-// Pagination{PageSize: 10000} call whose Limit() silently clamped to
-// shared.MaxPageSize (100), so any workspace with >100 locations/items
-// resolved CSV references against a truncated cache.
-func TestFindAllPages_LoadsBeyondMaxPageSize(t *testing.T) {
-	const totalRows = 150 // > shared.MaxPageSize, spans two pages
-
-	rows := make([]string, totalRows)
-	for i := range rows {
-		rows[i] = fmt.Sprintf("location-%03d", i)
-	}
+// countingImportRepo counts SaveJob calls; other Repository methods are not
+// used by importProgress and panic if called.
+type countingImportRepo struct {
+	importjob.Repository
+	saves int
+}
 
-	var requestedPages []shared.Pagination
-	find := func(ctx context.Context, p shared.Pagination) ([]string, int, error) {
-		requestedPages = append(requestedPages, p)
-		if p.Limit() > shared.MaxPageSize {
-			t.Fatalf("requested page size %d exceeds MaxPageSize %d", p.Limit(), shared.MaxPageSize)
-		}
-		start := p.Offset()
-		if start >= len(rows) {
-			return nil, totalRows, nil
-		}
-		end := start + p.Limit()
-		if end > len(rows) {
-			end = len(rows)
-		}
-		return rows[start:end], totalRows, nil
-	}
+func (r *countingImportRepo) SaveJob(context.Context, *importjob.ImportJob) error {
+	r.saves++
+	return nil
+}
 
-	got, err := findAllPages(context.Background(), find)
+func newTestImportJob(t *testing.T) *importjob.ImportJob {
+	t.Helper()
+	job, err := importjob.NewImportJob(uuid.New(), uuid.New(), importjob.EntityTypeItems, "items.csv", "/tmp/items.csv", 1)
 	if err != nil {
-		t.Fatalf("findAllPages returned error: %v", err)
+		t.Fatalf("NewImportJob: %v", err)
 	}
+	return job
+}
 
-	if len(got) != totalRows {
-		t.Fatalf("findAllPages returned %d rows, want %d (cache truncated)", len(got), totalRows)
+func TestImportProgress_FlushesEveryProgressFlushRows(t *testing.T) {
+	repo := &countingImportRepo{}
+	w := &ImportWorker{importRepo: repo}
+	job := newTestImportJob(t)
+	progress := w.newImportProgress(job, 250)
+	progress.now = func() time.Time { return progress.lastFlush } // clock never advances
+
+	for i := 0; i < 250; i++ {
+		progress.succeeded++
+		progress.rowDone(context.Background())
 	}
-	for i, name := range got {
-		if name != rows[i] {
-			t.Fatalf("row %d = %q, want %q (rows skipped or duplicated across pages)", i, name, rows[i])
-		}
+
+	if repo.saves != 2 {
+		t.Fatalf("saves = %d, want 2 (rows 100 and 200)", repo.saves)
 	}
-	if len(requestedPages) != 2 {
-		t.Errorf("expected 2 page requests for %d rows, got %d", totalRows, len(requestedPages))
+	if job.ProcessedRows() != 200 {
+		t.Errorf("ProcessedRows = %d, want 200 at the last flush", job.ProcessedRows())
 	}
-}
 
-// TestFindAllPages_ExactPageBoundary ensures an exact multiple of the page
-// size terminates (with one trailing empty page) and returns every row.
-func TestFindAllPages_ExactPageBoundary(t *testing.T) {
-	const totalRows = shared.MaxPageSize * 2
-
-	find := func(ctx context.Context, p shared.Pagination) ([]int, int, error) {
-		start := p.Offset()
-		if start >= totalRows {
-			return nil, totalRows, nil
-		}
-		batch := make([]int, p.Limit())
-		for i := range batch {
-			batch[i] = start + i
-		}
-		return batch, totalRows, nil
+	progress.finish(context.Background(), nil)
+	if job.Status() != importjob.StatusCompleted || job.SuccessCount() != 250 {
+		t.Errorf("after finish: status %s, successes %d", job.Status(), job.SuccessCount())
 	}
+}
 
-	got, err := findAllPages(context.Background(), find)
-	if err != nil {
-		t.Fatalf("findAllPages returned error: %v", err)
+func TestImportProgress_FlushesAfterInterval(t *testing.T) {
+	repo := &countingImportRepo{}
+	w := &ImportWorker{importRepo: repo}
+	progress := w.newImportProgress(newTestImportJob(t), 10)
+	now := progress.lastFlush
+	progress.now = func() time.Time { return now }
+
+	progress.rowDone(context.Background())
+	if repo.saves != 0 {
+		t.Fatalf("saves = %d before the interval elapsed, want 0", repo.saves)
 	}
-	if len(got) != totalRows {
-		t.Fatalf("findAllPages returned %d rows, want %d", len(got), totalRows)
+
+	now = now.Add(progressFlushInterval)
+	progress.rowDone(context.Background())
+	if repo.saves != 1 {
+		t.Fatalf("saves = %d after the interval elapsed, want 1", repo.saves)
 	}
 }
 
-// TestFindAllPages_PropagatesError ensures a failed cache load surfaces as an
-// error (the worker must abort the import) instead of yielding a partial or
-// empty cache.
-func TestFindAllPages_PropagatesError(t *testing.T) {
-	boom := errors.New("db unavailable")
-	find := func(ctx context.Context, p shared.Pagination) ([]string, int, error) {
-		if p.Page >= 2 {
-			return nil, 0, boom
-		}
-		batch := make([]string, p.Limit())
-		return batch, 0, nil
-	}
+func TestImportProgress_FinishFailsOnParseError(t *testing.T) {
+	w := &ImportWorker{importRepo: &countingImportRepo{}}
+	job := newTestImportJob(t)
+	progress := w.newImportProgress(job, 1)
+
+	progress.finish(context.Background(), errors.New("bad row"))
 
-	_, err := findAllPages(context.Background(), find)
-	if !errors.Is(err, boom) {
-		t.Fatalf("findAllPages error = %v, want %v", err, boom)
+	if job.Status() != importjob.StatusFailed {
+		t.Errorf("status = %s, want %s", job.Status(), importjob.StatusFailed)
 	}
 }
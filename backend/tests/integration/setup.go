@@ -49,7 +49,7 @@ func NewTestServer(t *testing.T) *TestServer {
 		RedisURL: "redis://localhost:6379/0",
 	}
 
-	router := api.NewRouter(pool, cfg)
+	router, _ := api.NewRouter(pool, cfg)
 	server := httptest.NewServer(router)
 
 	t.Cleanup(func() {